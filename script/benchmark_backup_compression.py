@@ -0,0 +1,117 @@
+"""Benchmark backup compression codecs on a Home Assistant like /config tree.
+
+Usage: python script/benchmark_backup_compression.py [--config PATH]
+
+Without --config a representative tree is generated in a temporary
+directory: YAML configuration, .storage JSON files, a recorder database and
+log files.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import random
+import tarfile
+from tempfile import TemporaryDirectory
+import time
+
+CODECS: list[tuple[str, str, dict[str, int]]] = [
+    ("gzip", "w:gz", {"compresslevel": 1}),
+    ("gzip", "w:gz", {"compresslevel": 6}),
+    ("gzip", "w:gz", {"compresslevel": 9}),
+    ("zstd", "w:zst", {"level": 1}),
+    ("zstd", "w:zst", {"level": 3}),
+    ("zstd", "w:zst", {"level": 9}),
+    ("zstd", "w:zst", {"level": 19}),
+]
+
+
+def generate_config(path: Path, seed: int = 0) -> None:
+    """Generate a representative /config tree."""
+    rnd = random.Random(seed)
+    words = [f"sensor_{i}" for i in range(500)] + ["light", "switch", "climate"]
+
+    (path / "configuration.yaml").write_text(
+        "\n".join(
+            f"{rnd.choice(words)}:\n  platform: template\n  name: {rnd.choice(words)}"
+            for _ in range(2_000)
+        )
+    )
+    for name in ("automations", "scripts", "scenes"):
+        (path / f"{name}.yaml").write_text(
+            "\n".join(
+                f"- id: '{rnd.getrandbits(64)}'\n  alias: {rnd.choice(words)}\n"
+                f"  trigger:\n    - platform: state\n      entity_id: {rnd.choice(words)}"
+                for _ in range(1_000)
+            )
+        )
+
+    storage = path / ".storage"
+    storage.mkdir()
+    for name in ("core.entity_registry", "core.device_registry", "core.restore_state"):
+        entries = [
+            {
+                "entity_id": f"sensor.{rnd.choice(words)}_{i}",
+                "unique_id": f"{rnd.getrandbits(128):032x}",
+                "state": str(rnd.random()),
+                "attributes": {"unit": "W", "friendly_name": rnd.choice(words)},
+            }
+            for i in range(10_000)
+        ]
+        (storage / name).write_text(json.dumps({"data": entries}, indent=2))
+
+    # Recorder database: mostly repetitive rows with some random payload
+    with (path / "home-assistant_v2.db").open("wb") as database:
+        for _ in range(64):
+            page = bytearray(rnd.choice(words).encode() * 1_000)
+            page[: 1 << 11] = rnd.randbytes(1 << 11)
+            database.write(bytes(page[: 1 << 16]) * 16)
+
+    (path / "home-assistant.log").write_text(
+        "\n".join(
+            f"2026-01-01 00:00:{i % 60:02d} INFO (MainThread) "
+            f"[homeassistant.components.{rnd.choice(words)}] State changed"
+            for i in range(200_000)
+        )
+    )
+
+
+def tree_size(path: Path) -> int:
+    """Return size of all files in tree."""
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config", type=Path, help="Existing /config to archive")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp:
+        temp_path = Path(temp)
+        if not (config := args.config):
+            config = temp_path / "config"
+            config.mkdir()
+            generate_config(config)
+
+        size = tree_size(config)
+        print(f"Tree size: {size / 1_048_576:.1f} MiB\n")
+        print(f"{'codec':<6} {'level':>5} {'ratio':>7} {'seconds':>8} {'MiB/s':>8}")
+
+        for codec, mode, options in CODECS:
+            archive = temp_path / "archive.tar"
+            start = time.perf_counter()
+            with tarfile.open(archive, mode, **options) as tar:
+                tar.add(config, arcname="data")
+            duration = time.perf_counter() - start
+
+            print(
+                f"{codec:<6} {next(iter(options.values())):>5} "
+                f"{archive.stat().st_size / size:>7.3f} {duration:>8.2f} "
+                f"{size / duration / 1_048_576:>8.1f}"
+            )
+            archive.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark connecting to many D-Bus objects of the same type.
+
+Usage: python script/benchmark_dbus_connect.py [--devices N]
+
+Starts a private dbus-daemon with a stand-in service exporting N objects
+with a NetworkManager Device like interface. Then connects to all of them,
+once introspecting each object and once sharing the introspection between
+them. Needs dbus-daemon and the Supervisor requirements.
+"""
+
+import argparse
+import asyncio
+import subprocess
+import time
+
+from dbus_fast import BusType
+from dbus_fast.aio.message_bus import MessageBus
+from dbus_fast.service import PropertyAccess, ServiceInterface, dbus_property, method
+
+from supervisor.utils.dbus import DBus
+
+BUS_NAME = "io.hass.benchmark.Devices"
+INTERFACE = "io.hass.benchmark.Device"
+
+
+class Device(ServiceInterface):
+    """Stand-in of a network device."""
+
+    def __init__(self, index: int):
+        """Initialize device."""
+        super().__init__(INTERFACE)
+        self.index = index
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Interface(self) -> "s":  # noqa: F821, N802, UP037
+        """Return interface name."""
+        return f"veth{self.index:05x}"
+
+    @dbus_property(access=PropertyAccess.READ)
+    def DeviceType(self) -> "u":  # noqa: F821, N802, UP037
+        """Return device type."""
+        return 20
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Managed(self) -> "b":  # noqa: F821, N802, UP037
+        """Return if device is managed."""
+        return False
+
+    @method()
+    def Reapply(self, connection: "a{sa{sv}}", flags: "u") -> None:  # noqa: F722, F821, N802, UP037
+        """Reapply connection."""
+
+
+async def connect_all(
+    bus: MessageBus, paths: list[str], interfaces: frozenset[str] | None
+) -> None:
+    """Connect to all objects and read their properties."""
+    DBus.clear_shared_introspection()
+    devices = await asyncio.gather(
+        *[DBus.connect(bus, BUS_NAME, path, interfaces=interfaces) for path in paths]
+    )
+    await asyncio.gather(*[device.get_properties(INTERFACE) for device in devices])
+    for device in devices:
+        device.disconnect()
+
+
+async def run(address: str, devices: int, rounds: int) -> None:
+    """Export devices and time connecting to them."""
+    service = await MessageBus(bus_type=BusType.SESSION, bus_address=address).connect()
+    await service.request_name(BUS_NAME)
+    paths = [f"/io/hass/benchmark/Devices/{index}" for index in range(devices)]
+    for index, path in enumerate(paths):
+        service.export(path, Device(index))
+
+    bus = await MessageBus(bus_type=BusType.SESSION, bus_address=address).connect()
+    print(f"Connecting to {devices} objects\n")
+    print(f"{'introspection':<14} {'best ms':>8} {'mean ms':>8}")
+
+    for name, interfaces in (
+        ("per object", None),
+        ("shared", frozenset([INTERFACE])),
+    ):
+        durations: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await connect_all(bus, paths, interfaces)
+            durations.append(time.perf_counter() - start)
+
+        print(
+            f"{name:<14} {min(durations) * 1000:>8.1f} "
+            f"{sum(durations) / len(durations) * 1000:>8.1f}"
+        )
+
+    bus.disconnect()
+    service.disconnect()
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with subprocess.Popen(
+        ["dbus-daemon", "--nofork", "--print-address", "--session"],
+        stdout=subprocess.PIPE,
+    ) as daemon:
+        try:
+            address = daemon.stdout.readline().decode().strip()
+            asyncio.run(run(address, args.devices, args.rounds))
+        finally:
+            daemon.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark parsing of the systemd journal export format.
+
+Usage: python script/benchmark_journal_parser.py [--export PATH] [--entries N]
+
+Without --export a stream of verbose host logs is generated, with some binary
+serialized multi-line messages. A captured stream can be used instead, e.g.
+curl --unix-socket /run/systemd-journal-gatewayd.sock
+    -H "Accept: application/vnd.fdo.journal" http://localhost/entries
+The batch reader of Supervisor and the line based reader it replaced parse
+the same input from an asyncio stream. Needs the Supervisor requirements.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+import random
+import time
+from typing import Self
+
+from supervisor.exceptions import MalformedBinaryEntryError
+from supervisor.host.const import LogFormatter
+from supervisor.utils.systemd_journal import (
+    get_journal_formatter,
+    journal_logs_batch_reader,
+)
+
+
+class StreamResponse:
+    """Response of the journal gateway with content from memory."""
+
+    def __init__(self, data: bytes):
+        """Initialize response."""
+        self.content = asyncio.StreamReader(limit=2**20)
+        self.content.feed_data(data)
+        self.content.feed_eof()
+
+    async def __aenter__(self) -> Self:
+        """Enter response context."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Exit response context."""
+
+
+async def journal_logs_reader(
+    journal_logs: StreamResponse, log_formatter: LogFormatter
+) -> AsyncGenerator[tuple[str | None, str]]:
+    """Read logs line by line, as Supervisor did before the batch reader."""
+    formatter_ = get_journal_formatter(log_formatter)
+
+    async with journal_logs as resp:
+        entries: dict[str, str] = {}
+        while not resp.content.at_eof():
+            line = await resp.content.readuntil(b"\n")
+            if line == b"\n" or not line:
+                if entries:
+                    yield entries.get("__CURSOR"), formatter_(entries)
+                entries = {}
+                continue
+
+            name, sep, data = line.partition(b"=")
+            if not sep:
+                name = name[:-1]
+                length_raw = await resp.content.readexactly(8)
+                length = int.from_bytes(length_raw, byteorder="little")
+                data = await resp.content.readexactly(length + 1)
+                if not data.endswith(b"\n"):
+                    raise MalformedBinaryEntryError(
+                        f"Failed parsing binary entry {data.decode('utf-8', errors='replace')}"
+                    )
+
+            field_name = name.decode("utf-8")
+            if field_name not in formatter_.required_fields:
+                continue
+
+            entries[field_name] = data[:-1].decode("utf-8", errors="replace")
+
+
+def generate_export(entries: int, seed: int = 0) -> bytes:
+    """Generate journal export stream of verbose host logs."""
+    rnd = random.Random(seed)
+    identifiers = ["systemd", "kernel", "NetworkManager", "hassio_supervisor"]
+    lines: list[bytes] = []
+    for index in range(entries):
+        identifier = rnd.choice(identifiers)
+        lines.append(
+            f"__CURSOR=s=83fee99ca0c3466db5fc120d52ca7dd8;i={index:x};"
+            f"b=f5a5c442fa6548cf97474d2d57c920b3;m={index:x};t={index:x}\n"
+            f"__REALTIME_TIMESTAMP={1709520776193455 + index * 1000}\n"
+            f"__MONOTONIC_TIMESTAMP={212903970336 + index * 1000}\n"
+            "_BOOT_ID=f5a5c442fa6548cf97474d2d57c920b3\n"
+            "PRIORITY=6\n"
+            "_HOSTNAME=homeassistant\n"
+            f"SYSLOG_IDENTIFIER={identifier}\n"
+            f"_PID={rnd.randint(1, 5000)}\n"
+            "_TRANSPORT=journal\n"
+            "_SYSTEMD_UNIT=example.service\n".encode()
+        )
+        if index % 10:
+            lines.append(f"MESSAGE=Processed event {rnd.getrandbits(64):x}\n".encode())
+        else:
+            message = f"Traceback of event {index}\n  File example.py\n".encode()
+            lines.append(
+                b"MESSAGE\n" + len(message).to_bytes(8, "little") + message + b"\n"
+            )
+        lines.append(b"\n")
+    return b"".join(lines)
+
+
+async def read_lines(data: bytes) -> int:
+    """Parse stream with the line based reader."""
+    return len(
+        [
+            entry
+            async for entry in journal_logs_reader(
+                StreamResponse(data), LogFormatter.VERBOSE
+            )
+        ]
+    )
+
+
+async def read_batches(data: bytes) -> int:
+    """Parse stream with the batch reader."""
+    count = 0
+    async for entries in journal_logs_batch_reader(
+        StreamResponse(data), LogFormatter.VERBOSE
+    ):
+        count += len(entries)
+    return count
+
+
+async def run(data: bytes, rounds: int) -> None:
+    """Run readers on data and print timings."""
+    print(f"Export size: {len(data) / 1_048_576:.1f} MiB\n")
+    print(f"{'reader':<8} {'entries':>8} {'best ms':>8} {'entries/s':>10}")
+
+    for name, reader in (("lines", read_lines), ("batches", read_batches)):
+        durations: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            count = await reader(data)
+            durations.append(time.perf_counter() - start)
+
+        print(
+            f"{name:<8} {count:>8} {min(durations) * 1000:>8.1f} "
+            f"{count / min(durations):>10.0f}"
+        )
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--export", type=Path, help="Captured journal export stream")
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    data = args.export.read_bytes() if args.export else generate_export(args.entries)
+    asyncio.run(run(data, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
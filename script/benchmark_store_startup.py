@@ -0,0 +1,94 @@
+"""Benchmark loading the app store catalogue on Supervisor startup.
+
+Usage: python script/benchmark_store_startup.py [--repositories N] [--apps N]
+
+A store of generated repositories is read the way StoreData.update does on a
+cold start, parsing and validating every app config, and compared with loading
+the same catalogue from the store cache. Needs the Supervisor requirements.
+"""
+
+import argparse
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+from unittest.mock import patch
+
+from supervisor.apps.validate import SCHEMA_APP_CONFIG_QUIET
+from supervisor.store import data
+from supervisor.utils.common import read_json_or_yaml_file
+from supervisor.utils.yaml import write_yaml_file
+
+
+def generate_store(path: Path, repositories: int, apps: int) -> list[Path]:
+    """Generate repositories with app configs, return the config files."""
+    configs: list[Path] = []
+    for repository in range(repositories):
+        for app in range(apps):
+            app_path = path / f"repository_{repository}" / f"app_{app}"
+            app_path.mkdir(parents=True)
+            config = app_path / "config.yaml"
+            write_yaml_file(
+                config,
+                {
+                    "name": f"App {app}",
+                    "version": "1.0.0",
+                    "slug": f"app_{app}",
+                    "description": "Generated app for benchmark",
+                    "arch": ["aarch64", "amd64"],
+                    "startup": "application",
+                    "boot": "auto",
+                    "ports": {"8080/tcp": 8080},
+                    "map": ["share:rw", "ssl"],
+                    "options": {"name": "test", "count": 1},
+                    "schema": {"name": "str", "count": "int(1,10)"},
+                },
+            )
+            configs.append(config)
+    return configs
+
+
+def read_store(configs: list[Path]) -> dict[str, dict]:
+    """Read and validate all app configs."""
+    return {
+        str(config): SCHEMA_APP_CONFIG_QUIET(read_json_or_yaml_file(config))
+        for config in configs
+    }
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repositories", type=int, default=10)
+    parser.add_argument("--apps", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp:
+        temp_path = Path(temp)
+        configs = generate_store(temp_path / "apps", args.repositories, args.apps)
+        cache_file = temp_path / "store_cache.json"
+        print(f"Store with {len(configs)} apps\n")
+        print(f"{'method':<10} {'best ms':>8} {'mean ms':>8}")
+
+        with patch.object(data, "FILE_HASSIO_STORE_CACHE", cache_file):
+            apps = read_store(configs)
+            data._write_cache({}, apps)  # noqa: SLF001
+
+            for method, function in (
+                ("validate", lambda: read_store(configs)),
+                ("cache", data._read_cache),  # noqa: SLF001
+            ):
+                durations: list[float] = []
+                for _ in range(args.rounds):
+                    start = time.perf_counter()
+                    function()
+                    durations.append(time.perf_counter() - start)
+
+                print(
+                    f"{method:<10} {min(durations) * 1000:>8.1f} "
+                    f"{sum(durations) / len(durations) * 1000:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
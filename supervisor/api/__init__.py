@@ -737,6 +737,7 @@ class RestAPI(CoreSysAttributes):
             app.add_routes(
                 [
                     web.get("/apps", api_apps.list_apps),
+                    web.get("/apps/boot_timeline", api_apps.boot_timeline),
                     web.get("/apps/{app}/info", api_apps.info),
                     web.post("/apps/{app}/uninstall", api_apps.uninstall),
                     web.post("/apps/{app}/start", api_apps.start),
@@ -777,6 +778,7 @@ class RestAPI(CoreSysAttributes):
                 web.post("/ingress/session", api_ingress.create_session),
                 web.post("/ingress/validate_session", api_ingress.validate_session),
                 web.get("/ingress/panels", api_ingress.panels),
+                web.get("/ingress/stats", api_ingress.stats),
                 web.route(
                     hdrs.METH_ANY, "/ingress/{token}/{path:.*}", api_ingress.handler
                 ),
@@ -1069,6 +1071,8 @@ class RestAPI(CoreSysAttributes):
                 ),
                 web.post("/docker/options", api_docker.options),
                 web.get("/docker/registries", api_docker.registries),
+                web.get("/docker/stats", api_docker.stats),
+                web.get("/docker/stats/{container}/history", api_docker.stats_history),
                 web.post("/docker/registries", api_docker.create_registry),
                 web.delete("/docker/registries/{hostname}", api_docker.remove_registry),
             ]
@@ -469,6 +469,15 @@ class APIApps(CoreSysAttributes):
             ATTR_BLK_WRITE: stats.blk_write,
         }
 
+    @api_process
+    async def boot_timeline(self, request: web.Request) -> dict[str, Any]:
+        """Return timeline of apps started during boot."""
+        return {
+            ATTR_APPS: [
+                record.as_dict() for record in self.sys_apps.boot_timeline.values()
+            ]
+        }
+
     @api_process
     async def uninstall(self, request: web.Request) -> None:
         """Uninstall app."""
@@ -23,6 +23,7 @@ from ..const import (
     ATTR_APPS,
     ATTR_BACKUPS,
     ATTR_COMPRESSED,
+    ATTR_COMPRESSION,
     ATTR_CONTENT,
     ATTR_DATE,
     ATTR_DAYS_UNTIL_STALE,
@@ -34,6 +35,7 @@ from ..const import (
     ATTR_JOB_ID,
     ATTR_LOCATION,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PASSWORD,
     ATTR_PROTECTED,
     ATTR_REPOSITORIES,
@@ -129,6 +131,7 @@ SCHEMA_BACKUP_FULL = vol.Schema(
         vol.Optional(ATTR_HOMEASSISTANT_EXCLUDE_DATABASE): vol.Boolean(),
         vol.Optional(ATTR_BACKGROUND, default=False): vol.Boolean(),
         vol.Optional(ATTR_EXTRA): dict,
+        vol.Optional(ATTR_PARENT): str,
     }
 )
 
@@ -229,6 +232,8 @@ class APIBackups(CoreSysAttributes):
             ATTR_SIZE: backup.size,
             ATTR_SIZE_BYTES: backup.size_bytes,
             ATTR_COMPRESSED: backup.compressed,
+            ATTR_COMPRESSION: backup.compression,
+            ATTR_PARENT: backup.parent,
             ATTR_PROTECTED: backup.protected,
             ATTR_LOCATION_ATTRIBUTES: self._make_location_attributes(backup),
             ATTR_SUPERVISOR_VERSION: backup.supervisor_version,
@@ -27,6 +27,8 @@ ATTR_BROADCAST_LLMNR = "broadcast_llmnr"
 ATTR_BROADCAST_MDNS = "broadcast_mdns"
 ATTR_BY_ID = "by_id"
 ATTR_CHILDREN = "children"
+ATTR_BUS_STATS = "bus_stats"
+ATTR_CONFIG_WRITE_STATS = "config_write_stats"
 ATTR_CONNECTION_BUS = "connection_bus"
 ATTR_DATA_DISK = "data_disk"
 ATTR_DEVICE = "device"
@@ -36,10 +38,12 @@ ATTR_DRIVES = "drives"
 ATTR_DT_SYNCHRONIZED = "dt_synchronized"
 ATTR_DT_UTC = "dt_utc"
 ATTR_EJECTABLE = "ejectable"
+ATTR_EVENT_STATS = "event_stats"
 ATTR_FALLBACK = "fallback"
 ATTR_FILESYSTEMS = "filesystems"
 ATTR_FORCE = "force"
 ATTR_GROUP_IDS = "group_ids"
+ATTR_HTTP_CACHE_STATS = "http_cache_stats"
 ATTR_IDENTIFIERS = "identifiers"
 ATTR_IS_ACTIVE = "is_active"
 ATTR_IS_OWNER = "is_owner"
@@ -59,6 +63,7 @@ ATTR_REMOVABLE = "removable"
 ATTR_REMOVE_CONFIG = "remove_config"
 ATTR_REVISION = "revision"
 ATTR_SAFE_MODE = "safe_mode"
+ATTR_SCHEDULED_TASKS = "scheduled_tasks"
 ATTR_SEAT = "seat"
 ATTR_SIGNED = "signed"
 ATTR_STARTUP_TIME = "startup_time"
@@ -6,22 +6,30 @@ from typing import Any
 from aiohttp import web
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
+from voluptuous.humanize import humanize_error
 
 from ..const import (
+    ATTR_CONTAINERS,
     ATTR_ENABLE_IPV6,
+    ATTR_HISTORY,
     ATTR_HOSTNAME,
     ATTR_LOGGING,
     ATTR_MTU,
+    ATTR_NAME,
     ATTR_PASSWORD,
+    ATTR_POINTS,
     ATTR_REGISTRIES,
+    ATTR_STATS_INTERVAL,
     ATTR_STORAGE,
     ATTR_STORAGE_DRIVER,
     ATTR_USERNAME,
     ATTR_VERSION,
 )
 from ..coresys import CoreSysAttributes
-from ..exceptions import APINotFound
+from ..docker.sampler import HISTORY_SIZE
+from ..exceptions import APIError, APINotFound
 from ..resolution.const import ContextType, IssueType, SuggestionType
+from ..validate import stats_interval
 from .utils import api_process, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -40,6 +48,15 @@ SCHEMA_OPTIONS = vol.Schema(
     {
         vol.Optional(ATTR_ENABLE_IPV6): vol.Maybe(vol.Boolean()),
         vol.Optional(ATTR_MTU): vol.Maybe(vol.All(int, vol.Range(min=68, max=65535))),
+        vol.Optional(ATTR_STATS_INTERVAL): stats_interval,
+    }
+)
+
+SCHEMA_STATS_HISTORY = vol.Schema(
+    {
+        vol.Optional(ATTR_POINTS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=HISTORY_SIZE)
+        ),
     }
 )
 
@@ -65,6 +82,7 @@ class APIDocker(CoreSysAttributes):
             ATTR_VERSION: self.sys_docker.info.version,
             ATTR_ENABLE_IPV6: self.sys_docker.config.enable_ipv6,
             ATTR_MTU: self.sys_docker.config.mtu,
+            ATTR_STATS_INTERVAL: self.sys_docker.config.stats_interval,
             ATTR_STORAGE: self.sys_docker.info.storage,
             ATTR_LOGGING: self.sys_docker.info.logging,
             ATTR_REGISTRIES: data_registries,
@@ -88,6 +106,13 @@ class APIDocker(CoreSysAttributes):
             self.sys_docker.config.mtu = body[ATTR_MTU]
             reboot_required = True
 
+        if (
+            ATTR_STATS_INTERVAL in body
+            and self.sys_docker.config.stats_interval != body[ATTR_STATS_INTERVAL]
+        ):
+            self.sys_docker.config.stats_interval = body[ATTR_STATS_INTERVAL]
+            await self.sys_docker.stats_sampler.reload()
+
         if reboot_required:
             _LOGGER.info(
                 "Host system reboot required to apply Docker configuration changes"
@@ -100,6 +125,44 @@ class APIDocker(CoreSysAttributes):
 
         await self.sys_docker.config.save_data()
 
+    @api_process
+    async def stats(self, request: web.Request) -> dict[str, Any]:
+        """Return current stats of all managed containers."""
+        # Without background sampling, collect the stats on demand
+        if not self.sys_docker.stats_sampler.running:
+            await self.sys_docker.stats_sampler.sample()
+
+        return {
+            ATTR_STATS_INTERVAL: self.sys_docker.config.stats_interval,
+            ATTR_CONTAINERS: [
+                {ATTR_NAME: name, **sample.as_dict()}
+                for name, sample in self.sys_docker.stats_sampler.latest().items()
+            ],
+        }
+
+    @api_process
+    async def stats_history(self, request: web.Request) -> dict[str, Any]:
+        """Return stats history of a container."""
+        name = request.match_info["container"]
+        if name not in self.sys_docker.stats_sampler.containers:
+            raise APINotFound(f"No stats history for container {name}")
+
+        try:
+            query = SCHEMA_STATS_HISTORY(dict(request.query))
+        except vol.Invalid as err:
+            raise APIError(humanize_error(dict(request.query), err)) from None
+
+        return {
+            ATTR_NAME: name,
+            ATTR_STATS_INTERVAL: self.sys_docker.config.stats_interval,
+            ATTR_HISTORY: [
+                sample.as_dict()
+                for sample in self.sys_docker.stats_sampler.history(
+                    name, query.get(ATTR_POINTS)
+                )
+            ],
+        }
+
     @api_process
     async def registries(self, request) -> dict[str, Any]:
         """Return the list of registries."""
@@ -1,16 +1,18 @@
 """Init file for Supervisor host RESTful API."""
 
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 from contextlib import suppress
 import json
 import logging
+import re
 from typing import Any
 
 from aiohttp import (
     ClientConnectionResetError,
     ClientError,
     ClientPayloadError,
+    ClientResponse,
     ClientTimeout,
     web,
 )
@@ -50,15 +52,18 @@ from ..exceptions import (
     MountUsageTimeoutError,
 )
 from ..host.const import (
+    LOG_PRIORITIES,
     PARAM_BOOT_ID,
     PARAM_FOLLOW,
+    PARAM_PRIORITY,
     PARAM_SYSLOG_IDENTIFIER,
     LogFormat,
     LogFormatter,
 )
-from ..host.logs import SYSTEMD_JOURNAL_GATEWAYD_LINES_MAX
+from ..host.log_tail import JournalTail
+from ..host.logs import RE_ENTRIES_HEADER, SYSTEMD_JOURNAL_GATEWAYD_LINES_MAX
 from ..mounts.mount import Mount
-from ..utils.systemd_journal import journal_logs_reader
+from ..utils.systemd_journal import get_journal_formatter, journal_logs_batch_reader
 from .const import (
     ATTR_AGENT_VERSION,
     ATTR_APPARMOR_VERSION,
@@ -87,6 +92,11 @@ IDENTIFIER = "identifier"
 BOOTID = "bootid"
 DEFAULT_LINES = 100
 
+# Log lines are written to the client in blocks of this size, or once the
+# oldest buffered line waited for LOG_FLUSH_INTERVAL seconds when following
+LOG_FLUSH_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.1
+
 DISK = "disk"
 
 # Reserved disk target naming the system disk. Takes precedence over a mount of
@@ -118,6 +128,163 @@ SCHEMA_SHUTDOWN = vol.Schema(
 # pylint: enable=no-value-for-parameter
 
 
+def _get_priorities(priority: str) -> list[str]:
+    """Return journal priority values up to a priority given by value or name."""
+    if priority in LOG_PRIORITIES:
+        value = LOG_PRIORITIES.index(priority)
+    else:
+        try:
+            value = int(priority)
+        except ValueError:
+            value = -1
+    if not 0 <= value < len(LOG_PRIORITIES):
+        raise APIError(
+            f"Invalid priority {priority}, use 0-7 or one of {', '.join(LOG_PRIORITIES)}"
+        )
+    return [str(level) for level in range(value + 1)]
+
+
+def _get_flag(request: web.Request, name: str) -> bool:
+    """Return boolean query parameter, set without value means true."""
+    if (value := request.query.get(name)) is None:
+        return False
+    if not value:
+        return True
+    try:
+        return vol.Boolean()(value)
+    except vol.Invalid as err:
+        raise APIError(f"Invalid value for {name}: {value}") from err
+
+
+def _get_grep(request: web.Request) -> re.Pattern[str] | None:
+    """Return case insensitive pattern to filter log lines, if requested."""
+    if not (pattern := request.query.get("grep")):
+        return None
+    if not _get_flag(request, "regex"):
+        pattern = re.escape(pattern)
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as err:
+        raise APIError(f"Invalid grep pattern: {err}") from err
+
+
+def _tail_range(
+    tail: JournalTail, range_header: str, latest: bool
+) -> tuple[int, int | None] | None:
+    """Return numbers of the tail entries requested, None if not all are kept."""
+    if latest:
+        # Latest logs are the entries since the last start of the container
+        entries = tail.entries(tail.start)
+        if not entries or not (epoch := entries[-1].get("CONTAINER_LOG_EPOCH")):
+            return None
+        count = 0
+        for entry in reversed(entries):
+            if entry.get("CONTAINER_LOG_EPOCH") != epoch:
+                break
+            count += 1
+        if count == len(entries) and not tail.complete:
+            return None
+        return tail.end - count, None
+
+    if not (matches := RE_ENTRIES_HEADER.match(range_header)):
+        return None
+    cursor, num_skip = matches.group("cursor"), int(matches.group("num_skip"))
+    if cursor:
+        if (index := tail.find(cursor)) is None:
+            return None
+        start = index + num_skip
+    elif num_skip < 0:
+        # Without cursor negative skips count back from the last entry
+        start = tail.end + num_skip - 1
+    else:
+        # Without cursor non-negative skips count from the head of the journal
+        if not tail.complete or tail.start != 0:
+            return None
+        start = num_skip
+
+    if start < tail.start and not tail.complete:
+        return None
+    num_lines = int(matches.group("num_lines") or SYSTEMD_JOURNAL_GATEWAYD_LINES_MAX)
+    return start, start + num_lines
+
+
+class _LogWriter:
+    """Buffer formatted log lines and write them to a stream response in blocks."""
+
+    def __init__(self, response: web.StreamResponse, loop: asyncio.AbstractEventLoop):
+        """Initialize log writer."""
+        self.response = response
+        self._loop = loop
+        self._buffer: list[str] = []
+        self._size = 0
+        self._flush_at = 0.0
+        self._flushed = False
+
+    @property
+    def pending(self) -> bool:
+        """Return true if lines are buffered."""
+        return bool(self._buffer)
+
+    @property
+    def due(self) -> bool:
+        """Return true if buffered lines should be written now."""
+        return self.pending and (
+            self._size >= LOG_FLUSH_SIZE or self._loop.time() >= self._flush_at
+        )
+
+    @property
+    def flush_in(self) -> float:
+        """Return seconds until buffered lines are due."""
+        return max(0, self._flush_at - self._loop.time())
+
+    async def prepare(self, request: web.Request, cursor: str | None) -> bool:
+        """Send headers, return false if the client disconnected."""
+        if cursor:
+            self.response.headers["X-First-Cursor"] = cursor
+        self.response.headers["X-Accel-Buffering"] = "no"
+        try:
+            await self.response.prepare(request)
+        except ConnectionError as err:
+            _LOGGER.debug(
+                "%s raised when returning journal logs: %s", type(err).__name__, err
+            )
+            return False
+        return True
+
+    def add(self, lines: Iterable[str]) -> None:
+        """Buffer lines, the first lines are due right away."""
+        if not self._buffer and self._flushed:
+            self._flush_at = self._loop.time() + LOG_FLUSH_INTERVAL
+        for line in lines:
+            self._buffer.append(f"{line}\n")
+            self._size += len(line) + 1
+
+    async def flush(self) -> bool:
+        """Write buffered lines, return false if the client disconnected."""
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+        self._size = 0
+        self._flushed = True
+        try:
+            await self.response.write(data)
+        except ClientConnectionResetError as err:
+            # When client closes the connection while reading busy logs, we
+            # sometimes get this exception. It should be safe to ignore it.
+            _LOGGER.debug(
+                "ClientConnectionResetError raised when returning journal logs: %s",
+                err,
+            )
+            return False
+        except ConnectionError as err:
+            _LOGGER.warning(
+                "%s raised when returning journal logs: %s",
+                type(err).__name__,
+                err,
+            )
+            return False
+        return True
+
+
 class APIHost(CoreSysAttributes):
     """Handle RESTful API for host functions."""
 
@@ -284,14 +451,13 @@ class APIHost(CoreSysAttributes):
         if follow:
             params[PARAM_FOLLOW] = ""
 
-        if latest:
-            if not identifier:
-                raise APIError(
-                    "Latest logs can only be fetched for a specific identifier."
-                )
+        # Priority is matched by the journal, grep on the formatted lines
+        if "priority" in request.query:
+            params[PARAM_PRIORITY] = _get_priorities(request.query["priority"])
+        grep = _get_grep(request)
 
-            epoch = await self._get_container_last_epoch(identifier)
-            params["CONTAINER_LOG_EPOCH"] = epoch
+        if latest and not identifier:
+            raise APIError("Latest logs can only be fetched for a specific identifier.")
 
         accept_header = request.headers.get(ACCEPT)
 
@@ -333,54 +499,93 @@ class APIHost(CoreSysAttributes):
         else:
             range_header = f"entries=:-{DEFAULT_LINES - 1}:{SYSTEMD_JOURNAL_GATEWAYD_LINES_MAX if follow else DEFAULT_LINES}"
 
+        # Logs of a single app or service are served from the shared tail of
+        # the journal if it holds the requested entries
+        if identifier and (
+            response := await self._tail_logs(
+                request,
+                identifier,
+                range_header,
+                follow=follow,
+                latest=latest,
+                log_formatter=log_formatter,
+                no_colors=no_colors,
+                grep=grep,
+            )
+        ):
+            return response
+
+        if latest and identifier:
+            params["CONTAINER_LOG_EPOCH"] = await self._get_container_last_epoch(
+                identifier
+            )
+
         async with self.sys_host.logs.journald_logs(
             params=params, range_header=range_header, accept=LogFormat.JOURNAL
         ) as resp:
-            response = web.StreamResponse()
-            response.content_type = CONTENT_TYPE_TEXT
-            headers_returned = False
-            try:
-                async for cursor, line in journal_logs_reader(
-                    resp, log_formatter, no_colors
-                ):
-                    try:
-                        if not headers_returned:
-                            if cursor:
-                                response.headers["X-First-Cursor"] = cursor
-                            response.headers["X-Accel-Buffering"] = "no"
-                            await response.prepare(request)
-                            headers_returned = True
-                        await response.write(line.encode("utf-8") + b"\n")
-                    except ClientConnectionResetError as err:
-                        # When client closes the connection while reading busy logs, we
-                        # sometimes get this exception. It should be safe to ignore it.
-                        _LOGGER.debug(
-                            "ClientConnectionResetError raised when returning journal logs: %s",
-                            err,
-                        )
-                        break
-                    except ConnectionError as err:
-                        _LOGGER.warning(
-                            "%s raised when returning journal logs: %s",
-                            type(err).__name__,
-                            err,
-                        )
+            return await self._stream_journal_logs(
+                request, resp, log_formatter, no_colors=no_colors, grep=grep
+            )
+
+    async def _stream_journal_logs(
+        self,
+        request: web.Request,
+        resp: ClientResponse,
+        log_formatter: LogFormatter,
+        *,
+        no_colors: bool,
+        grep: re.Pattern[str] | None,
+    ) -> web.StreamResponse:
+        """Stream logs read from systemd-journal-gatewayd to the client."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_TEXT
+        writer = _LogWriter(response, self.sys_loop)
+        batches = aiter(journal_logs_batch_reader(resp, log_formatter, no_colors))
+        next_batch: asyncio.Future[list[tuple[str | None, str]]] | None = None
+        try:
+            while True:
+                next_batch = asyncio.ensure_future(anext(batches))
+                # Write buffered lines once they are due, even if no more
+                # lines arrive while following
+                if writer.pending:
+                    await asyncio.wait([next_batch], timeout=writer.flush_in)
+                    if writer.due and not await writer.flush():
                         break
-            except (ConnectionResetError, ClientPayloadError) as ex:
-                # If the stream to the client already started, an error response
-                # can no longer be sent, so just end the stream. This happens
-                # e.g. when systemd-journal-gatewayd is stopped on host shutdown
-                # while a client is following the logs.
-                if not headers_returned:
-                    raise APIError(
-                        "Connection reset when trying to fetch data from systemd-journald."
-                    ) from ex
-                _LOGGER.debug(
-                    "%s raised when reading journal logs: %s",
-                    type(ex).__name__,
-                    ex,
-                )
-            return response
+
+                try:
+                    entries = await next_batch
+                except StopAsyncIteration:
+                    break
+
+                if not response.prepared and not await writer.prepare(
+                    request, entries[0][0]
+                ):
+                    break
+
+                writer.add(line for _, line in entries if not grep or grep.search(line))
+                if writer.due and not await writer.flush():
+                    break
+        except (ConnectionResetError, ClientPayloadError) as ex:
+            # If the stream to the client already started, an error response
+            # can no longer be sent, so just end the stream. This happens
+            # e.g. when systemd-journal-gatewayd is stopped on host shutdown
+            # while a client is following the logs.
+            if not response.prepared:
+                raise APIError(
+                    "Connection reset when trying to fetch data from systemd-journald."
+                ) from ex
+            _LOGGER.debug(
+                "%s raised when reading journal logs: %s",
+                type(ex).__name__,
+                ex,
+            )
+        finally:
+            if next_batch:
+                next_batch.cancel()
+
+        if writer.pending:
+            await writer.flush()
+        return response
 
     @api_process_raw(CONTENT_TYPE_TEXT, error_type=CONTENT_TYPE_TEXT)
     async def advanced_logs(
@@ -628,6 +833,65 @@ class APIHost(CoreSysAttributes):
 
         return data
 
+    async def _tail_logs(
+        self,
+        request: web.Request,
+        identifier: str | list[str],
+        range_header: str,
+        *,
+        follow: bool,
+        latest: bool,
+        log_formatter: LogFormatter,
+        no_colors: bool,
+        grep: re.Pattern[str] | None,
+    ) -> web.StreamResponse | None:
+        """Return logs from the shared tail, None if it doesn't hold the entries."""
+        if (
+            BOOTID in request.match_info
+            or "priority" in request.query
+            or (latest and "lines" in request.query)
+        ):
+            return None
+
+        async with self.sys_host.logs.tail(identifier) as tail:
+            if not tail or not (
+                entries_range := _tail_range(tail, range_header, latest)
+            ):
+                return None
+
+            position, end = entries_range
+            formatter_ = get_journal_formatter(log_formatter)
+            response = web.StreamResponse()
+            response.content_type = CONTENT_TYPE_TEXT
+            writer = _LogWriter(response, self.sys_loop)
+
+            entries = tail.entries(position, end)
+            if not await writer.prepare(
+                request, entries[0].get("__CURSOR") if entries else None
+            ):
+                return response
+
+            while True:
+                position = max(position, tail.start) + len(entries)
+                lines = (formatter_(entry, no_colors=no_colors) for entry in entries)
+                writer.add(line for line in lines if not grep or grep.search(line))
+                if writer.due and not await writer.flush():
+                    break
+                if not follow or (end is not None and position >= end):
+                    break
+
+                # Wait for new entries, but not longer than buffered lines are due
+                if writer.pending:
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(tail.wait(position), writer.flush_in)
+                elif not await tail.wait(position):
+                    break
+                entries = tail.entries(position, end)
+
+            if writer.pending:
+                await writer.flush()
+            return response
+
     async def _get_container_last_epoch(self, identifier: str | list[str]) -> str:
         """Get Docker's internal log epoch of the latest log entry for given identifier(s)."""
         identifiers = [identifier] if isinstance(identifier, str) else identifier
@@ -1,12 +1,13 @@
 """Supervisor App ingress service."""
 
 import asyncio
+from collections.abc import Callable
 from ipaddress import ip_address
 import logging
 from typing import Any
 
 import aiohttp
-from aiohttp import ClientTimeout, hdrs, web
+from aiohttp import ClientTimeout, StreamReader, hdrs, web
 from aiohttp.web_exceptions import (
     HTTPBadGateway,
     HTTPServiceUnavailable,
@@ -18,6 +19,7 @@ import voluptuous as vol
 from ..apps.app import App
 from ..const import (
     ATTR_ADMIN,
+    ATTR_APPS,
     ATTR_ENABLE,
     ATTR_ICON,
     ATTR_PANELS,
@@ -107,6 +109,16 @@ class APIIngress(CoreSysAttributes):
 
         return {ATTR_PANELS: apps}
 
+    @api_process
+    async def stats(self, request: web.Request) -> dict[str, Any]:
+        """Return proxy statistics of ingress apps."""
+        return {
+            ATTR_APPS: {
+                slug: stats.as_dict()
+                for slug, stats in self.sys_ingress.proxy_stats.items()
+            }
+        }
+
     @api_process
     @require_home_assistant
     async def create_session(self, request: web.Request) -> dict[str, Any]:
@@ -162,6 +174,7 @@ class APIIngress(CoreSysAttributes):
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Ingress error: %s", err)
+            self.sys_ingress.get_proxy_stats(app).errors += 1
 
         raise HTTPBadGateway
 
@@ -197,10 +210,19 @@ class APIIngress(CoreSysAttributes):
         if request.query_string:
             url = f"{url}?{request.query_string}"
 
+        stats = self.sys_ingress.get_proxy_stats(app)
+
+        def _count_in(size: int) -> None:
+            stats.bytes_in += size
+
+        def _count_out(size: int) -> None:
+            stats.bytes_out += size
+
         # Start proxy
         try:
             _LOGGER.debug("Proxing WebSocket to %s, upstream url: %s", app.slug, url)
-            async with self.sys_websession.ws_connect(
+            start = self.sys_loop.time()
+            async with self.sys_ingress.get_websession(app).ws_connect(
                 url,
                 headers=source_header,
                 protocols=req_protocols,
@@ -208,11 +230,18 @@ class APIIngress(CoreSysAttributes):
                 autoping=False,
                 max_msg_size=MAX_WEBSOCKET_MESSAGE_SIZE,
             ) as ws_client:
+                stats.record_latency(self.sys_loop.time() - start)
+                stats.websockets += 1
+
                 # Proxy requests
                 await asyncio.wait(
                     [
-                        self.sys_create_task(_websocket_forward(ws_server, ws_client)),
-                        self.sys_create_task(_websocket_forward(ws_client, ws_server)),
+                        self.sys_create_task(
+                            _websocket_forward(ws_server, ws_client, _count_in)
+                        ),
+                        self.sys_create_task(
+                            _websocket_forward(ws_client, ws_server, _count_out)
+                        ),
                     ],
                     return_when=asyncio.FIRST_COMPLETED,
                 )
@@ -232,79 +261,105 @@ class APIIngress(CoreSysAttributes):
         url = self._create_url(app, path)
         source_header = _init_header(request, app, session_data)
 
-        # Passing the raw stream breaks requests for some webservers
-        # since we just need it for POST requests really, for all other methods
-        # we read the bytes and pass that to the request to the app
-        # apps needs to add support with that in the configuration
-        data = (
-            request.content
-            if request.method == "POST" and app.ingress_stream
-            else await request.read()
-        )
-
-        async with self.sys_websession.request(
-            request.method,
-            url,
-            headers=source_header,
-            params=request.query,
-            allow_redirects=False,
-            data=data,
-            timeout=ClientTimeout(total=None),
-            skip_auto_headers={hdrs.CONTENT_TYPE},
-        ) as result:
-            headers = _response_header(result)
-
-            # Avoid parsing content_type in simple cases for better performance
-            if maybe_content_type := result.headers.get(hdrs.CONTENT_TYPE):
-                content_type = (maybe_content_type.partition(";"))[0].strip()
-            else:
-                content_type = result.content_type
-
-            # Empty body responses (304, 204, HEAD, etc.) should not be streamed,
-            # otherwise aiohttp < 3.9.0 may generate an invalid "0\r\n\r\n" chunk
-            # This also avoids setting content_type for empty responses.
-            if must_be_empty_body(request.method, result.status):
-                # If upstream contains content-type, preserve it (e.g. for HEAD requests)
-                if maybe_content_type:
-                    headers[hdrs.CONTENT_TYPE] = content_type
-                return web.Response(
-                    headers=headers,
-                    status=result.status,
-                )
+        data = await self._request_body(request, app, source_header)
 
-            # Simple request
+        stats = self.sys_ingress.get_proxy_stats(app)
+        start = self.sys_loop.time()
+        try:
+            async with self.sys_ingress.get_websession(app).request(
+                request.method,
+                url,
+                headers=source_header,
+                params=request.query,
+                allow_redirects=False,
+                data=data,
+                timeout=ClientTimeout(total=None),
+                skip_auto_headers={hdrs.CONTENT_TYPE},
+            ) as result:
+                stats.record_latency(self.sys_loop.time() - start)
+                headers = _response_header(result)
+
+                # Avoid parsing content_type in simple cases for better performance
+                if maybe_content_type := result.headers.get(hdrs.CONTENT_TYPE):
+                    content_type = (maybe_content_type.partition(";"))[0].strip()
+                else:
+                    content_type = result.content_type
+
+                # Empty body responses (304, 204, HEAD, etc.) should not be streamed,
+                # otherwise aiohttp < 3.9.0 may generate an invalid "0\r\n\r\n" chunk
+                # This also avoids setting content_type for empty responses.
+                if must_be_empty_body(request.method, result.status):
+                    # If upstream contains content-type, preserve it (e.g. for HEAD requests)
+                    if maybe_content_type:
+                        headers[hdrs.CONTENT_TYPE] = content_type
+                    return web.Response(
+                        headers=headers,
+                        status=result.status,
+                    )
+
+                # Simple request
+                if (
+                    hdrs.CONTENT_LENGTH in result.headers
+                    and int(result.headers.get(hdrs.CONTENT_LENGTH, 0)) < 4_194_000
+                ):
+                    # Return Response
+                    body = await result.read()
+                    stats.bytes_out += len(body)
+                    return web.Response(
+                        headers=headers,
+                        status=result.status,
+                        content_type=content_type,
+                        body=body,
+                    )
+
+                # Stream response
+                response = web.StreamResponse(status=result.status, headers=headers)
+                response.content_type = content_type
+
+                try:
+                    response.headers["X-Accel-Buffering"] = "no"
+                    await response.prepare(request)
+                    async for data, _ in result.content.iter_chunks():
+                        await response.write(data)
+                        stats.bytes_out += len(data)
+
+                except (
+                    aiohttp.ClientError,
+                    aiohttp.ClientPayloadError,
+                    ConnectionResetError,
+                    ConnectionError,
+                ) as err:
+                    _LOGGER.error("Stream error with %s: %s", url, err)
+
+                return response
+        finally:
+            stats.bytes_in += request.content.total_bytes
+
+    async def _request_body(
+        self, request: web.Request, app: App, headers: CIMultiDict[str]
+    ) -> bytes | StreamReader:
+        """Return request body to pass on to the app."""
+        # Bodies of unknown size or larger than the buffer are streamed to the
+        # app as they arrive. If the size is known it is kept, so webservers
+        # without support for chunked requests still work
+        if request.body_exists and (
+            request.content_length is None
+            or request.content_length > self.sys_config.ingress_buffer_size
+        ):
             if (
-                hdrs.CONTENT_LENGTH in result.headers
-                and int(result.headers.get(hdrs.CONTENT_LENGTH, 0)) < 4_194_000
+                request.content_length is not None
+                and hdrs.CONTENT_ENCODING not in request.headers
             ):
-                # Return Response
-                body = await result.read()
-                return web.Response(
-                    headers=headers,
-                    status=result.status,
-                    content_type=content_type,
-                    body=body,
-                )
-
-            # Stream response
-            response = web.StreamResponse(status=result.status, headers=headers)
-            response.content_type = content_type
+                headers[hdrs.CONTENT_LENGTH] = str(request.content_length)
+            return request.content
 
-            try:
-                response.headers["X-Accel-Buffering"] = "no"
-                await response.prepare(request)
-                async for data, _ in result.content.iter_chunks():
-                    await response.write(data)
-
-            except (
-                aiohttp.ClientError,
-                aiohttp.ClientPayloadError,
-                ConnectionResetError,
-                ConnectionError,
-            ) as err:
-                _LOGGER.error("Stream error with %s: %s", url, err)
-
-            return response
+        # Passing the raw stream breaks requests for some webservers
+        # since we just need it for POST requests really, for all other methods
+        # we read the bytes and pass that to the request to the app
+        # apps needs to add support with that in the configuration
+        if request.method == hdrs.METH_POST and app.ingress_stream:
+            return request.content
+        return await request.read()
 
     async def _find_user_by_id(self, user_id: str) -> HomeAssistantUser | None:
         """Find user object by the user's ID."""
@@ -387,14 +442,16 @@ def _is_websocket(request: web.Request) -> bool:
     return False
 
 
-async def _websocket_forward(ws_from, ws_to):
+async def _websocket_forward(ws_from, ws_to, count_bytes: Callable[[int], None]):
     """Handle websocket message directly."""
     try:
         async for msg in ws_from:
             if msg.type == aiohttp.WSMsgType.TEXT:
                 await ws_to.send_str(msg.data)
+                count_bytes(len(msg.data.encode()))
             elif msg.type == aiohttp.WSMsgType.BINARY:
                 await ws_to.send_bytes(msg.data)
+                count_bytes(len(msg.data))
             elif msg.type == aiohttp.WSMsgType.PING:
                 await ws_to.ping(msg.data)
             elif msg.type == aiohttp.WSMsgType.PONG:
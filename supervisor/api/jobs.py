@@ -1,5 +1,6 @@
 """Init file for Supervisor Jobs RESTful API."""
 
+from collections import deque
 import logging
 from typing import Any
 
@@ -10,14 +11,26 @@ from ..const import FeatureFlag
 from ..coresys import CoreSysAttributes
 from ..exceptions import APIError, APINotFound, JobNotFound
 from ..jobs import SupervisorJob, process_job_dict_for_legacy_compatibility
-from ..jobs.const import ATTR_IGNORE_CONDITIONS, JobCondition
-from .const import ATTR_JOBS
+from ..jobs.const import ATTR_HISTORY_SIZE, ATTR_IGNORE_CONDITIONS, JobCondition
+from ..jobs.validate import job_history_size
+from ..utils.common import config_write_stats
+from .const import (
+    ATTR_BUS_STATS,
+    ATTR_CONFIG_WRITE_STATS,
+    ATTR_EVENT_STATS,
+    ATTR_HTTP_CACHE_STATS,
+    ATTR_JOBS,
+    ATTR_SCHEDULED_TASKS,
+)
 from .utils import api_process, api_validate
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 SCHEMA_OPTIONS = vol.Schema(
-    {vol.Optional(ATTR_IGNORE_CONDITIONS): [vol.Coerce(JobCondition)]}
+    {
+        vol.Optional(ATTR_HISTORY_SIZE): job_history_size,
+        vol.Optional(ATTR_IGNORE_CONDITIONS): [vol.Coerce(JobCondition)],
+    }
 )
 
 
@@ -34,39 +47,27 @@ class APIJobs(CoreSysAttributes):
     def _list_jobs(self, start: SupervisorJob | None = None) -> list[dict[str, Any]]:
         """Return current job tree.
 
-        Jobs are added to cache as they are created so by default they are in oldest to newest.
-        This is correct ordering for child jobs as it makes logical sense to present those in
-        the order they occurred within the parent. For the list as a whole, sort from newest
-        to oldest as its likely any client is most interested in the newer ones.
+        Child jobs are presented in the order they were created within the parent,
+        root jobs from newest to oldest as its likely any client is most interested
+        in the newer ones. Internal jobs and their children are left out.
         """
         websocket_v2_api_enabled = self.sys_config.feature_flags.get(
             FeatureFlag.SUPERVISOR_WEBSOCKET_V2_API, False
         )
 
-        # Initially sort oldest to newest so all child lists end up in correct order
-        jobs_by_parent: dict[str | None, list[SupervisorJob]] = {}
-        for job in sorted(self.sys_jobs.jobs):
-            if job.internal:
-                continue
-
-            if job.parent_id not in jobs_by_parent:
-                jobs_by_parent[job.parent_id] = [job]
-            else:
-                jobs_by_parent[job.parent_id].append(job)
-
-        # After parent-child organization, sort the root jobs only from newest to oldest
         job_list: list[dict[str, Any]] = []
-        queue: list[tuple[list[dict[str, Any]], SupervisorJob]] = (
+        queue: deque[tuple[list[dict[str, Any]], SupervisorJob]] = deque(
             [(job_list, start)]
             if start
             else [
                 (job_list, job)
-                for job in sorted(jobs_by_parent.get(None, []), reverse=True)
+                for job in reversed(self.sys_jobs.children(None))
+                if not job.internal
             ]
         )
 
         while queue:
-            (current_list, current_job) = queue.pop(0)
+            (current_list, current_job) = queue.popleft()
             child_jobs: list[dict[str, Any]] = []
 
             # We remove parent_id and instead use that info to represent jobs as a tree
@@ -78,13 +79,11 @@ class APIJobs(CoreSysAttributes):
                 else process_job_dict_for_legacy_compatibility(job_dict)
             )
 
-            if current_job.uuid in jobs_by_parent:
-                queue.extend(
-                    [
-                        (child_jobs, job)
-                        for job in jobs_by_parent.get(current_job.uuid, [])
-                    ]
-                )
+            queue.extend(
+                (child_jobs, job)
+                for job in self.sys_jobs.children(current_job.uuid)
+                if not job.internal
+            )
 
         return job_list
 
@@ -92,8 +91,19 @@ class APIJobs(CoreSysAttributes):
     async def info(self, request: web.Request) -> dict[str, Any]:
         """Return JobManager information."""
         return {
+            ATTR_BUS_STATS: {
+                event: stats.as_dict() for event, stats in self.sys_bus.stats.items()
+            },
+            ATTR_CONFIG_WRITE_STATS: {
+                str(path): stats.as_dict()
+                for path, stats in config_write_stats().items()
+            },
+            ATTR_EVENT_STATS: self.sys_jobs.event_stats,
+            ATTR_HISTORY_SIZE: self.sys_jobs.history_size,
+            ATTR_HTTP_CACHE_STATS: self.sys_http_cache.stats.as_dict(),
             ATTR_IGNORE_CONDITIONS: self.sys_jobs.ignore_conditions,
             ATTR_JOBS: self._list_jobs(),
+            ATTR_SCHEDULED_TASKS: self.sys_scheduler.task_stats,
         }
 
     @api_process
@@ -101,6 +111,9 @@ class APIJobs(CoreSysAttributes):
         """Set options for JobManager."""
         body = await api_validate(SCHEMA_OPTIONS, request)
 
+        if ATTR_HISTORY_SIZE in body:
+            self.sys_jobs.history_size = body[ATTR_HISTORY_SIZE]
+
         if ATTR_IGNORE_CONDITIONS in body:
             self.sys_jobs.ignore_conditions = body[ATTR_IGNORE_CONDITIONS]
 
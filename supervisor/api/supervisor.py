@@ -10,9 +10,15 @@ import voluptuous as vol
 
 from ..const import (
     ATTR_ADDONS,
+    ATTR_APP_BOOT_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_TIMEOUT,
     ATTR_APPS_REPOSITORIES,
     ATTR_ARCH,
     ATTR_AUTO_UPDATE,
+    ATTR_BACKUP_COMPRESSION,
+    ATTR_BACKUP_COMPRESSION_LEVEL,
+    ATTR_BACKUP_CONCURRENCY,
     ATTR_BLK_READ,
     ATTR_BLK_WRITE,
     ATTR_CHANNEL,
@@ -25,6 +31,7 @@ from ..const import (
     ATTR_FEATURE_FLAGS,
     ATTR_HEALTHY,
     ATTR_ICON,
+    ATTR_INGRESS_BUFFER_SIZE,
     ATTR_IP_ADDRESS,
     ATTR_LOGGING,
     ATTR_MEMORY_LIMIT,
@@ -42,6 +49,7 @@ from ..const import (
     ATTR_VERSION,
     ATTR_VERSION_LATEST,
     ATTR_WAIT_BOOT,
+    BackupCompression,
     FeatureFlag,
     LogLevel,
     UpdateChannel,
@@ -52,7 +60,15 @@ from ..store.validate import repositories
 from ..utils.blockbuster import BlockBusterManager
 from ..utils.sentry import close_sentry, init_sentry
 from ..utils.validate import validate_timezone
-from ..validate import version_tag, wait_boot
+from ..validate import (
+    app_concurrency,
+    app_shutdown_timeout,
+    backup_compression_level,
+    backup_concurrency,
+    ingress_buffer_size,
+    version_tag,
+    wait_boot,
+)
 from .const import CONTENT_TYPE_TEXT, DetectBlockingIO
 from .utils import api_process, api_process_raw, api_validate
 
@@ -68,6 +84,13 @@ SCHEMA_OPTIONS = vol.Schema(
         vol.Optional(ATTR_DEBUG_BLOCK): vol.Boolean(),
         vol.Optional(ATTR_DIAGNOSTICS): vol.Boolean(),
         vol.Optional(ATTR_AUTO_UPDATE): vol.Boolean(),
+        vol.Optional(ATTR_APP_BOOT_CONCURRENCY): app_concurrency,
+        vol.Optional(ATTR_APP_SHUTDOWN_CONCURRENCY): app_concurrency,
+        vol.Optional(ATTR_APP_SHUTDOWN_TIMEOUT): app_shutdown_timeout,
+        vol.Optional(ATTR_BACKUP_CONCURRENCY): backup_concurrency,
+        vol.Optional(ATTR_BACKUP_COMPRESSION): vol.Coerce(BackupCompression),
+        vol.Optional(ATTR_BACKUP_COMPRESSION_LEVEL): backup_compression_level,
+        vol.Optional(ATTR_INGRESS_BUFFER_SIZE): ingress_buffer_size,
         vol.Optional(ATTR_DETECT_BLOCKING_IO): vol.Coerce(DetectBlockingIO),
         vol.Optional(ATTR_COUNTRY): str,
         vol.Optional(ATTR_FEATURE_FLAGS): vol.Schema(
@@ -108,6 +131,13 @@ class APISupervisor(CoreSysAttributes):
             ATTR_AUTO_UPDATE: self.sys_updater.auto_update,
             ATTR_DETECT_BLOCKING_IO: BlockBusterManager.is_enabled(),
             ATTR_COUNTRY: self.sys_config.country,
+            ATTR_APP_BOOT_CONCURRENCY: self.sys_config.app_boot_concurrency,
+            ATTR_APP_SHUTDOWN_CONCURRENCY: self.sys_config.app_shutdown_concurrency,
+            ATTR_APP_SHUTDOWN_TIMEOUT: self.sys_config.app_shutdown_timeout,
+            ATTR_BACKUP_CONCURRENCY: self.sys_config.backup_concurrency,
+            ATTR_BACKUP_COMPRESSION: self.sys_config.backup_compression,
+            ATTR_BACKUP_COMPRESSION_LEVEL: self.sys_config.backup_compression_level,
+            ATTR_INGRESS_BUFFER_SIZE: self.sys_config.ingress_buffer_size,
             ATTR_FEATURE_FLAGS: {
                 feature.value: self.sys_config.feature_flags.get(feature, False)
                 for feature in FeatureFlag
@@ -222,6 +252,31 @@ class APISupervisor(CoreSysAttributes):
         if ATTR_AUTO_UPDATE in body:
             self.sys_updater.auto_update = body[ATTR_AUTO_UPDATE]
 
+        if ATTR_APP_BOOT_CONCURRENCY in body:
+            self.sys_config.app_boot_concurrency = body[ATTR_APP_BOOT_CONCURRENCY]
+
+        if ATTR_APP_SHUTDOWN_CONCURRENCY in body:
+            self.sys_config.app_shutdown_concurrency = body[
+                ATTR_APP_SHUTDOWN_CONCURRENCY
+            ]
+
+        if ATTR_APP_SHUTDOWN_TIMEOUT in body:
+            self.sys_config.app_shutdown_timeout = body[ATTR_APP_SHUTDOWN_TIMEOUT]
+
+        if ATTR_BACKUP_CONCURRENCY in body:
+            self.sys_config.backup_concurrency = body[ATTR_BACKUP_CONCURRENCY]
+
+        if ATTR_BACKUP_COMPRESSION in body:
+            self.sys_config.backup_compression = body[ATTR_BACKUP_COMPRESSION]
+
+        if ATTR_BACKUP_COMPRESSION_LEVEL in body:
+            self.sys_config.backup_compression_level = body[
+                ATTR_BACKUP_COMPRESSION_LEVEL
+            ]
+
+        if ATTR_INGRESS_BUFFER_SIZE in body:
+            self.sys_config.ingress_buffer_size = body[ATTR_INGRESS_BUFFER_SIZE]
+
         if detect_blocking_io := body.get(ATTR_DETECT_BLOCKING_IO):
             if detect_blocking_io == DetectBlockingIO.ON_AT_STARTUP:
                 self.sys_config.detect_blocking_io = True
@@ -19,10 +19,11 @@ from typing import Any, Final, Literal, cast
 import aiohttp
 from awesomeversion import AwesomeVersion, AwesomeVersionCompareException
 from deepmerge import Merger
-from securetar import AddFileError, SecureTarFile, atomic_contents_add
+from securetar import AddFileError, atomic_contents_add
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
+from ..backups.utils import InnerTarFile
 from ..bus import EventListener
 from ..const import (
     ATTR_ACCESS_TOKEN,
@@ -278,12 +279,16 @@ class App(AppModel):
 
         self._listeners.append(
             self.sys_bus.register_event(
-                BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.container_state_changed
+                BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+                self.container_state_changed,
+                key=self.instance.name,
             )
         )
         self._listeners.append(
             self.sys_bus.register_event(
-                BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.watchdog_container
+                BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+                self.watchdog_container,
+                key=self.instance.name,
             )
         )
 
@@ -1347,11 +1352,14 @@ class App(AppModel):
         on_condition=AppsJobError,
         concurrency=JobConcurrency.GROUP_REJECT,
     )
-    async def stop(self) -> None:
-        """Stop app."""
+    async def stop(self, *, timeout: int | None = None) -> None:
+        """Stop app.
+
+        Timeout overrides the stop timeout of the app if set.
+        """
         self._manual_stop = True
         try:
-            await self.instance.stop()
+            await self.instance.stop(timeout=timeout)
         except DockerError as err:
             _LOGGER.error("Could not stop container for app %s: %s", self.slug, err)
             self._update_state(operation_error=True)
@@ -1494,7 +1502,7 @@ class App(AppModel):
         on_condition=AppsJobError,
         concurrency=JobConcurrency.GROUP_REJECT,
     )
-    async def backup(self, tar_file: SecureTarFile) -> asyncio.Task | None:
+    async def backup(self, tar_file: InnerTarFile) -> asyncio.Task | None:
         """Backup state of an app.
 
         Returns a Task that completes when app has state 'started' (see start)
@@ -1607,7 +1615,7 @@ class App(AppModel):
         on_condition=AppsJobError,
         concurrency=JobConcurrency.GROUP_REJECT,
     )
-    async def restore(self, tar_file: SecureTarFile) -> asyncio.Task | None:
+    async def restore(self, tar_file: InnerTarFile) -> asyncio.Task | None:
         """Restore state of an app.
 
         Returns a Task that completes when app has state 'started' (see start)
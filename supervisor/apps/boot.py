@@ -0,0 +1,98 @@
+"""Boot ordering and timeline for apps."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+from ..const import AppStartup
+
+if TYPE_CHECKING:
+    from .app import App
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+SERVICE_RIGHTS_PROVIDE = "provide"
+
+
+def _seconds_between(start: datetime | None, end: datetime | None) -> float | None:
+    """Return seconds between two points in time if both are known."""
+    if start is None or end is None:
+        return None
+    return round((end - start).total_seconds(), 3)
+
+
+@dataclass(slots=True)
+class AppBootRecord:
+    """Timeline of an app started during boot."""
+
+    slug: str
+    stage: AppStartup
+    queued: datetime
+    dependencies: list[str] = field(default_factory=list)
+    started: datetime | None = None
+    running: datetime | None = None
+    ready: datetime | None = None
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary representation."""
+        return {
+            "slug": self.slug,
+            "stage": self.stage,
+            "dependencies": self.dependencies,
+            "queued": self.queued.isoformat(),
+            "started": self.started.isoformat() if self.started else None,
+            "running": self.running.isoformat() if self.running else None,
+            "ready": self.ready.isoformat() if self.ready else None,
+            "wait_seconds": _seconds_between(self.queued, self.started),
+            "start_seconds": _seconds_between(self.started, self.running),
+            "ready_seconds": _seconds_between(self.running, self.ready),
+            "error": self.error,
+        }
+
+
+def boot_dependencies(apps: list[App]) -> dict[str, set[str]]:
+    """Return slugs of apps each app has to wait for during boot.
+
+    An app depends on the apps in the list which provide a service it wants
+    or needs. A dependency cycle is broken by starting one of its apps
+    without waiting.
+    """
+    providers: dict[str, set[str]] = {}
+    for app in apps:
+        for service, rights in app.services_role.items():
+            if rights == SERVICE_RIGHTS_PROVIDE:
+                providers.setdefault(service, set()).add(app.slug)
+
+    dependencies: dict[str, set[str]] = {
+        app.slug: {
+            provider
+            for service, rights in app.services_role.items()
+            if rights != SERVICE_RIGHTS_PROVIDE
+            for provider in providers.get(service, set())
+            if provider != app.slug
+        }
+        for app in apps
+    }
+
+    # Resolve in topological order and break cycles by starting one app of
+    # the cycle without waiting
+    pending = {slug for slug, deps in dependencies.items() if deps}
+    resolved: set[str] = dependencies.keys() - pending
+    while pending:
+        if not (ready := {slug for slug in pending if dependencies[slug] <= resolved}):
+            slug = min(pending)
+            _LOGGER.warning(
+                "App %s has a cyclic service dependency on %s, starting without waiting",
+                slug,
+                ", ".join(sorted(dependencies[slug])),
+            )
+            dependencies[slug] = set()
+            ready = {slug}
+        resolved |= ready
+        pending -= ready
+
+    return dependencies
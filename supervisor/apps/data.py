@@ -23,6 +23,8 @@ Config = dict[str, Any]
 class AppsData(FileConfiguration, CoreSysAttributes):
     """Hold data for installed Apps inside Supervisor."""
 
+    save_delay = 1
+
     def __init__(self, coresys: CoreSys):
         """Initialize data holder."""
         super().__init__(FILE_HASSIO_APPS, SCHEMA_APPS_FILE)
@@ -7,8 +7,7 @@ from dataclasses import replace
 import logging
 from typing import Self, Union
 
-from securetar import SecureTarFile
-
+from ..backups.utils import InnerTarFile
 from ..const import FILE_HASSIO_ADDONS, FILE_HASSIO_APPS, AppBoot, AppStartup, AppState
 from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import (
@@ -30,8 +29,10 @@ from ..jobs.const import JobConcurrency
 from ..jobs.decorator import Job, JobCondition
 from ..resolution.const import ContextType, IssueType, SuggestionType, UnhealthyReason
 from ..store.app import AppStore
+from ..utils.dt import utcnow
 from ..utils.sentry import async_capture_exception
 from .app import App
+from .boot import AppBootRecord, boot_dependencies
 from .const import APP_UPDATE_CONDITIONS
 from .data import AppsData
 
@@ -58,6 +59,8 @@ class AppManager(CoreSysAttributes):
         self.data: AppsData = AppsData(coresys)
         self.local: dict[str, App] = {}
         self.store: dict[str, AppStore] = {}
+        self.boot_timeline: dict[str, AppBootRecord] = {}
+        self.shutdown_durations: dict[str, float] = {}
 
     @property
     def all(self) -> list[AnyApp]:
@@ -144,30 +147,52 @@ class AppManager(CoreSysAttributes):
         if not tasks:
             return
 
-        # Start Apps sequential
-        # avoid issue on slow IO
-        # Config.wait_boot is deprecated. Until apps update with healthchecks,
-        # add a sleep task for it to keep the same minimum amount of wait time
-        wait_boot: list[Awaitable[None]] = [asyncio.sleep(self.sys_config.wait_boot)]
-        for app in tasks:
-            try:
-                if start_task := await app.start():
-                    wait_boot.append(start_task)
-            except HassioError:
-                self.sys_resolution.add_issue(
-                    replace(app.boot_failed_issue),
-                    suggestions=[
-                        SuggestionType.EXECUTE_START,
-                        SuggestionType.DISABLE_BOOT,
-                    ],
+        # Start apps in parallel up to the configured limit. An app waits until
+        # the apps providing the services it uses have finished starting.
+        dependencies = boot_dependencies(tasks)
+        semaphore = asyncio.Semaphore(self.sys_config.app_boot_concurrency)
+        boot_tasks: dict[str, asyncio.Task] = {}
+
+        async def _boot_app(app: App) -> None:
+            """Start app once its dependencies are started."""
+            record = self.boot_timeline[app.slug] = AppBootRecord(
+                app.slug, stage, utcnow(), sorted(dependencies[app.slug])
+            )
+            if dependencies[app.slug]:
+                await asyncio.wait(
+                    [boot_tasks[slug] for slug in dependencies[app.slug]]
                 )
-            else:
-                continue
 
-            _LOGGER.warning("Can't start app %s", app.slug)
+            async with semaphore:
+                record.started = utcnow()
+                try:
+                    start_task = await app.start()
+                except HassioError as err:
+                    record.error = str(err)
+                    self.sys_resolution.add_issue(
+                        replace(app.boot_failed_issue),
+                        suggestions=[
+                            SuggestionType.EXECUTE_START,
+                            SuggestionType.DISABLE_BOOT,
+                        ],
+                    )
+                    _LOGGER.warning("Can't start app %s", app.slug)
+                    return
+                record.running = utcnow()
+
+            # Ignore exceptions from waiting for app startup, app errors handled elsewhere
+            if start_task:
+                await asyncio.wait([start_task])
+            record.ready = utcnow()
 
-        # Ignore exceptions from waiting for app startup, app errors handled elsewhere
-        await asyncio.gather(*wait_boot, return_exceptions=True)
+        for app in tasks:
+            boot_tasks[app.slug] = self.sys_create_task(_boot_app(app))
+
+        # Config.wait_boot is deprecated. Until apps update with healthchecks,
+        # add a sleep task for it to keep the same minimum amount of wait time
+        await asyncio.gather(
+            asyncio.sleep(self.sys_config.wait_boot), *boot_tasks.values()
+        )
 
         # After waiting for startup, create an issue for boot apps that are error or unknown state
         # Ignore stopped as single shot apps can be run at boot and this is successful exit
@@ -195,14 +220,44 @@ class AppManager(CoreSysAttributes):
         if not tasks:
             return
 
-        # Stop Apps sequential
-        # avoid issue on slow IO
-        for app in tasks:
-            try:
-                await app.stop()
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't stop app %s: %s", app.slug, err)
-                await async_capture_exception(err)
+        # Stop apps in parallel up to the configured limit. If a deadline is set
+        # for the stage, the stop timeout of an app is capped to the time left.
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.sys_config.app_shutdown_concurrency)
+        deadline: float | None = None
+        if self.sys_config.app_shutdown_timeout:
+            deadline = loop.time() + self.sys_config.app_shutdown_timeout
+
+        async def _stop_app(app: App) -> None:
+            """Stop app within the deadline of the stage."""
+            async with semaphore:
+                timeout: int | None = None
+                if deadline is not None:
+                    timeout = max(0, min(app.timeout, int(deadline - loop.time())))
+
+                start = loop.time()
+                try:
+                    await app.stop(timeout=timeout)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Can't stop app %s: %s", app.slug, err)
+                    await async_capture_exception(err)
+                finally:
+                    self.shutdown_durations[app.slug] = loop.time() - start
+
+        start = loop.time()
+        await asyncio.gather(*(_stop_app(app) for app in tasks))
+
+        slowest = sorted(tasks, key=lambda app: self.shutdown_durations[app.slug])
+        _LOGGER.info(
+            "Phase '%s' stopped %d apps in %.1fs, slowest: %s",
+            stage,
+            len(tasks),
+            loop.time() - start,
+            ", ".join(
+                f"{app.slug} ({self.shutdown_durations[app.slug]:.1f}s)"
+                for app in reversed(slowest[-5:])
+            ),
+        )
 
     @Job(
         name="app_manager_install",
@@ -353,7 +408,7 @@ class AppManager(CoreSysAttributes):
         ],
         on_condition=AppsJobError,
     )
-    async def restore(self, slug: str, tar_file: SecureTarFile) -> asyncio.Task | None:
+    async def restore(self, slug: str, tar_file: InnerTarFile) -> asyncio.Task | None:
         """Restore state of an app.
 
         Returns a Task that completes when app has state 'started' (see app.start)
@@ -36,6 +36,9 @@ class BackendAuthRequest(TypedDict):
 class Auth(FileConfiguration, CoreSysAttributes):
     """Manage SSO for Apps with Home Assistant user."""
 
+    save_delay = 5
+    save_max_delay = 60
+
     def __init__(self, coresys: CoreSys) -> None:
         """Initialize updater."""
         super().__init__(FILE_HASSIO_AUTH, SCHEMA_AUTH_CONFIG)
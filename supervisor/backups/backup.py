@@ -2,11 +2,12 @@
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Awaitable
-from contextlib import asynccontextmanager, suppress
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from contextlib import ExitStack, asynccontextmanager, suppress
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import partial
 import io
 import json
 import logging
@@ -14,15 +15,18 @@ from pathlib import Path, PurePath
 import tarfile
 from tempfile import TemporaryDirectory
 import time
-from typing import Any, Self, cast
+from typing import IO, Any, Self, cast
 
 from awesomeversion import AwesomeVersion, AwesomeVersionCompareException
 from securetar import (
     AddFileError,
     InvalidPasswordError,
     SecureTarArchive,
+    SecureTarDecryptStream,
+    SecureTarError,
     SecureTarFile,
     SecureTarReadError,
+    SecureTarRootKeyContext,
     atomic_contents_add,
 )
 import voluptuous as vol
@@ -32,6 +36,8 @@ from ..apps.manager import App
 from ..const import (
     ATTR_ADDONS,
     ATTR_COMPRESSED,
+    ATTR_COMPRESSION,
+    ATTR_COMPRESSION_LEVEL,
     ATTR_DATE,
     ATTR_DOCKER,
     ATTR_EXCLUDE_DATABASE,
@@ -39,6 +45,7 @@ from ..const import (
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PROTECTED,
     ATTR_REGISTRIES,
     ATTR_REPOSITORIES,
@@ -47,10 +54,12 @@ from ..const import (
     ATTR_SUPERVISOR_VERSION,
     ATTR_TYPE,
     ATTR_VERSION,
+    BackupCompression,
 )
 from ..coresys import CoreSys
 from ..exceptions import (
     AppsError,
+    BackupChainError,
     BackupError,
     BackupFatalIOError,
     BackupFileExistError,
@@ -73,12 +82,16 @@ from ..utils.sentinel import DEFAULT
 from ..validate import SCHEMA_DOCKER_CONFIG
 from .const import (
     BUF_SIZE,
+    COMPRESSION_LEVEL_MAX,
+    COMPRESSION_SUFFIX,
     CORE_SECURETAR_V3_MIN_VERSION,
     LOCATION_CLOUD_BACKUP,
     SECURETAR_CREATE_VERSION,
     SECURETAR_V3_CREATE_VERSION,
     BackupType,
 )
+from .manifest import MANIFEST_JSON, FolderManifest, files_by_source
+from .utils import InnerTarFile
 from .validate import SCHEMA_BACKUP
 
 IGNORED_COMPARISON_FIELDS = {ATTR_PROTECTED, ATTR_DOCKER}
@@ -95,6 +108,151 @@ class BackupLocation:
     size_bytes: int
 
 
+class _StagedTarFile:
+    """Inner tar file which is written to a temporary file first.
+
+    Used in place of SecureTarArchive.create_tar, so several inner tar files
+    can be compressed in parallel and added to the backup in order afterwards,
+    and for codecs or levels SecureTarArchive can't stream. If on_done is set,
+    it is called with the staged tar file once it was written successfully.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        *,
+        compression: BackupCompression | None,
+        level: int | None = None,
+        on_done: Callable[[_StagedTarFile], None] | None = None,
+    ) -> None:
+        """Initialize staged tar file."""
+        self.path: Path = path
+        self.name: str = name
+        self.done: bool = False
+        self.app_data: dict[str, Any] | None = None
+        self.manifest: dict[str, list[Any]] | None = None
+        self._compression: BackupCompression | None = compression
+        self._level: int | None = level
+        self._on_done = on_done
+        self._size: int = 0
+        self._tar: tarfile.TarFile | None = None
+
+    def __enter__(self) -> tarfile.TarFile:
+        """Open temporary tar file."""
+        match self._compression:
+            case BackupCompression.GZIP:
+                self._tar = tarfile.open(
+                    self.path, "w:gz", bufsize=BUF_SIZE, compresslevel=self._level or 6
+                )
+            case BackupCompression.ZSTD:
+                self._tar = tarfile.open(
+                    self.path, "w:zst", bufsize=BUF_SIZE, level=self._level
+                )
+            case _:
+                self._tar = tarfile.open(self.path, "w:", bufsize=BUF_SIZE)
+        return self._tar
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close temporary tar file."""
+        if self._tar:
+            self._tar.close()
+            self._tar = None
+        self.done = exc_type is None
+
+        if not self.done:
+            self.path.unlink(missing_ok=True)
+            return
+
+        self._size = self.path.stat().st_size
+        if self._on_done:
+            self._on_done(self)
+
+    @property
+    def size(self) -> int:
+        """Return size of temporary tar file."""
+        return self._size
+
+    def add_to(self, archive: SecureTarArchive, *, encrypted: bool) -> None:
+        """Add temporary tar file to archive and remove it."""
+        tar_info = tarfile.TarInfo(name=self.name)
+        tar_info.size = self.size
+        tar_info.mtime = time.time()
+        try:
+            with self.path.open("rb") as file:
+                if encrypted:
+                    archive.import_tar(file, tar_info)
+                else:
+                    archive.tar.addfile(tar_info, file)
+        finally:
+            self.path.unlink(missing_ok=True)
+
+
+class _ZstdTarReader:
+    """Read a zstd compressed inner tar file, optionally encrypted.
+
+    SecureTarFile only handles gzip, so the decrypted stream is opened as zstd
+    tar file here.
+    """
+
+    def __init__(
+        self,
+        name: Path | None = None,
+        *,
+        fileobj: IO[bytes] | None = None,
+        password: str | None = None,
+    ) -> None:
+        """Initialize zstd tar file reader."""
+        if name is None and fileobj is None:
+            raise ValueError("Either filename or fileobj must be provided")
+        self._name: Path | None = name
+        self._fileobj: IO[bytes] | None = fileobj
+        self._password: str | None = password
+        self._stack: ExitStack | None = None
+
+    def __enter__(self) -> tarfile.TarFile:
+        """Open tar file, decrypting it if a password is set."""
+        with ExitStack() as stack:
+            file = self._fileobj or stack.enter_context(
+                cast(Path, self._name).open("rb")
+            )
+            if self._password is not None:
+                file = stack.enter_context(
+                    SecureTarDecryptStream(
+                        file,
+                        root_key_context=SecureTarRootKeyContext(self._password),
+                    )
+                )
+            tar = stack.enter_context(
+                tarfile.open(fileobj=file, mode="r|zst", bufsize=BUF_SIZE)
+            )
+            self._stack = stack.pop_all()
+        return tar
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close tar file and the files below it."""
+        if self._stack:
+            self._stack.close()
+            self._stack = None
+
+
+def _log_throughput(name: str, size: int, duration: float) -> dict[str, Any]:
+    """Log and return size and throughput of a stored folder or app."""
+    throughput = size / duration if duration > 0 else 0.0
+    _LOGGER.info(
+        "Stored %s with %.1f MiB in %.1fs (%.1f MiB/s)",
+        name,
+        size / 1_048_576,
+        duration,
+        throughput / 1_048_576,
+    )
+    return {
+        "size_bytes": size,
+        "duration": round(duration, 3),
+        "throughput": round(throughput),
+    }
+
+
 def location_sort_key(value: str | None) -> str:
     """Sort locations, None is always first else alphabetical."""
     return value if value else ""
@@ -163,6 +321,25 @@ class Backup(JobGroup):
         """Return whether backup is compressed."""
         return self._data[ATTR_COMPRESSED]
 
+    @property
+    def compression(self) -> BackupCompression | None:
+        """Return codec of the inner tar files, None if uncompressed."""
+        if not self.compressed:
+            return None
+        return self._data[ATTR_COMPRESSION]
+
+    @property
+    def compression_level(self) -> int | None:
+        """Return compression level of the inner tar files, None for default."""
+        if not self.compressed:
+            return None
+        return self._data[ATTR_COMPRESSION_LEVEL]
+
+    @property
+    def parent(self) -> str | None:
+        """Return slug of parent backup if folders are stored incremental."""
+        return self._data[ATTR_PARENT]
+
     @property
     def apps(self) -> list[dict[str, Any]]:
         """Return the apps included in the backup."""
@@ -320,8 +497,13 @@ class Backup(JobGroup):
         password: str | None = None,
         compressed: bool = True,
         extra: dict | None = None,
+        *,
+        parent: str | None = None,
     ):
-        """Initialize a new backup."""
+        """Initialize a new backup.
+
+        With a parent, folders only store files changed since the parent.
+        """
         # Init metadata
         self._data[ATTR_VERSION] = 2
         self._data[ATTR_NAME] = name
@@ -329,6 +511,7 @@ class Backup(JobGroup):
         self._data[ATTR_TYPE] = sys_type
         self._data[ATTR_SUPERVISOR_VERSION] = self.sys_supervisor.version
         self._data[ATTR_EXTRA] = extra or {}
+        self._data[ATTR_PARENT] = parent
 
         # Add defaults
         self._data = SCHEMA_BACKUP(self._data)
@@ -342,6 +525,130 @@ class Backup(JobGroup):
 
         if not compressed:
             self._data[ATTR_COMPRESSED] = False
+            return
+
+        compression = self.sys_config.backup_compression
+        self._data[ATTR_COMPRESSION] = compression
+        if (level := self.sys_config.backup_compression_level) is not None:
+            self._data[ATTR_COMPRESSION_LEVEL] = min(
+                level, COMPRESSION_LEVEL_MAX[compression]
+            )
+
+    def _tar_name(self, name: str) -> str:
+        """Return file name of an inner tar file."""
+        if compression := self.compression:
+            return f"{name}.tar{COMPRESSION_SUFFIX[compression]}"
+        return f"{name}.tar"
+
+    def _create_inner_tar(self, tar_name: str) -> InnerTarFile:
+        """Create an inner tar file in the backup.
+
+        Uncompressed and default level gzip tar files are streamed into the
+        backup. Others are written next to the backup and added once complete.
+        """
+        if not self._outer_secure_tarfile:
+            raise RuntimeError(
+                "Cannot backup components without initializing backup tar"
+            )
+
+        if self.compression_level is None and self.compression in (
+            None,
+            BackupCompression.GZIP,
+        ):
+            return self._outer_secure_tarfile.create_tar(
+                f"./{tar_name}",
+                gzip=self.compressed,
+            )
+
+        return _StagedTarFile(
+            self.tarfile.with_name(f".{self.tarfile.stem}_{tar_name}"),
+            f"./{tar_name}",
+            compression=self.compression,
+            level=self.compression_level,
+            on_done=partial(
+                _StagedTarFile.add_to,
+                archive=self._outer_secure_tarfile,
+                encrypted=self._password is not None,
+            ),
+        )
+
+    def _open_inner_tar(
+        self, tar_path: Path | None = None, fileobj: IO[bytes] | None = None
+    ) -> InnerTarFile:
+        """Open an inner tar file of the backup for reading."""
+        if self.compression == BackupCompression.ZSTD:
+            return _ZstdTarReader(tar_path, fileobj=fileobj, password=self._password)
+
+        return SecureTarFile(
+            tar_path,
+            fileobj=fileobj,
+            gzip=self.compressed,
+            bufsize=BUF_SIZE,
+            password=self._password,
+        )
+
+    def _read_manifest(
+        self, tar_path: Path | None = None, fileobj: IO[bytes] | None = None
+    ) -> dict[str, list[Any]]:
+        """Read a folder manifest from its inner tar file."""
+        with self._open_inner_tar(tar_path, fileobj) as tar_file:
+            for member in tar_file:
+                if member.name == MANIFEST_JSON and (
+                    file := tar_file.extractfile(member)
+                ):
+                    return json.loads(file.read())
+        return {}
+
+    def _read_folder_manifest(self, name: str) -> dict[str, list[Any]] | None:
+        """Read manifest of a folder from backup file, None if it has none."""
+        slug_name = name.replace("/", "_")
+        with tarfile.open(self.tarfile, "r:") as backup:
+            try:
+                manifest = backup.extractfile(
+                    f"./{self._tar_name(f'{slug_name}.manifest')}"
+                )
+            except KeyError:
+                return None
+            return self._read_manifest(fileobj=manifest)
+
+    def _write_folder_manifest(self, name: str, files: dict[str, list[Any]]) -> None:
+        """Write manifest of a folder to backup."""
+        slug_name = name.replace("/", "_")
+        manifest_json = json_bytes(files)
+        with self._create_inner_tar(
+            self._tar_name(f"{slug_name}.manifest")
+        ) as tar_file:
+            tarinfo = tarfile.TarInfo(name=MANIFEST_JSON)
+            tarinfo.size = len(manifest_json)
+            tar_file.addfile(tarinfo, io.BytesIO(manifest_json))
+
+    def _extract_folder_files(
+        self, name: str, origin_dir: Path, files: set[str]
+    ) -> None:
+        """Extract files of a folder from backup file.
+
+        Used to restore files an incremental backup kept in a parent backup.
+        """
+        slug_name = name.replace("/", "_")
+        missing = set(files)
+
+        with tarfile.open(self.tarfile, "r:") as backup:
+            folder_tar = backup.extractfile(f"./{self._tar_name(slug_name)}")
+            with self._open_inner_tar(fileobj=folder_tar) as tar_file:
+
+                def _members() -> Generator[tarfile.TarInfo]:
+                    for member in tar_file:
+                        if member.name in missing:
+                            missing.discard(member.name)
+                            yield member
+
+                tar_file.extractall(path=origin_dir, members=_members(), filter="tar")
+
+        if missing:
+            raise BackupInvalidError(
+                f"Can't find {len(missing)} files of folder {name} in backup {self.slug}",
+                _LOGGER.warning,
+            )
 
     def set_password(self, password: str | None) -> None:
         """Set the password for an existing backup.
@@ -360,7 +667,7 @@ class Backup(JobGroup):
         backup_file: Path = self.all_locations[location].path
 
         def _validate_file() -> None:
-            ending = f".tar{'.gz' if self.compressed else ''}"
+            ending = self._tar_name("")
 
             with tarfile.open(backup_file, "r:") as backup:
                 test_tar_name = next(
@@ -377,11 +684,7 @@ class Backup(JobGroup):
 
                 test_tar_file = backup.extractfile(test_tar_name)
                 try:
-                    with SecureTarFile(
-                        gzip=self.compressed,
-                        fileobj=test_tar_file,
-                        password=self._password,
-                    ):
+                    with self._open_inner_tar(fileobj=test_tar_file):
                         # If we can read the tar file, the password is correct
                         return
                 except (
@@ -612,9 +915,73 @@ class Backup(JobGroup):
             self.sys_jobs.current.capture_error(BackupError("Can't write backup"))
             _LOGGER.error("Can't write backup: %s", err)
 
+    def _new_staged_tar(self, staging_dir: Path, tar_name: str) -> _StagedTarFile:
+        """Return a tar file staged in directory for parallel archiving."""
+        return _StagedTarFile(
+            staging_dir / tar_name,
+            f"./{tar_name}",
+            compression=self.compression,
+            level=self.compression_level,
+        )
+
+    @asynccontextmanager
+    async def _staging(
+        self,
+        items: list[Any],
+        stage: Callable[[Any, Path], Awaitable[_StagedTarFile | None]],
+    ) -> AsyncGenerator[list[tuple[Any, asyncio.Task[_StagedTarFile | None]]]]:
+        """Stage inner tar files of items in parallel in a temporary directory.
+
+        Yields the staging task of each item in order, at most backup
+        concurrency of them run at the same time.
+        """
+        staging_dir = await self.sys_run_in_executor(
+            TemporaryDirectory, dir=self.tarfile.parent
+        )
+        semaphore = asyncio.Semaphore(self.sys_config.backup_concurrency)
+
+        async def _stage(item: Any) -> _StagedTarFile | None:
+            async with semaphore:
+                return await stage(item, Path(staging_dir.name))
+
+        tasks = [self.sys_create_task(_stage(item)) for item in items]
+        try:
+            yield list(zip(items, tasks, strict=True))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.sys_run_in_executor(staging_dir.cleanup)
+
+    async def _add_staged(self, staged: _StagedTarFile) -> None:
+        """Add a staged inner tar file to the backup."""
+        if not self._outer_secure_tarfile:
+            raise RuntimeError(
+                "Cannot backup components without initializing backup tar"
+            )
+
+        try:
+            await self.sys_run_in_executor(
+                partial(
+                    staged.add_to,
+                    self._outer_secure_tarfile,
+                    encrypted=self._password is not None,
+                )
+            )
+        except (OSError, SecureTarError) as err:
+            raise BackupFatalIOError(
+                f"Can't write tarfile: {err!s}", _LOGGER.error
+            ) from err
+
     @Job(name="backup_app_save", cleanup=False)
-    async def _app_save(self, app: App) -> asyncio.Task | None:
-        """Store an app into backup."""
+    async def _app_save(
+        self, app: App, staged: _StagedTarFile | None = None
+    ) -> asyncio.Task | None:
+        """Store an app into backup.
+
+        If a staged tar file is given the app is written to it and only added
+        to the backup data once the staged tar file was added to the backup.
+        """
         self.sys_jobs.current.reference = slug = app.slug
         if not self._outer_secure_tarfile:
             raise RuntimeError(
@@ -629,30 +996,34 @@ class Backup(JobGroup):
             )
             return None
 
-        tar_name = f"{slug}.tar{'.gz' if self.compressed else ''}"
+        app_file = staged or self._create_inner_tar(self._tar_name(slug))
+        outer_tar = self._outer_secure_tarfile.tar
+        offset = outer_tar.offset
+        start = time.monotonic()
 
-        app_file = self._outer_secure_tarfile.create_tar(
-            f"./{tar_name}",
-            gzip=self.compressed,
-        )
         # Take backup
         try:
             start_task = await curr_app.backup(app_file)
         except AppsError as err:
             raise BackupError(str(err)) from err
 
-        # Store to config
-        self._data[ATTR_ADDONS].append(
-            {
-                ATTR_SLUG: slug,
-                ATTR_NAME: curr_app.name,
-                ATTR_VERSION: curr_app.version,
-                # Bug - addon_file.size used to give us this information
-                # It always returns 0 in current securetar. Skipping until fixed
-                ATTR_SIZE: 0,
-            }
+        size = staged.size if staged else outer_tar.offset - offset
+        self.sys_jobs.current.extra = _log_throughput(
+            f"app {slug}", size, time.monotonic() - start
         )
 
+        # Store to config
+        app_data = {
+            ATTR_SLUG: slug,
+            ATTR_NAME: curr_app.name,
+            ATTR_VERSION: curr_app.version,
+            ATTR_SIZE: round(size / 1_048_576, 2),
+        }
+        if staged:
+            staged.app_data = app_data
+        else:
+            self._data[ATTR_ADDONS].append(app_data)
+
         return start_task
 
     @Job(name="backup_store_apps", cleanup=False)
@@ -662,16 +1033,41 @@ class Backup(JobGroup):
         For each app that needs to be started after backup, returns a Task which
         completes when that app has state 'started' (see app.start).
         """
-        # Save Apps sequential avoid issue on slow IO
         start_tasks: list[asyncio.Task] = []
-        for app in app_list:
-            try:
-                if start_task := await self._app_save(app):
-                    start_tasks.append(start_task)
-            except BackupFatalIOError:
-                raise
-            except BackupError as err:
-                self.sys_jobs.current.capture_error(err)
+
+        # Save Apps sequential avoid issue on slow IO
+        if self.sys_config.backup_concurrency == 1:
+            for app in app_list:
+                try:
+                    if start_task := await self._app_save(app):
+                        start_tasks.append(start_task)
+                except BackupFatalIOError:
+                    raise
+                except BackupError as err:
+                    self.sys_jobs.current.capture_error(err)
+
+            return start_tasks
+
+        # Save Apps in parallel and add them to the backup in order
+        async def _stage(app: App, staging_dir: Path) -> _StagedTarFile:
+            staged = self._new_staged_tar(staging_dir, self._tar_name(app.slug))
+            if start_task := await self._app_save(app, staged):
+                start_tasks.append(start_task)
+            return staged
+
+        async with self._staging(app_list, _stage) as staging:
+            for _, task in staging:
+                try:
+                    staged = await task
+                except BackupFatalIOError:
+                    raise
+                except BackupError as err:
+                    self.sys_jobs.current.capture_error(err)
+                    continue
+
+                if staged and staged.done and staged.app_data:
+                    await self._add_staged(staged)
+                    self._data[ATTR_ADDONS].append(staged.app_data)
 
         return start_tasks
 
@@ -682,19 +1078,13 @@ class Backup(JobGroup):
         if not self._tmp:
             raise RuntimeError("Cannot restore components without opening backup tar")
 
-        tar_name = f"{app_slug}.tar{'.gz' if self.compressed else ''}"
-        tar_path = Path(self._tmp.name, tar_name)
+        tar_path = Path(self._tmp.name, self._tar_name(app_slug))
 
         # Verify the backup exists before trying to restore it
         if not await self.sys_run_in_executor(tar_path.exists):
             raise BackupError(f"Can't find backup {app_slug}", _LOGGER.error)
 
-        app_file = SecureTarFile(
-            tar_path,
-            gzip=self.compressed,
-            bufsize=BUF_SIZE,
-            password=self._password,
-        )
+        app_file = self._open_inner_tar(tar_path)
 
         # Perform a restore
         try:
@@ -745,9 +1135,63 @@ class Backup(JobGroup):
 
         return success
 
+    async def _parent_manifests(
+        self, folder_list: list[str]
+    ) -> dict[str, dict[str, list[Any]] | None]:
+        """Read folder manifests of parent backup.
+
+        Folders without a readable manifest in the parent are stored in full.
+        """
+        if not self.parent:
+            return {}
+
+        if not (parent := self.sys_backups.get(self.parent)):
+            raise BackupChainError(
+                f"Parent backup {self.parent} does not exist", _LOGGER.error
+            )
+
+        manifests: dict[str, dict[str, list[Any]] | None] = {}
+        for folder in folder_list:
+            try:
+                manifests[folder] = await self.sys_run_in_executor(
+                    parent._read_folder_manifest,  # pylint: disable=protected-access
+                    folder,
+                )
+            except (OSError, tarfile.TarError, SecureTarError) as err:
+                _LOGGER.warning(
+                    "Can't read manifest of folder %s in backup %s, storing it in full: %s",
+                    folder,
+                    parent.slug,
+                    err,
+                )
+                manifests[folder] = None
+
+        return manifests
+
+    async def _add_folder_manifest(
+        self, name: str, files: dict[str, list[Any]]
+    ) -> None:
+        """Add manifest of a staged folder to the backup."""
+        try:
+            await self.sys_run_in_executor(self._write_folder_manifest, name, files)
+        except OSError as err:
+            raise BackupFatalIOError(
+                f"Can't write tarfile: {err!s}", _LOGGER.error
+            ) from err
+
     @Job(name="backup_folder_save", cleanup=False)
-    async def _folder_save(self, name: str):
-        """Take backup of a folder."""
+    async def _folder_save(
+        self,
+        name: str,
+        staged: _StagedTarFile | None = None,
+        parent_manifest: dict[str, list[Any]] | None = None,
+    ):
+        """Take backup of a folder.
+
+        If a staged tar file is given the folder is written to it and only
+        added to the backup data once the staged tar file was added to the
+        backup. Files unchanged since the parent manifest are skipped.
+        """
         self.sys_jobs.current.reference = name
         if not self._outer_secure_tarfile:
             raise RuntimeError(
@@ -755,15 +1199,14 @@ class Backup(JobGroup):
             )
 
         outer_secure_tarfile = self._outer_secure_tarfile
-        slug_name = name.replace("/", "_")
-        tar_name = f"{slug_name}.tar{'.gz' if self.compressed else ''}"
+        tar_name = self._tar_name(name.replace("/", "_"))
         origin_dir = Path(self.sys_config.path_supervisor, name)
 
-        def _save() -> bool:
+        def _save() -> int | None:
             # Check if exists
             if not origin_dir.is_dir():
                 _LOGGER.warning("Can't find backup folder %s", name)
-                return False
+                return None
 
             # Take backup
             _LOGGER.info("Backing up folder %s", name)
@@ -773,21 +1216,22 @@ class Backup(JobGroup):
             excluded_paths = {
                 bound.bind_mount.local_where for bound in self.sys_mounts.bound_mounts
             }
+            manifest = FolderManifest(
+                self.slug, parent_manifest if self.parent else None
+            )
 
             def is_excluded_by_filter(item_arcpath: PurePath) -> bool:
-                """Filter out bind mounts in folders being backed up."""
+                """Filter out bind mounts and unchanged files in folders being backed up."""
                 full_path = origin_dir / item_arcpath.relative_to(".")
 
                 if full_path in excluded_paths:
                     _LOGGER.debug("Ignoring %s because of bind mount", full_path)
                     return True
 
-                return False
+                return manifest.is_unchanged(item_arcpath, full_path)
 
-            with outer_secure_tarfile.create_tar(
-                f"./{tar_name}",
-                gzip=self.compressed,
-            ) as tar_file:
+            offset = outer_secure_tarfile.tar.offset
+            with staged or self._create_inner_tar(tar_name) as tar_file:
                 atomic_contents_add(
                     tar_file,
                     origin_dir,
@@ -795,12 +1239,31 @@ class Backup(JobGroup):
                     arcname=".",
                 )
 
+            if manifest.unchanged:
+                _LOGGER.info(
+                    "Skipped %d files of folder %s unchanged since backup %s",
+                    manifest.unchanged,
+                    name,
+                    self.parent,
+                )
             _LOGGER.info("Backup folder %s done", name)
-            return True
+
+            if staged:
+                staged.manifest = manifest.files
+                return staged.size
+
+            size = outer_secure_tarfile.tar.offset - offset
+            self._write_folder_manifest(name, manifest.files)
+            return size
 
         try:
-            if await self.sys_run_in_executor(_save):
-                self._data[ATTR_FOLDERS].append(name)
+            start = time.monotonic()
+            if (size := await self.sys_run_in_executor(_save)) is not None:
+                self.sys_jobs.current.extra = _log_throughput(
+                    f"folder {name}", size, time.monotonic() - start
+                )
+                if not staged:
+                    self._data[ATTR_FOLDERS].append(name)
         except OSError as err:
             raise BackupFatalIOError(
                 f"Can't write tarfile: {err!s}", _LOGGER.error
@@ -811,17 +1274,49 @@ class Backup(JobGroup):
     @Job(name="backup_store_folders", cleanup=False)
     async def store_folders(self, folder_list: list[str]):
         """Backup Supervisor data into backup."""
+        parent_manifests = await self._parent_manifests(folder_list)
+
         # Save folder sequential avoid issue on slow IO
-        for folder in folder_list:
-            try:
-                await self._folder_save(folder)
-            except BackupFatalIOError:
-                raise
-            except BackupError as err:
-                err = BackupError(
-                    f"Can't backup folder {folder}: {str(err)}", _LOGGER.error
-                )
-                self.sys_jobs.current.capture_error(err)
+        if self.sys_config.backup_concurrency == 1:
+            for folder in folder_list:
+                try:
+                    await self._folder_save(
+                        folder, parent_manifest=parent_manifests.get(folder)
+                    )
+                except BackupFatalIOError:
+                    raise
+                except BackupError as err:
+                    err = BackupError(
+                        f"Can't backup folder {folder}: {str(err)}", _LOGGER.error
+                    )
+                    self.sys_jobs.current.capture_error(err)
+            return
+
+        # Save folders in parallel and add them to the backup in order
+        async def _stage(folder: str, staging_dir: Path) -> _StagedTarFile:
+            staged = self._new_staged_tar(
+                staging_dir, self._tar_name(folder.replace("/", "_"))
+            )
+            await self._folder_save(folder, staged, parent_manifests.get(folder))
+            return staged
+
+        async with self._staging(folder_list, _stage) as staging:
+            for folder, task in staging:
+                try:
+                    staged = await task
+                except BackupFatalIOError:
+                    raise
+                except BackupError as err:
+                    err = BackupError(
+                        f"Can't backup folder {folder}: {str(err)}", _LOGGER.error
+                    )
+                    self.sys_jobs.current.capture_error(err)
+                    continue
+
+                if staged and staged.done:
+                    await self._add_staged(staged)
+                    await self._add_folder_manifest(folder, staged.manifest or {})
+                    self._data[ATTR_FOLDERS].append(folder)
 
     @Job(name="backup_folder_restore", cleanup=False)
     async def _folder_restore(self, name: str) -> None:
@@ -831,11 +1326,34 @@ class Backup(JobGroup):
             raise RuntimeError("Cannot restore components without opening backup tar")
 
         slug_name = name.replace("/", "_")
-        tar_name = Path(
-            self._tmp.name, f"{slug_name}.tar{'.gz' if self.compressed else ''}"
-        )
+        tar_name = Path(self._tmp.name, self._tar_name(slug_name))
+        manifest_name = Path(self._tmp.name, self._tar_name(f"{slug_name}.manifest"))
         origin_dir = Path(self.sys_config.path_supervisor, name)
 
+        def _restore_from_parents() -> None:
+            """Restore files an incremental backup kept in parent backups."""
+            if not manifest_name.exists():
+                raise BackupInvalidError(
+                    f"Can't find manifest of folder {name}", _LOGGER.warning
+                )
+
+            files = self._read_manifest(manifest_name)
+            for source, names in files_by_source(files, self.slug).items():
+                if not (backup := self.sys_backups.get(source)):
+                    raise BackupChainError(
+                        f"Can't restore folder {name}, backup {source} holding {len(names)} of its files does not exist",
+                        _LOGGER.warning,
+                    )
+                _LOGGER.info(
+                    "Restore %d files of folder %s from backup %s",
+                    len(names),
+                    name,
+                    source,
+                )
+                backup._extract_folder_files(  # pylint: disable=protected-access
+                    name, origin_dir, names
+                )
+
         # Perform a restore
         def _restore() -> None:
             # Check if exists inside backup
@@ -850,18 +1368,15 @@ class Backup(JobGroup):
 
             try:
                 _LOGGER.info("Restore folder %s", name)
-                with SecureTarFile(
-                    tar_name,
-                    gzip=self.compressed,
-                    bufsize=BUF_SIZE,
-                    password=self._password,
-                ) as tar_file:
+                with self._open_inner_tar(tar_name) as tar_file:
                     # The tar filter rejects path traversal and absolute names,
                     # aborting restore of potentially crafted backups.
                     tar_file.extractall(
                         path=origin_dir,
                         filter="tar",
                     )
+                if self.parent:
+                    _restore_from_parents()
                 _LOGGER.info("Restore folder %s done", name)
             except tarfile.FilterError as err:
                 raise BackupInvalidError(
@@ -917,19 +1432,19 @@ class Backup(JobGroup):
             ATTR_EXCLUDE_DATABASE: exclude_database,
         }
 
-        tar_name = f"homeassistant.tar{'.gz' if self.compressed else ''}"
         # Backup Home Assistant Core config directory
-        homeassistant_file = self._outer_secure_tarfile.create_tar(
-            f"./{tar_name}",
-            gzip=self.compressed,
-        )
+        homeassistant_file = self._create_inner_tar(self._tar_name("homeassistant"))
+        outer_tar = self._outer_secure_tarfile.tar
+        offset = outer_tar.offset
 
         await self.sys_homeassistant.backup(homeassistant_file, exclude_database)
 
-        # Store size
-        self._data[ATTR_HOMEASSISTANT][ATTR_SIZE] = await self.sys_run_in_executor(
-            getattr, homeassistant_file, "size"
-        )
+        # Store size in MB, like apps
+        if isinstance(homeassistant_file, _StagedTarFile):
+            size = homeassistant_file.size
+        else:
+            size = outer_tar.offset - offset
+        self._data[ATTR_HOMEASSISTANT][ATTR_SIZE] = round(size / 1_048_576, 2)
 
     @Job(name="backup_restore_homeassistant", cleanup=False)
     async def restore_homeassistant(self) -> Awaitable[None]:
@@ -940,15 +1455,8 @@ class Backup(JobGroup):
         await self.sys_homeassistant.core.stop(remove_container=True)
 
         # Restore Home Assistant Core config directory
-        tar_name = Path(
-            self._tmp.name, f"homeassistant.tar{'.gz' if self.compressed else ''}"
-        )
-        homeassistant_file = SecureTarFile(
-            tar_name,
-            gzip=self.compressed,
-            bufsize=BUF_SIZE,
-            password=self._password,
-        )
+        tar_name = Path(self._tmp.name, self._tar_name("homeassistant"))
+        homeassistant_file = self._open_inner_tar(tar_name)
 
         await self.sys_homeassistant.restore(
             homeassistant_file, self.homeassistant_exclude_database
@@ -1010,8 +1518,7 @@ class Backup(JobGroup):
 
         docker_data = {ATTR_REGISTRIES: registries}
 
-        outer_secure_tarfile = self._outer_secure_tarfile
-        tar_name = f"supervisor.tar{'.gz' if self.compressed else ''}"
+        tar_name = self._tar_name("supervisor")
 
         def _save() -> None:
             """Save supervisor config data to tar file."""
@@ -1021,10 +1528,7 @@ class Backup(JobGroup):
             mounts_json = json.dumps(mounts_data).encode("utf-8")
             docker_json = json.dumps(docker_data).encode("utf-8")
 
-            with outer_secure_tarfile.create_tar(
-                f"./{tar_name}",
-                gzip=self.compressed,
-            ) as tar_file:
+            with self._create_inner_tar(tar_name) as tar_file:
                 # Add mounts.json to tar
                 tarinfo = tarfile.TarInfo(name="mounts.json")
                 tarinfo.size = len(mounts_json)
@@ -1058,9 +1562,7 @@ class Backup(JobGroup):
         if not self._tmp:
             raise RuntimeError("Cannot restore components without opening backup tar")
 
-        tar_name = Path(
-            self._tmp.name, f"supervisor.tar{'.gz' if self.compressed else ''}"
-        )
+        tar_name = Path(self._tmp.name, self._tar_name("supervisor"))
 
         # Extract and parse supervisor data
         def _load_supervisor_data() -> tuple[
@@ -1074,12 +1576,7 @@ class Backup(JobGroup):
             mounts_data = None
             docker_data = None
 
-            with SecureTarFile(
-                tar_name,
-                gzip=self.compressed,
-                bufsize=BUF_SIZE,
-                password=self._password,
-            ) as tar_file:
+            with self._open_inner_tar(tar_name) as tar_file:
                 try:
                     member = tar_file.getmember("mounts.json")
                     file_obj = tar_file.extractfile(member)
@@ -5,6 +5,7 @@ from typing import Literal
 
 from awesomeversion import AwesomeVersion
 
+from ..const import BackupCompression
 from ..mounts.mount import Mount
 
 BUF_SIZE = 2**20 * 4  # 4MB
@@ -14,6 +15,19 @@ CORE_SECURETAR_V3_MIN_VERSION: AwesomeVersion = AwesomeVersion("2026.3.0")
 DEFAULT_FREEZE_TIMEOUT = 600
 LOCATION_CLOUD_BACKUP = ".cloud_backup"
 
+# Highest compression level supported by each codec
+COMPRESSION_LEVEL_MAX: dict[BackupCompression, int] = {
+    BackupCompression.GZIP: 9,
+    BackupCompression.ZSTD: 22,
+}
+COMPRESSION_SUFFIX: dict[BackupCompression, str] = {
+    BackupCompression.GZIP: ".gz",
+    BackupCompression.ZSTD: ".zst",
+}
+
+ATTR_INODE = "inode"
+ATTR_MTIME = "mtime"
+
 LOCATION_TYPE = Mount | Literal[".cloud_backup"] | None
 
 
@@ -0,0 +1,90 @@
+"""Persistent index of backup metadata."""
+
+from collections.abc import Iterable
+import logging
+from os import stat_result
+from pathlib import Path
+from typing import Any
+
+from ..const import ATTR_DATA, ATTR_SIZE, FILE_HASSIO_BACKUP_INDEX
+from ..utils.common import FileConfiguration
+from .const import ATTR_INODE, ATTR_MTIME
+from .validate import SCHEMA_BACKUP_INDEX
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class BackupIndex(FileConfiguration):
+    """Cache backup.json metadata per backup location.
+
+    Entries are keyed by location path and tar file name and are only valid
+    while size, modification time and inode of the tar file are unchanged.
+    """
+
+    def __init__(self):
+        """Initialize backup index."""
+        super().__init__(FILE_HASSIO_BACKUP_INDEX, SCHEMA_BACKUP_INDEX)
+        self._changed: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Return true if index has unsaved changes."""
+        return self._changed
+
+    @staticmethod
+    def _stat_key(file_stat: stat_result) -> dict[str, int]:
+        """Return the fields identifying a version of a tar file."""
+        return {
+            ATTR_SIZE: file_stat.st_size,
+            ATTR_MTIME: file_stat.st_mtime_ns,
+            ATTR_INODE: file_stat.st_ino,
+        }
+
+    def get(
+        self, location_path: Path, tar_file: Path, file_stat: stat_result
+    ) -> dict[str, Any] | None:
+        """Return cached metadata for tar file if it did not change."""
+        entry = self._data.get(location_path.as_posix(), {}).get(tar_file.name)
+        if entry and all(
+            entry[key] == value for key, value in self._stat_key(file_stat).items()
+        ):
+            self.hits += 1
+            return entry[ATTR_DATA]
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        location_path: Path,
+        tar_file: Path,
+        file_stat: stat_result,
+        data: dict[str, Any],
+    ) -> None:
+        """Store metadata for tar file."""
+        self._data.setdefault(location_path.as_posix(), {})[tar_file.name] = (
+            self._stat_key(file_stat) | {ATTR_DATA: data}
+        )
+        self._changed = True
+
+    def remove(self, location_path: Path, tar_file: Path) -> None:
+        """Remove metadata for tar file."""
+        if self._data.get(location_path.as_posix(), {}).pop(tar_file.name, None):
+            self._changed = True
+
+    def prune(self, location_path: Path, tar_files: Iterable[Path]) -> None:
+        """Remove entries of tar files no longer present in location."""
+        if not (entries := self._data.get(location_path.as_posix())):
+            return
+
+        for name in entries.keys() - {tar_file.name for tar_file in tar_files}:
+            _LOGGER.debug("Removing %s/%s from backup index", location_path, name)
+            del entries[name]
+            self._changed = True
+
+    async def save_data(self) -> None:
+        """Store index to file."""
+        await super().save_data()
+        self._changed = False
@@ -8,11 +8,14 @@ import errno
 import logging
 from pathlib import Path
 from shutil import copy
-from typing import cast
+from typing import Self, cast
+
+import voluptuous as vol
 
 from ..apps.app import App
 from ..const import (
     ATTR_DAYS_UNTIL_STALE,
+    ATTR_SLUG,
     FILE_HASSIO_BACKUPS,
     FOLDER_HOMEASSISTANT,
     CoreState,
@@ -20,6 +23,7 @@ from ..const import (
 from ..coresys import CoreSys
 from ..dbus.const import UnitActiveState
 from ..exceptions import (
+    BackupChainError,
     BackupDataDiskBadMessageError,
     BackupError,
     BackupFileNotFoundError,
@@ -45,8 +49,9 @@ from .const import (
     BackupType,
     RestoreJobStage,
 )
+from .index import BackupIndex
 from .utils import create_slug
-from .validate import ALL_FOLDERS, SCHEMA_BACKUPS_CONFIG
+from .validate import ALL_FOLDERS, SCHEMA_BACKUP, SCHEMA_BACKUPS_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -62,6 +67,7 @@ class BackupManager(FileConfiguration, JobGroup):
         super().__init__(FILE_HASSIO_BACKUPS, SCHEMA_BACKUPS_CONFIG)
         super(FileConfiguration, self).__init__(coresys, JOB_GROUP_BACKUP_MANAGER)
         self._backups: dict[str, Backup] = {}
+        self._index: BackupIndex = BackupIndex()
         self._thaw_task: Awaitable[None] | None = None
         self._thaw_event: asyncio.Event = asyncio.Event()
 
@@ -70,6 +76,11 @@ class BackupManager(FileConfiguration, JobGroup):
         """Return a list of all backup objects."""
         return list(self._backups.values())
 
+    @property
+    def index(self) -> BackupIndex:
+        """Return persistent backup metadata index."""
+        return self._index
+
     @property
     def days_until_stale(self) -> int:
         """Get days until backup is considered stale."""
@@ -194,8 +205,11 @@ class BackupManager(FileConfiguration, JobGroup):
         )
         self.sys_jobs.current.stage = stage
 
-    async def _list_backup_files(self, path: Path) -> list[Path]:
-        """Return iterable of backup files, suppress and log OSError for network mounts."""
+    async def _list_backup_files(self, path: Path) -> list[Path] | None:
+        """Return iterable of backup files, suppress and log OSError for network mounts.
+
+        Returns None if the location could not be listed.
+        """
 
         def find_backups() -> list[Path]:
             # is_dir does a stat syscall which raises if the mount is down
@@ -214,7 +228,7 @@ class BackupManager(FileConfiguration, JobGroup):
                 self.sys_resolution.check_oserror(err)
             _LOGGER.error("Could not list backups from %s: %s", path.as_posix(), err)
 
-        return []
+        return None
 
     def _create_backup(
         self,
@@ -225,6 +239,7 @@ class BackupManager(FileConfiguration, JobGroup):
         compressed: bool = True,
         location: LOCATION_TYPE | type[DEFAULT] = DEFAULT,
         extra: dict | None = None,
+        parent: Backup | None = None,
     ) -> Backup:
         """Initialize a new backup object from name.
 
@@ -240,7 +255,15 @@ class BackupManager(FileConfiguration, JobGroup):
 
         # init object
         backup = Backup(self.coresys, tar_file, slug, self._get_location_name(location))
-        backup.new(name, date_str, sys_type, password, compressed, extra)
+        backup.new(
+            name,
+            date_str,
+            sys_type,
+            password,
+            compressed,
+            extra,
+            parent=parent.slug if parent else None,
+        )
 
         # Add backup ID to job
         self.sys_jobs.current.reference = backup.slug
@@ -250,19 +273,60 @@ class BackupManager(FileConfiguration, JobGroup):
 
         return backup
 
+    async def load_config(self) -> Self:
+        """Load config and backup index in executor."""
+        await super().load_config()
+        await self._index.read_data()
+        return self
+
     async def load(self) -> None:
         """Load exists backups data."""
         await self.reload()
 
+    async def _load_backup_metadata(
+        self, location_name: str | None, location_path: Path, tar_file: Path
+    ) -> Backup | None:
+        """Load backup metadata from index or tar file if it changed."""
+        try:
+            file_stat = await self.sys_run_in_executor(tar_file.stat)
+        except OSError as err:
+            _LOGGER.error("Can't access backup tarfile %s: %s", tar_file, err)
+            return None
+
+        if (data := self._index.get(location_path, tar_file, file_stat)) is not None:
+            try:
+                data = SCHEMA_BACKUP(data)
+            except vol.Invalid:
+                _LOGGER.debug("Index entry of %s is invalid, reading tarfile", tar_file)
+            else:
+                return Backup(
+                    self.coresys,
+                    tar_file,
+                    data[ATTR_SLUG],
+                    location_name,
+                    data,
+                    file_stat.st_size,
+                )
+
+        backup = Backup(self.coresys, tar_file, "temp", location_name)
+        if not await backup.load():
+            return None
+
+        self._index.set(location_path, tar_file, file_stat, backup.data)
+        return backup
+
     async def reload(self, location: str | None | type[DEFAULT] = DEFAULT) -> bool:
         """Load exists backups."""
 
         backups: dict[str, Backup] = {}
 
-        async def _load_backup(location_name: str | None, tar_file: Path) -> bool:
+        async def _load_backup(
+            location_name: str | None, location_path: Path, tar_file: Path
+        ) -> bool:
             """Load the backup."""
-            backup = Backup(self.coresys, tar_file, "temp", location_name)
-            if await backup.load():
+            if backup := await self._load_backup_metadata(
+                location_name, location_path, tar_file
+            ):
                 if backup.slug in backups:
                     try:
                         backups[backup.slug].consolidate(backup)
@@ -302,15 +366,28 @@ class BackupManager(FileConfiguration, JobGroup):
             *(self._list_backup_files(path) for _, path in location_items)
         )
         tasks = [
-            self.sys_create_task(_load_backup(_location, tar_file))
-            for (_location, _), tar_files in zip(location_items, location_files)
-            for tar_file in tar_files
+            self.sys_create_task(_load_backup(_location, path, tar_file))
+            for (_location, path), tar_files in zip(location_items, location_files)
+            for tar_file in tar_files or []
         ]
 
         _LOGGER.info("Found %d backup files", len(tasks))
+        hits, misses = self._index.hits, self._index.misses
         if tasks:
             await asyncio.wait(tasks)
 
+        # Drop index entries of removed files, unless location could not be listed
+        for (_, path), tar_files in zip(location_items, location_files):
+            if tar_files is not None:
+                self._index.prune(path, tar_files)
+        if self._index.changed:
+            await self._index.save_data()
+        _LOGGER.debug(
+            "Backup index: %d hits, %d misses",
+            self._index.hits - hits,
+            self._index.misses - misses,
+        )
+
         # For a full reload, replace our cache with new one
         if location == DEFAULT:
             self._backups = backups
@@ -353,11 +430,24 @@ class BackupManager(FileConfiguration, JobGroup):
             if locations
             else list(backup.all_locations.keys())
         )
+
+        # Incremental backups need their parent in at least one location
+        if set(targets) >= backup.all_locations.keys() and (
+            children := [
+                child.slug for child in self.list_backups if child.parent == backup.slug
+            ]
+        ):
+            raise BackupChainError(
+                f"Cannot remove backup {backup.slug}, incremental backups {', '.join(children)} depend on it",
+                _LOGGER.error,
+            )
+
         for location in targets:
             backup_tarfile = backup.all_locations[location].path
             try:
                 await self.sys_run_in_executor(backup_tarfile.unlink)
                 del backup.all_locations[location]
+                self._index.remove(backup_tarfile.parent, backup_tarfile)
             except FileNotFoundError as err:
                 self.sys_create_task(self.reload(location))
                 raise BackupFileNotFoundError(
@@ -370,6 +460,9 @@ class BackupManager(FileConfiguration, JobGroup):
                     self.sys_resolution.check_oserror(err)
                 raise BackupError(msg, _LOGGER.error) from err
 
+        if self._index.changed:
+            await self._index.save_data()
+
         # If backup has been removed from all locations, remove it from cache
         if not backup.all_locations:
             del self._backups[backup.slug]
@@ -509,6 +602,39 @@ class BackupManager(FileConfiguration, JobGroup):
 
         return backup
 
+    async def _get_parent(
+        self, parent: str | None, password: str | None
+    ) -> Backup | None:
+        """Return parent backup for an incremental backup, raise if invalid."""
+        if parent is None:
+            return None
+
+        if not (parent_backup := self.get(parent)):
+            raise BackupChainError(
+                f"Parent backup {parent} does not exist", _LOGGER.error
+            )
+        if parent_backup.protected != bool(password):
+            raise BackupChainError(
+                f"Incremental backup must use the same password as parent backup {parent}",
+                _LOGGER.error,
+            )
+
+        await self._validate_backup_location(parent_backup, password)
+        return parent_backup
+
+    def _validate_backup_chain(self, backup: Backup, password: str | None) -> None:
+        """Check parents of an incremental backup exist and set their password."""
+        chain: set[str] = {backup.slug}
+        while backup.parent:
+            if backup.parent in chain or not (parent := self.get(backup.parent)):
+                raise BackupChainError(
+                    f"Parent backup {backup.parent} of {backup.slug} does not exist",
+                    _LOGGER.error,
+                )
+            parent.set_password(password if parent.protected else None)
+            chain.add(parent.slug)
+            backup = parent
+
     async def _do_backup(
         self,
         backup: Backup,
@@ -606,9 +732,14 @@ class BackupManager(FileConfiguration, JobGroup):
         extra: dict | None = None,
         additional_locations: list[LOCATION_TYPE] | None = None,
         validation_complete: asyncio.Event | None = None,
+        parent: str | None = None,
     ) -> Backup | None:
-        """Create a full backup."""
+        """Create a full backup.
+
+        With a parent, folders only store files changed since the parent.
+        """
         await self._check_location(location)
+        parent_backup = await self._get_parent(parent, password)
 
         if self._get_base_path(location) in {
             self.sys_config.path_backup,
@@ -619,7 +750,14 @@ class BackupManager(FileConfiguration, JobGroup):
             )
 
         new_backup = self._create_backup(
-            name, filename, BackupType.FULL, password, compressed, location, extra
+            name,
+            filename,
+            BackupType.FULL,
+            password,
+            compressed,
+            location,
+            extra,
+            parent_backup,
         )
 
         # If being run in the background, notify caller that validation has completed
@@ -661,9 +799,14 @@ class BackupManager(FileConfiguration, JobGroup):
         extra: dict | None = None,
         additional_locations: list[LOCATION_TYPE] | None = None,
         validation_complete: asyncio.Event | None = None,
+        parent: str | None = None,
     ) -> Backup | None:
-        """Create a partial backup."""
+        """Create a partial backup.
+
+        With a parent, folders only store files changed since the parent.
+        """
         await self._check_location(location)
+        parent_backup = await self._get_parent(parent, password)
 
         if self._get_base_path(location) in {
             self.sys_config.path_backup,
@@ -685,7 +828,14 @@ class BackupManager(FileConfiguration, JobGroup):
             _LOGGER.error("Nothing to create backup for")
 
         new_backup = self._create_backup(
-            name, filename, BackupType.PARTIAL, password, compressed, location, extra
+            name,
+            filename,
+            BackupType.PARTIAL,
+            password,
+            compressed,
+            location,
+            extra,
+            parent_backup,
         )
 
         _LOGGER.info("Creating new partial backup with slug %s", new_backup.slug)
@@ -863,6 +1013,7 @@ class BackupManager(FileConfiguration, JobGroup):
             )
 
         await self._validate_backup_location(backup, password, location)
+        self._validate_backup_chain(backup, password)
 
         if backup.supervisor_version > self.sys_supervisor.version:
             raise BackupInvalidError(
@@ -934,6 +1085,8 @@ class BackupManager(FileConfiguration, JobGroup):
             homeassistant = True
 
         await self._validate_backup_location(backup, password, location)
+        if folder_list:
+            self._validate_backup_chain(backup, password)
 
         if backup.homeassistant is None and homeassistant:
             raise BackupInvalidError(
@@ -0,0 +1,80 @@
+"""Per-file manifest of folders stored in a backup."""
+
+from collections import defaultdict
+import hashlib
+from pathlib import Path, PurePath
+import stat
+from typing import Any
+
+MANIFEST_JSON = "manifest.json"
+
+# Manifest entries are lists of size, mtime in ns, sha256 hash (None if it was
+# not computed) and slug of the backup whose folder tar holds the content.
+ENTRY_SIZE = 0
+ENTRY_MTIME = 1
+ENTRY_HASH = 2
+ENTRY_SOURCE = 3
+
+
+def _file_hash(path: Path) -> str:
+    """Return sha256 hash of a file."""
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class FolderManifest:
+    """Build the manifest of a folder while it is backed up.
+
+    Regular files which did not change since the parent backup are only
+    recorded in the manifest, their content stays in the backup referenced
+    by the parent manifest. Changed files are hashed, so a file with new mtime
+    but same content is not stored again.
+    """
+
+    def __init__(self, slug: str, parent: dict[str, list[Any]] | None = None):
+        """Initialize folder manifest."""
+        self.slug: str = slug
+        self.files: dict[str, list[Any]] = {}
+        self.unchanged: int = 0
+        self._parent: dict[str, list[Any]] | None = parent
+
+    def is_unchanged(self, arcpath: PurePath, path: Path) -> bool:
+        """Record a file and return true if content is in the parent chain."""
+        file_stat = path.lstat()
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
+
+        arcname = arcpath.as_posix()
+        size, mtime = file_stat.st_size, file_stat.st_mtime_ns
+
+        # Full backups don't hash files, checking stat is enough to find the
+        # changed files once this backup is a parent
+        if self._parent is None:
+            self.files[arcname] = [size, mtime, None, self.slug]
+            return False
+
+        if (entry := self._parent.get(arcname)) and entry[ENTRY_SIZE] == size:
+            if entry[ENTRY_MTIME] == mtime:
+                self.files[arcname] = [size, mtime, *entry[ENTRY_HASH:]]
+                self.unchanged += 1
+                return True
+
+            file_hash = _file_hash(path)
+            if entry[ENTRY_HASH] == file_hash:
+                self.files[arcname] = [size, mtime, file_hash, entry[ENTRY_SOURCE]]
+                self.unchanged += 1
+                return True
+        else:
+            file_hash = _file_hash(path)
+
+        self.files[arcname] = [size, mtime, file_hash, self.slug]
+        return False
+
+
+def files_by_source(files: dict[str, list[Any]], slug: str) -> dict[str, set[str]]:
+    """Return files of a manifest stored in other backups than slug."""
+    sources: dict[str, set[str]] = defaultdict(set)
+    for arcname, entry in files.items():
+        if entry[ENTRY_SOURCE] != slug:
+            sources[entry[ENTRY_SOURCE]].add(arcname)
+    return sources
@@ -2,10 +2,28 @@
 
 import hashlib
 import re
+import tarfile
+from types import TracebackType
+from typing import Protocol
 
 RE_DIGITS = re.compile(r"\d+")
 
 
+class InnerTarFile(Protocol):
+    """Inner tar file of a backup, opened as tar file in a with statement."""
+
+    def __enter__(self) -> tarfile.TarFile:
+        """Open tar file."""
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close tar file."""
+
+
 def create_slug(name: str, date_str: str) -> str:
     """Generate a hash from repository."""
     key = f"{date_str} - {name}".lower().encode()
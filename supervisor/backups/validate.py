@@ -7,10 +7,13 @@ from typing import Any
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
 
-from ..backups.const import BackupType
+from ..backups.const import ATTR_INODE, ATTR_MTIME, BackupType
 from ..const import (
     ATTR_ADDONS,
     ATTR_COMPRESSED,
+    ATTR_COMPRESSION,
+    ATTR_COMPRESSION_LEVEL,
+    ATTR_DATA,
     ATTR_DATE,
     ATTR_DAYS_UNTIL_STALE,
     ATTR_EXCLUDE_DATABASE,
@@ -18,6 +21,7 @@ from ..const import (
     ATTR_FOLDERS,
     ATTR_HOMEASSISTANT,
     ATTR_NAME,
+    ATTR_PARENT,
     ATTR_PROTECTED,
     ATTR_REPOSITORIES,
     ATTR_SIZE,
@@ -30,6 +34,7 @@ from ..const import (
     FOLDER_MEDIA,
     FOLDER_SHARE,
     FOLDER_SSL,
+    BackupCompression,
 )
 from ..store.validate import repositories
 from ..validate import version_tag
@@ -92,9 +97,16 @@ SCHEMA_BACKUP = vol.Schema(
         vol.Required(ATTR_NAME): str,
         vol.Required(ATTR_DATE): str,
         vol.Optional(ATTR_COMPRESSED, default=True): vol.Boolean(),
+        vol.Optional(ATTR_COMPRESSION, default=BackupCompression.GZIP): vol.Coerce(
+            BackupCompression
+        ),
+        vol.Optional(ATTR_COMPRESSION_LEVEL, default=None): vol.Maybe(
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=22))
+        ),
         vol.Optional(ATTR_PROTECTED, default=False): vol.All(
             v1_protected, vol.Boolean()
         ),
+        vol.Optional(ATTR_PARENT, default=None): vol.Maybe(str),
         vol.Remove("crypto"): vol.Maybe("aes128"),
         vol.Optional(ATTR_HOMEASSISTANT, default=None): vol.All(
             v1_homeassistant,
@@ -140,3 +152,15 @@ SCHEMA_BACKUPS_CONFIG = vol.Schema(
     },
     extra=vol.REMOVE_EXTRA,
 )
+
+SCHEMA_BACKUP_INDEX_ENTRY = vol.Schema(
+    {
+        vol.Required(ATTR_SIZE): int,
+        vol.Required(ATTR_MTIME): int,
+        vol.Required(ATTR_INODE): int,
+        vol.Required(ATTR_DATA): dict,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+SCHEMA_BACKUP_INDEX = vol.Schema({str: {str: SCHEMA_BACKUP_INDEX_ENTRY}})
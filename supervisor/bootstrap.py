@@ -34,6 +34,7 @@ from .docker.manager import DockerAPI
 from .hardware.manager import HardwareManager
 from .homeassistant.module import HomeAssistant
 from .host.manager import HostManager
+from .http_cache import HttpCache
 from .ingress import Ingress
 from .jobs import JobManager
 from .misc.scheduler import Scheduler
@@ -74,6 +75,7 @@ async def initialize_coresys() -> CoreSys:
     coresys.plugins = await PluginManager(coresys).load_config()
     coresys.arch = CpuArchManager(coresys)
     coresys.auth = await Auth(coresys).load_config()
+    coresys.http_cache = await HttpCache(coresys).load_config()
     coresys.updater = await Updater(coresys).load_config()
     coresys.api = RestAPI(coresys)
     coresys.supervisor = Supervisor(coresys)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from asyncio import Task
-from collections.abc import Callable, Coroutine
-from dataclasses import dataclass
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import asdict, dataclass
 import logging
+from operator import attrgetter
 from typing import Any
 
 from .const import BusEvent
@@ -13,13 +14,44 @@ from .coresys import CoreSys, CoreSysAttributes
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Key of the reference of events with keyed listeners, see Bus.register_event
+EVENT_KEYS: dict[BusEvent, Callable[[Any], Hashable]] = {
+    BusEvent.DOCKER_CONTAINER_STATE_CHANGE: attrgetter("name"),
+    BusEvent.DOCKER_IMAGE_PULL_UPDATE: attrgetter("job_id"),
+}
 
-@dataclass(slots=True, frozen=True)
+# Unfinished tasks of a listener after which bounded events are dropped for it
+MAX_PENDING_TASKS = 100
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class EventListener:
     """Event listener."""
 
     event_type: BusEvent
-    callback: Callable[[Any], Coroutine[Any, Any, None]]
+    callback: Callable[[Any], Coroutine[Any, Any, None] | None]
+    key: Hashable | None = None
+    is_coroutine: bool = True
+
+
+@dataclass(slots=True)
+class EventStats:
+    """Dispatch counters and latency of an event type."""
+
+    fired: int = 0
+    calls: int = 0
+    dropped: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        """Add latency of a listener call, from firing the event until done."""
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary representation."""
+        return asdict(self)
 
 
 class Bus(CoreSysAttributes):
@@ -29,26 +61,123 @@ class Bus(CoreSysAttributes):
         """Initialize bus backend."""
         self.coresys = coresys
         self._listeners: dict[BusEvent, list[EventListener]] = {}
+        self._keyed_listeners: dict[tuple[BusEvent, Hashable], list[EventListener]] = {}
+        self._pending: dict[EventListener, int] = {}
+        self._stats: dict[BusEvent, EventStats] = {}
+
+    @property
+    def stats(self) -> dict[BusEvent, EventStats]:
+        """Return dispatch stats by event type."""
+        return self._stats
 
     def register_event(
-        self, event: BusEvent, callback: Callable[[Any], Coroutine[Any, Any, None]]
+        self,
+        event: BusEvent,
+        callback: Callable[[Any], Coroutine[Any, Any, None]],
+        *,
+        key: Hashable | None = None,
+    ) -> EventListener:
+        """Register callback for an event.
+
+        With a key the callback only gets events whose reference has this key,
+        only supported for events in EVENT_KEYS. Each call runs in a task.
+        """
+        return self._add_listener(EventListener(event, callback, key))
+
+    def register_callback(
+        self,
+        event: BusEvent,
+        callback: Callable[[Any], None],
+        *,
+        key: Hashable | None = None,
     ) -> EventListener:
-        """Register callback for an event."""
-        listener = EventListener(event, callback)
-        self._listeners.setdefault(event, []).append(listener)
+        """Register a sync callback for an event, called while firing it.
+
+        For cheap listeners of frequent events, which would spend more time on
+        creating a task than running. Must not block, errors are logged.
+        """
+        return self._add_listener(
+            EventListener(event, callback, key, is_coroutine=False)
+        )
+
+    def _add_listener(self, listener: EventListener) -> EventListener:
+        """Add listener to its event, by key if it has one."""
+        if listener.key is None:
+            self._listeners.setdefault(listener.event_type, []).append(listener)
+        elif listener.event_type in EVENT_KEYS:
+            self._keyed_listeners.setdefault(
+                (listener.event_type, listener.key), []
+            ).append(listener)
+        else:
+            raise ValueError(f"Event {listener.event_type} has no key for listeners")
         return listener
 
-    def fire_event(self, event: BusEvent, reference: Any) -> list[Task]:
-        """Fire an event to the bus."""
+    def fire_event(
+        self, event: BusEvent, reference: Any, *, bounded: bool = False
+    ) -> list[Task]:
+        """Fire an event to the bus.
+
+        Returns the tasks of coroutine listeners. A bounded event is dropped for
+        listeners with too many unfinished tasks, for producers of frequent
+        events which don't wait on listeners.
+        """
         _LOGGER.debug("Fire event '%s' with '%s'", event, reference)
+        stats = self._stats.setdefault(event, EventStats())
+        stats.fired += 1
+
+        listeners = self._listeners.get(event, [])
+        if (get_key := EVENT_KEYS.get(event)) and (
+            keyed := self._keyed_listeners.get((event, get_key(reference)))
+        ):
+            listeners = [*listeners, *keyed]
+
         tasks: list[Task] = []
-        for listener in self._listeners.get(event, []):
-            tasks.append(self.sys_create_task(listener.callback(reference)))
+        fired_at = self.sys_loop.time()
+        for listener in listeners:
+            if not listener.is_coroutine:
+                stats.calls += 1
+                try:
+                    listener.callback(reference)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in listener for event '%s'", event)
+                stats.add_latency(self.sys_loop.time() - fired_at)
+                continue
+
+            if bounded and self._pending.get(listener, 0) >= MAX_PENDING_TASKS:
+                stats.dropped += 1
+                continue
+
+            stats.calls += 1
+            task = self.sys_create_task(listener.callback(reference))
+            self._pending[listener] = self._pending.get(listener, 0) + 1
+            task.add_done_callback(
+                lambda _, listener=listener: self._listener_done(
+                    listener, stats, fired_at
+                )
+            )
+            tasks.append(task)
         return tasks
 
+    def _listener_done(
+        self, listener: EventListener, stats: EventStats, fired_at: float
+    ) -> None:
+        """Count finished task of a listener."""
+        stats.add_latency(self.sys_loop.time() - fired_at)
+        if (pending := self._pending[listener] - 1) > 0:
+            self._pending[listener] = pending
+        else:
+            del self._pending[listener]
+
     def remove_listener(self, listener: EventListener) -> None:
         """Unregister an listener."""
         try:
-            self._listeners[listener.event_type].remove(listener)
+            if listener.key is None:
+                self._listeners[listener.event_type].remove(listener)
+                return
+
+            listeners = self._keyed_listeners[(listener.event_type, listener.key)]
+            listeners.remove(listener)
+            if not listeners:
+                del self._keyed_listeners[(listener.event_type, listener.key)]
         except ValueError, KeyError:
             _LOGGER.warning("Listener %s not registered", listener)
@@ -9,7 +9,13 @@ from pathlib import Path, PurePath
 from awesomeversion import AwesomeVersion
 
 from .const import (
+    ATTR_APP_BOOT_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_TIMEOUT,
     ATTR_APPS_CUSTOM_LIST,
+    ATTR_BACKUP_COMPRESSION,
+    ATTR_BACKUP_COMPRESSION_LEVEL,
+    ATTR_BACKUP_CONCURRENCY,
     ATTR_COUNTRY,
     ATTR_DEBUG,
     ATTR_DEBUG_BLOCK,
@@ -17,6 +23,7 @@ from .const import (
     ATTR_DIAGNOSTICS,
     ATTR_FEATURE_FLAGS,
     ATTR_IMAGE,
+    ATTR_INGRESS_BUFFER_SIZE,
     ATTR_LAST_BOOT,
     ATTR_LOGGING,
     ATTR_TIMEZONE,
@@ -25,6 +32,7 @@ from .const import (
     ENV_SUPERVISOR_SHARE,
     FILE_HASSIO_CONFIG,
     SUPERVISOR_DATA,
+    BackupCompression,
     FeatureFlag,
     LogLevel,
 )
@@ -141,6 +149,76 @@ class CoreConfig(FileConfiguration):
         """Set wait boot time."""
         self._data[ATTR_WAIT_BOOT] = value
 
+    @property
+    def app_boot_concurrency(self) -> int:
+        """Return how many apps can be started in parallel during boot."""
+        return self._data[ATTR_APP_BOOT_CONCURRENCY]
+
+    @app_boot_concurrency.setter
+    def app_boot_concurrency(self, value: int) -> None:
+        """Set how many apps can be started in parallel during boot."""
+        self._data[ATTR_APP_BOOT_CONCURRENCY] = value
+
+    @property
+    def app_shutdown_concurrency(self) -> int:
+        """Return how many apps can be stopped in parallel during shutdown."""
+        return self._data[ATTR_APP_SHUTDOWN_CONCURRENCY]
+
+    @app_shutdown_concurrency.setter
+    def app_shutdown_concurrency(self, value: int) -> None:
+        """Set how many apps can be stopped in parallel during shutdown."""
+        self._data[ATTR_APP_SHUTDOWN_CONCURRENCY] = value
+
+    @property
+    def app_shutdown_timeout(self) -> int | None:
+        """Return deadline in seconds for stopping the apps of a startup stage."""
+        return self._data[ATTR_APP_SHUTDOWN_TIMEOUT]
+
+    @app_shutdown_timeout.setter
+    def app_shutdown_timeout(self, value: int | None) -> None:
+        """Set deadline in seconds for stopping the apps of a startup stage."""
+        self._data[ATTR_APP_SHUTDOWN_TIMEOUT] = value
+
+    @property
+    def backup_concurrency(self) -> int:
+        """Return how many folders or apps can be archived in parallel."""
+        return self._data[ATTR_BACKUP_CONCURRENCY]
+
+    @backup_concurrency.setter
+    def backup_concurrency(self, value: int) -> None:
+        """Set how many folders or apps can be archived in parallel."""
+        self._data[ATTR_BACKUP_CONCURRENCY] = value
+
+    @property
+    def backup_compression(self) -> BackupCompression:
+        """Return codec used to compress new backups."""
+        return self._data[ATTR_BACKUP_COMPRESSION]
+
+    @backup_compression.setter
+    def backup_compression(self, value: BackupCompression) -> None:
+        """Set codec used to compress new backups."""
+        self._data[ATTR_BACKUP_COMPRESSION] = value
+
+    @property
+    def backup_compression_level(self) -> int | None:
+        """Return compression level of new backups, None for codec default."""
+        return self._data[ATTR_BACKUP_COMPRESSION_LEVEL]
+
+    @backup_compression_level.setter
+    def backup_compression_level(self, value: int | None) -> None:
+        """Set compression level of new backups, None for codec default."""
+        self._data[ATTR_BACKUP_COMPRESSION_LEVEL] = value
+
+    @property
+    def ingress_buffer_size(self) -> int:
+        """Return maximum size of an ingress request body buffered in memory."""
+        return self._data[ATTR_INGRESS_BUFFER_SIZE]
+
+    @ingress_buffer_size.setter
+    def ingress_buffer_size(self, value: int) -> None:
+        """Set maximum size of an ingress request body buffered in memory."""
+        self._data[ATTR_INGRESS_BUFFER_SIZE] = value
+
     @property
     def debug(self) -> bool:
         """Return True if ptvsd is enabled."""
@@ -30,12 +30,14 @@ SUPERVISOR_DATA = Path("/data")
 FILE_HASSIO_ADDONS = Path(SUPERVISOR_DATA, "addons.json")
 FILE_HASSIO_APPS = Path(SUPERVISOR_DATA, "apps.json")
 FILE_HASSIO_AUTH = Path(SUPERVISOR_DATA, "auth.json")
+FILE_HASSIO_BACKUP_INDEX = Path(SUPERVISOR_DATA, "backup_index.json")
 FILE_HASSIO_BACKUPS = Path(SUPERVISOR_DATA, "backups.json")
 FILE_HASSIO_BOARD = Path(SUPERVISOR_DATA, "board.json")
 FILE_HASSIO_CONFIG = Path(SUPERVISOR_DATA, "config.json")
 FILE_HASSIO_DISCOVERY = Path(SUPERVISOR_DATA, "discovery.json")
 FILE_HASSIO_DOCKER = Path(SUPERVISOR_DATA, "docker.json")
 FILE_HASSIO_HOMEASSISTANT = Path(SUPERVISOR_DATA, "homeassistant.json")
+FILE_HASSIO_HTTP_CACHE = Path(SUPERVISOR_DATA, "http_cache.json")
 FILE_HASSIO_INGRESS = Path(SUPERVISOR_DATA, "ingress.json")
 FILE_HASSIO_SERVICES = Path(SUPERVISOR_DATA, "services.json")
 FILE_HASSIO_UPDATER = Path(SUPERVISOR_DATA, "updater.json")
@@ -60,6 +62,7 @@ DOCKER_IPV4_NETWORK_RANGE = IPv4Network("172.30.33.0/24")
 # Range used for dynamically assigned ingress ports (ingress_port: 0).
 INGRESS_DYNAMIC_PORT_MIN = 62000
 INGRESS_DYNAMIC_PORT_MAX = 65500
+INGRESS_BUFFER_SIZE = 4 * 1024 * 1024
 
 # This needs to match the dockerd --cpu-rt-runtime= argument.
 DOCKER_CPU_RUNTIME_TOTAL = 950_000
@@ -120,6 +123,9 @@ ATTR_ADDON = "addon"
 ATTR_ADDONS = "addons"
 ATTR_ADDONS_CUSTOM_LIST = "addons_custom_list"
 ATTR_APP = "app"
+ATTR_APP_BOOT_CONCURRENCY = "app_boot_concurrency"
+ATTR_APP_SHUTDOWN_CONCURRENCY = "app_shutdown_concurrency"
+ATTR_APP_SHUTDOWN_TIMEOUT = "app_shutdown_timeout"
 ATTR_APPS = "apps"
 ATTR_APPS_CUSTOM_LIST = "apps_custom_list"
 ATTR_APPS_REPOSITORIES = "addons_repositories"
@@ -141,6 +147,9 @@ ATTR_AUTO = "auto"
 ATTR_AUTO_UPDATE = "auto_update"
 ATTR_AVAILABLE = "available"
 ATTR_BACKUP = "backup"
+ATTR_BACKUP_COMPRESSION = "backup_compression"
+ATTR_BACKUP_COMPRESSION_LEVEL = "backup_compression_level"
+ATTR_BACKUP_CONCURRENCY = "backup_concurrency"
 ATTR_BACKUP_EXCLUDE = "backup_exclude"
 ATTR_BACKUP_POST = "backup_post"
 ATTR_BACKUP_PRE = "backup_pre"
@@ -161,6 +170,8 @@ ATTR_CHASSIS = "chassis"
 ATTR_CHECKS = "checks"
 ATTR_CLI = "cli"
 ATTR_COMPRESSED = "compressed"
+ATTR_COMPRESSION = "compression"
+ATTR_COMPRESSION_LEVEL = "compression_level"
 ATTR_CONFIG = "config"
 ATTR_CONFIGURATION = "configuration"
 ATTR_CONNECTED = "connected"
@@ -202,8 +213,10 @@ ATTR_DUPLICATE_LOG_FILE = "duplicate_log_file"
 ATTR_ENABLE = "enable"
 ATTR_ENABLE_IPV6 = "enable_ipv6"
 ATTR_ENABLED = "enabled"
+ATTR_ENTRIES = "entries"
 ATTR_MTU = "mtu"
 ATTR_ENVIRONMENT = "environment"
+ATTR_ETAG = "etag"
 ATTR_EVENT = "event"
 ATTR_EXCLUDE_DATABASE = "exclude_database"
 ATTR_EXTRA = "extra"
@@ -226,6 +239,7 @@ ATTR_HASSOS_UNRESTRICTED = "hassos_unrestricted"
 ATTR_HASSOS_UPGRADE = "hassos_upgrade"
 ATTR_HEALTHY = "healthy"
 ATTR_HEARTBEAT_LED = "heartbeat_led"
+ATTR_HISTORY = "history"
 ATTR_HOMEASSISTANT = "homeassistant"
 ATTR_HOMEASSISTANT_EXCLUDE_DATABASE = "homeassistant_exclude_database"
 ATTR_HOMEASSISTANT_API = "homeassistant_api"
@@ -241,8 +255,10 @@ ATTR_ICON = "icon"
 ATTR_ID = "id"
 ATTR_IMAGE = "image"
 ATTR_IMAGES = "images"
+ATTR_IMMUTABLE = "immutable"
 ATTR_INDEX = "index"
 ATTR_INGRESS = "ingress"
+ATTR_INGRESS_BUFFER_SIZE = "ingress_buffer_size"
 ATTR_INGRESS_ENTRY = "ingress_entry"
 ATTR_INGRESS_PANEL = "ingress_panel"
 ATTR_INGRESS_PORT = "ingress_port"
@@ -266,6 +282,7 @@ ATTR_KERNEL = "kernel"
 ATTR_KERNEL_MODULES = "kernel_modules"
 ATTR_LABELS = "labels"
 ATTR_LAST_BOOT = "last_boot"
+ATTR_LAST_MODIFIED = "last_modified"
 ATTR_LATEST_VERSION = "latest_version"
 ATTR_LEGACY = "legacy"
 ATTR_LLMNR = "llmnr"
@@ -306,6 +323,7 @@ ATTR_PARENT = "parent"
 ATTR_PASSWORD = "password"
 ATTR_PATH = "path"
 ATTR_PLUGINS = "plugins"
+ATTR_POINTS = "points"
 ATTR_PORT = "port"
 ATTR_PORTS = "ports"
 ATTR_PORTS_DESCRIPTION = "ports_description"
@@ -349,6 +367,7 @@ ATTR_STAGE = "stage"
 ATTR_STARTUP = "startup"
 ATTR_STATE = "state"
 ATTR_STATIC = "static"
+ATTR_STATS_INTERVAL = "stats_interval"
 ATTR_STDIN = "stdin"
 ATTR_STORAGE = "storage"
 ATTR_STORAGE_DRIVER = "storage_driver"
@@ -453,6 +472,13 @@ OBSERVER_PORT = 4357
 DEFAULT_CHUNK_SIZE = 2**16  # 64KiB
 
 
+class BackupCompression(StrEnum):
+    """Compression of the inner tar files of a backup."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
 class AppBootConfig(StrEnum):
     """Boot mode config for the app."""
 
@@ -28,6 +28,7 @@ from .exceptions import (
 )
 from .homeassistant.core import LANDINGPAGE
 from .resolution.const import ContextType, IssueType, SuggestionType, UnhealthyReason
+from .utils.common import flush_config_files
 from .utils.dt import utcnow
 from .utils.sentry import async_capture_exception
 from .utils.whoami import retrieve_whoami
@@ -348,6 +349,7 @@ class Core(CoreSysAttributes):
                             self.sys_api.stop(),
                             self.sys_scheduler.shutdown(),
                             self.sys_docker.unload(),
+                            self.sys_store.unload(),
                         )
                     ]
                 )
@@ -372,6 +374,9 @@ class Core(CoreSysAttributes):
         except TimeoutError:
             _LOGGER.warning("Stage 2: Force Shutdown!")
 
+        # Write configuration changes still waiting for their save delay
+        await flush_config_files()
+
         await self.set_state(CoreState.CLOSE)
         _LOGGER.info("Supervisor is down - %d", self.exit_code)
         self.sys_loop.stop()
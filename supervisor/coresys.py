@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     from .hardware.manager import HardwareManager
     from .homeassistant.module import HomeAssistant
     from .host.manager import HostManager
+    from .http_cache import HttpCache
     from .ingress import Ingress
     from .jobs import JobManager
     from .misc.scheduler import Scheduler
@@ -85,6 +86,7 @@ class CoreSys:
         self._apps: AppManager | None = None
         self._api: RestAPI | None = None
         self._updater: Updater | None = None
+        self._http_cache: HttpCache | None = None
         self._backups: BackupManager | None = None
         self._tasks: Tasks | None = None
         self._host: HostManager | None = None
@@ -349,6 +351,20 @@ class CoreSys:
             raise RuntimeError("Updater already set!")
         self._updater = value
 
+    @property
+    def http_cache(self) -> HttpCache:
+        """Return HttpCache object."""
+        if self._http_cache is None:
+            raise RuntimeError("HttpCache not set!")
+        return self._http_cache
+
+    @http_cache.setter
+    def http_cache(self, value: HttpCache) -> None:
+        """Set a HttpCache object."""
+        if self._http_cache:
+            raise RuntimeError("HttpCache already set!")
+        self._http_cache = value
+
     @property
     def apps(self) -> AppManager:
         """Return AppManager object."""
@@ -768,6 +784,11 @@ class CoreSysAttributes:
         """Return Updater object."""
         return self.coresys.updater
 
+    @property
+    def sys_http_cache(self) -> HttpCache:
+        """Return HttpCache object."""
+        return self.coresys.http_cache
+
     @property
     def sys_apps(self) -> AppManager:
         """Return AppManager object."""
@@ -42,6 +42,11 @@ class DBusInterface(ABC):
     def object_path(self) -> str:
         """Object path for dbus object."""
 
+    @property
+    def shared_interfaces(self) -> frozenset[str] | None:
+        """Interfaces used if introspection can be shared with similar objects."""
+        return None
+
     @property
     def is_connected(self) -> bool:
         """Return True, if they is connected to D-Bus."""
@@ -61,7 +66,14 @@ class DBusInterface(ABC):
 
     async def connect(self, bus: MessageBus) -> None:
         """Connect to D-Bus."""
-        await self.initialize(await DBus.connect(bus, self.bus_name, self.object_path))
+        await self.initialize(
+            await DBus.connect(
+                bus,
+                self.bus_name,
+                self.object_path,
+                interfaces=self.shared_interfaces,
+            )
+        )
 
     async def initialize(self, connected_dbus: DBus) -> None:
         """Initialize object with already connected dbus object."""
@@ -97,7 +109,9 @@ class DBusInterfaceProxy(DBusInterface, ABC):
     """Handle D-Bus interface proxy."""
 
     sync_properties: bool = True
+    shared_introspection: bool = False
     _sync_properties_callback: Callable | None = None
+    _snapshot: dict[str, dict[str, Any]] | None = None
 
     def __init__(self) -> None:
         """Initialize properties."""
@@ -108,6 +122,28 @@ class DBusInterfaceProxy(DBusInterface, ABC):
     def properties_interface(self) -> str:
         """Primary interface of object to get property values from."""
 
+    @property
+    def shared_interfaces(self) -> frozenset[str] | None:
+        """Interfaces used if introspection can be shared with similar objects.
+
+        Set shared_introspection if the object only uses its properties
+        interface, like the many device objects of a service. Objects with a
+        snapshot share it with objects having the same interfaces.
+        """
+        if self._snapshot:
+            return frozenset(self._snapshot)
+        if self.shared_introspection:
+            return frozenset([self.properties_interface])
+        return None
+
+    def use_snapshot(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        """Take properties on next update from a snapshot of the object.
+
+        A snapshot maps the interfaces of the object to their properties, as
+        returned by GetManagedObjects of an object manager.
+        """
+        self._snapshot = snapshot
+
     async def connect(self, bus: MessageBus) -> None:
         """Connect to D-Bus."""
         await super().connect(bus)
@@ -141,6 +177,11 @@ class DBusInterfaceProxy(DBusInterface, ABC):
         """Update properties via D-Bus."""
         if changed and self.properties:
             self.properties.update(changed)
+            return
+
+        snapshot, self._snapshot = self._snapshot, None
+        if snapshot and self.properties_interface in snapshot:
+            self.properties = snapshot[self.properties_interface]
         else:
             self.properties = await self.connected_dbus.get_properties(
                 self.properties_interface
@@ -9,6 +9,7 @@ from dbus_fast.aio.message_bus import MessageBus
 from ..const import SOCKET_DBUS
 from ..coresys import CoreSys, CoreSysAttributes
 from ..exceptions import DBusFatalError, DBusNotConnectedError
+from ..utils.dbus import DBus
 from .agent import OSAgent
 from .hostname import Hostname
 from .interface import DBusInterface
@@ -158,4 +159,5 @@ class DBusManager(CoreSysAttributes):
             dbus.shutdown()
 
         self.bus.disconnect()
+        DBus.clear_shared_introspection()
         _LOGGER.info("Closed connection to system D-Bus.")
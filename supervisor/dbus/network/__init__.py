@@ -1,5 +1,6 @@
 """Network Manager implementation for DBUS."""
 
+import asyncio
 import logging
 from typing import Any, cast
 
@@ -40,6 +41,9 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 MINIMAL_VERSION = AwesomeVersion("1.14.6")
 
+# Devices updated or connected at the same time
+DEVICE_LOAD_LIMIT = 8
+
 
 class NetworkManager(DBusInterfaceProxy):
     """Handle D-Bus interface for Network Manager.
@@ -202,13 +206,18 @@ class NetworkManager(DBusInterfaceProxy):
             # in rare occasions but we'll catch it on the next host update scheduled task.
             return
 
-        interfaces: dict[str, NetworkInterface] = {}
         curr_devices = {intr.object_path: intr for intr in self.interfaces}
-        for device in self.properties[DBUS_ATTR_DEVICES]:
-            if device in curr_devices and curr_devices[device].is_connected:
-                interface = curr_devices[device]
-                await interface.update()
-            else:
+        devices: list[str] = self.properties[DBUS_ATTR_DEVICES]
+        unreachable: list[str] = []
+        limit = asyncio.Semaphore(DEVICE_LOAD_LIMIT)
+
+        async def load_device(device: str) -> NetworkInterface | None:
+            """Update or connect a device, None if it can't be processed."""
+            async with limit:
+                if device in curr_devices and curr_devices[device].is_connected:
+                    await curr_devices[device].update()
+                    return curr_devices[device]
+
                 interface = NetworkInterface(device)
 
                 # Connect to interface
@@ -219,7 +228,7 @@ class NetworkManager(DBusInterfaceProxy):
                     # this causes a race condition: A device disappears while we
                     # try to query it. Ignore those cases.
                     _LOGGER.debug("Can't process %s: %s", device, err)
-                    continue
+                    return None
                 except (
                     DBusNoReplyError,
                     DBusServiceUnkownError,
@@ -231,13 +240,31 @@ class NetworkManager(DBusInterfaceProxy):
                         err,
                     )
                     await async_capture_exception(err)
-                    return
+                    unreachable.append(device)
+                    return None
                 except Exception as err:  # pylint: disable=broad-except
                     _LOGGER.exception(
                         "Unknown error while processing %s: %s", device, err
                     )
                     await async_capture_exception(err)
-                    continue
+                    return None
+
+                return interface
+
+        # Devices are read concurrently, bounded to not swamp the bus with veths
+        results = await asyncio.gather(
+            *[load_device(device) for device in devices], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if unreachable:
+            return
+
+        interfaces: dict[str, NetworkInterface] = {}
+        for interface in results:
+            if not interface:
+                continue
 
             # Skip interface
             if (
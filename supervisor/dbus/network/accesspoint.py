@@ -19,6 +19,7 @@ class NetworkWirelessAP(DBusInterfaceProxy):
     """
 
     bus_name: str = DBUS_NAME_NM
+    shared_introspection: bool = True
     properties_interface: str = DBUS_IFACE_ACCESSPOINT
     # Don't sync these. They may disappear and strength changes a lot
     sync_properties: bool = False
@@ -30,6 +30,7 @@ class NetworkConnection(DBusInterfaceProxy):
     """
 
     bus_name: str = DBUS_NAME_NM
+    shared_introspection: bool = True
     properties_interface: str = DBUS_IFACE_CONNECTION_ACTIVE
 
     def __init__(self, object_path: str) -> None:
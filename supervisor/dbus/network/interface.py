@@ -34,6 +34,7 @@ class NetworkInterface(DBusInterfaceProxy):
     """
 
     bus_name: str = DBUS_NAME_NM
+    shared_introspection: bool = True
     properties_interface: str = DBUS_IFACE_DEVICE
     sync_properties: bool = False
 
@@ -26,6 +26,7 @@ class IpConfiguration(DBusInterfaceProxy):
     """IP Configuration object for Network Manager."""
 
     bus_name: str = DBUS_NAME_NM
+    shared_introspection: bool = True
 
     def __init__(self, object_path: str, ip4: bool = True) -> None:
         """Initialize properties."""
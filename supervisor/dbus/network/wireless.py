@@ -25,6 +25,7 @@ class NetworkWireless(DBusInterfaceProxy):
     """
 
     bus_name: str = DBUS_NAME_NM
+    shared_introspection: bool = True
     properties_interface: str = DBUS_IFACE_DEVICE_WIRELESS
 
     def __init__(self, object_path: str) -> None:
@@ -14,6 +14,7 @@ from ...exceptions import (
     DBusObjectError,
     DBusServiceUnkownError,
 )
+from ...utils.dbus import DBUS_INTERFACE_PREFIX_STANDARD
 from ..const import (
     DBUS_ATTR_SUPPORTED_FILESYSTEMS,
     DBUS_ATTR_VERSION,
@@ -65,8 +66,9 @@ class UDisks2Manager(DBusInterfaceProxy):
     async def connect(self, bus: MessageBus):
         """Connect to D-Bus."""
         try:
-            await super().connect(bus)
+            # Object manager first, so the initial update can read all objects at once
             await self.udisks2_object_manager.connect(bus)
+            await super().connect(bus)
         except DBusError as err:
             _LOGGER.critical("Can't connect to udisks2: %s", err)
         except DBusServiceUnkownError, DBusInterfaceError:
@@ -91,28 +93,47 @@ class UDisks2Manager(DBusInterfaceProxy):
         await super().update(changed)
 
         if not changed:
-            # Cache block devices
-            block_devices = await self.connected_dbus.Manager.call(
-                "get_block_devices", UDISKS2_DEFAULT_OPTIONS
+            # Cache block devices, from one snapshot of all objects if available
+            block_devices, objects = await asyncio.gather(
+                self.connected_dbus.Manager.call(
+                    "get_block_devices", UDISKS2_DEFAULT_OPTIONS
+                ),
+                self._get_managed_objects(),
             )
 
             unchanged_blocks = self._block_devices.keys() & set(block_devices)
             for removed in self._block_devices.keys() - set(block_devices):
                 self._block_devices[removed].shutdown()
 
+            new_blocks = [
+                device for device in block_devices if device not in unchanged_blocks
+            ]
+            added_blocks = dict(
+                zip(
+                    new_blocks,
+                    await asyncio.gather(
+                        *[
+                            UDisks2Block.new(
+                                device,
+                                self.connected_dbus.bus,
+                                snapshot=objects.get(device),
+                            )
+                            for device in new_blocks
+                        ]
+                    ),
+                    strict=True,
+                )
+            )
             self._block_devices = {
                 device: self._block_devices[device]
                 if device in unchanged_blocks
-                else await UDisks2Block.new(device, self.connected_dbus.bus)
+                else added_blocks[device]
                 for device in block_devices
             }
 
             # For existing block devices, need to check their type and call update
-            await asyncio.gather(
-                *[self._block_devices[path].check_type() for path in unchanged_blocks]
-            )
-            await asyncio.gather(
-                *[self._block_devices[path].update() for path in unchanged_blocks]
+            await self._update_unchanged(
+                [self._block_devices[path] for path in unchanged_blocks], objects
             )
 
             # Cache drives
@@ -126,21 +147,63 @@ class UDisks2Manager(DBusInterfaceProxy):
             for removed in self._drives.keys() - drives:
                 self._drives[removed].shutdown()
 
+            new_drives = list(drives - unchanged_drives)
+            added_drives = await asyncio.gather(
+                *[
+                    UDisks2Drive.new(
+                        drive, self.connected_dbus.bus, snapshot=objects.get(drive)
+                    )
+                    for drive in new_drives
+                ]
+            )
             self._drives = {
-                drive: self._drives[drive]
-                if drive in self._drives
-                else await UDisks2Drive.new(drive, self.connected_dbus.bus)
-                for drive in drives
-            }
+                drive: self._drives[drive] for drive in unchanged_drives
+            } | dict(zip(new_drives, added_drives, strict=True))
 
             # For existing drives, need to check their type and call update
-            await asyncio.gather(
-                *[self._drives[path].check_type() for path in unchanged_drives]
-            )
-            await asyncio.gather(
-                *[self._drives[path].update() for path in unchanged_drives]
+            await self._update_unchanged(
+                [self._drives[path] for path in unchanged_drives], objects
             )
 
+    async def _get_managed_objects(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return interfaces and properties of all UDisks2 objects.
+
+        Empty if the object manager can't be used, objects are read one by one then.
+        """
+        if not self.udisks2_object_manager.is_connected or not (
+            object_manager := self.udisks2_object_manager.connected_dbus.object_manager
+        ):
+            return {}
+
+        try:
+            objects = await object_manager.call("get_managed_objects")
+        except DBusError as err:
+            _LOGGER.debug("Can't get UDisks2 objects, reading each one: %s", err)
+            return {}
+
+        return {
+            path: {
+                name: properties
+                for name, properties in interfaces.items()
+                if not name.startswith(DBUS_INTERFACE_PREFIX_STANDARD)
+            }
+            for path, interfaces in objects.items()
+        }
+
+    async def _update_unchanged(
+        self,
+        objects: list[UDisks2Block] | list[UDisks2Drive],
+        snapshot: dict[str, dict[str, dict[str, Any]]],
+    ) -> None:
+        """Check type of existing objects and update them, from snapshot if included."""
+        await asyncio.gather(
+            *[obj.check_type(snapshot.get(obj.object_path)) for obj in objects]
+        )
+        for obj in objects:
+            if obj.object_path in snapshot:
+                obj.use_snapshot(snapshot[obj.object_path])
+        await asyncio.gather(*[obj.update() for obj in objects])
+
     @property
     @dbus_property
     def version(self) -> AwesomeVersion:
@@ -66,15 +66,22 @@ class UDisks2Block(DBusInterfaceProxy):
 
     async def connect(self, bus: MessageBus) -> None:
         """Connect to bus."""
+        snapshot = self._snapshot
         await super().connect(bus)
-        await self._reload_interfaces()
+        await self._reload_interfaces(snapshot)
 
     @staticmethod
     async def new(
-        object_path: str, bus: MessageBus, *, sync_properties: bool = True
+        object_path: str,
+        bus: MessageBus,
+        *,
+        sync_properties: bool = True,
+        snapshot: dict[str, dict[str, Any]] | None = None,
     ) -> UDisks2Block:
-        """Create and connect object."""
+        """Create and connect object, from a snapshot of the object if given."""
         obj = UDisks2Block(object_path, sync_properties=sync_properties)
+        if snapshot:
+            obj.use_snapshot(snapshot)
         await obj.connect(bus)
         return obj
 
@@ -200,6 +207,13 @@ class UDisks2Block(DBusInterfaceProxy):
         """
         return self.properties[DBUS_ATTR_DRIVE]
 
+    def use_snapshot(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        """Take properties on next update from a snapshot of the object."""
+        super().use_snapshot(snapshot)
+        for intr in (self.filesystem, self.partition, self.partition_table):
+            if intr:
+                intr.use_snapshot(snapshot)
+
     @dbus_connected
     async def update(self, changed: dict[str, Any] | None = None) -> None:
         """Update properties via D-Bus."""
@@ -215,8 +229,20 @@ class UDisks2Block(DBusInterfaceProxy):
             )
 
     @dbus_connected
-    async def check_type(self) -> None:
-        """Check if type of block device has changed and adjust interfaces if so."""
+    async def check_type(
+        self, snapshot: dict[str, dict[str, Any]] | None = None
+    ) -> None:
+        """Check if type of block device has changed and adjust interfaces if so.
+
+        Takes the interfaces from a snapshot of the object if given, otherwise
+        introspects it.
+        """
+        if snapshot:
+            if set(snapshot) != self.connected_dbus.object_interfaces:
+                await self.connected_dbus.init_proxy(interfaces=frozenset(snapshot))
+                await self._reload_interfaces(snapshot)
+            return
+
         introspection = await self.connected_dbus.introspect()
         interfaces = {intr.name for intr in introspection.interfaces}
 
@@ -226,13 +252,17 @@ class UDisks2Block(DBusInterfaceProxy):
             await self._reload_interfaces()
 
     @dbus_connected
-    async def _reload_interfaces(self) -> None:
+    async def _reload_interfaces(
+        self, snapshot: dict[str, dict[str, Any]] | None = None
+    ) -> None:
         """Reload interfaces from introspection as necessary."""
         # Check if block device is a filesystem
         if not self.filesystem and DBUS_IFACE_FILESYSTEM in self.connected_dbus.proxies:
             self._filesystem = UDisks2Filesystem(
                 self.object_path, sync_properties=self.sync_properties
             )
+            if snapshot:
+                self._filesystem.use_snapshot(snapshot)
             await self._filesystem.initialize(self.connected_dbus)
 
         elif (
@@ -246,6 +276,8 @@ class UDisks2Block(DBusInterfaceProxy):
             self._partition = UDisks2Partition(
                 self.object_path, sync_properties=self.sync_properties
             )
+            if snapshot:
+                self._partition.use_snapshot(snapshot)
             await self._partition.initialize(self.connected_dbus)
 
         elif self.partition and DBUS_IFACE_PARTITION not in self.connected_dbus.proxies:
@@ -260,6 +292,8 @@ class UDisks2Block(DBusInterfaceProxy):
             self._partition_table = UDisks2PartitionTable(
                 self.object_path, sync_properties=self.sync_properties
             )
+            if snapshot:
+                self._partition_table.use_snapshot(snapshot)
             await self._partition_table.initialize(self.connected_dbus)
 
         elif (
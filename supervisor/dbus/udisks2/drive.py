@@ -47,13 +47,21 @@ class UDisks2Drive(DBusInterfaceProxy):
 
     async def connect(self, bus: MessageBus) -> None:
         """Connect to bus."""
+        snapshot = self._snapshot
         await super().connect(bus)
-        await self._reload_interfaces()
+        await self._reload_interfaces(snapshot)
 
     @staticmethod
-    async def new(object_path: str, bus: MessageBus) -> UDisks2Drive:
-        """Create and connect object."""
+    async def new(
+        object_path: str,
+        bus: MessageBus,
+        *,
+        snapshot: dict[str, dict[str, Any]] | None = None,
+    ) -> UDisks2Drive:
+        """Create and connect object, from a snapshot of the object if given."""
         obj = UDisks2Drive(object_path)
+        if snapshot:
+            obj.use_snapshot(snapshot)
         await obj.connect(bus)
         return obj
 
@@ -146,6 +154,12 @@ class UDisks2Drive(DBusInterfaceProxy):
         """Eject media from drive."""
         await self.connected_dbus.Drive.call("eject", UDISKS2_DEFAULT_OPTIONS)
 
+    def use_snapshot(self, snapshot: dict[str, dict[str, Any]]) -> None:
+        """Take properties on next update from a snapshot of the object."""
+        super().use_snapshot(snapshot)
+        if self.nvme_controller:
+            self.nvme_controller.use_snapshot(snapshot)
+
     @dbus_connected
     async def update(self, changed: dict[str, Any] | None = None) -> None:
         """Update properties via D-Bus."""
@@ -155,8 +169,20 @@ class UDisks2Drive(DBusInterfaceProxy):
             await self.nvme_controller.update()
 
     @dbus_connected
-    async def check_type(self) -> None:
-        """Check if type of drive has changed and adjust interfaces if so."""
+    async def check_type(
+        self, snapshot: dict[str, dict[str, Any]] | None = None
+    ) -> None:
+        """Check if type of drive has changed and adjust interfaces if so.
+
+        Takes the interfaces from a snapshot of the object if given, otherwise
+        introspects it.
+        """
+        if snapshot:
+            if set(snapshot) != self.connected_dbus.object_interfaces:
+                await self.connected_dbus.init_proxy(interfaces=frozenset(snapshot))
+                await self._reload_interfaces(snapshot)
+            return
+
         introspection = await self.connected_dbus.introspect()
         interfaces = {intr.name for intr in introspection.interfaces}
 
@@ -166,7 +192,9 @@ class UDisks2Drive(DBusInterfaceProxy):
             await self._reload_interfaces()
 
     @dbus_connected
-    async def _reload_interfaces(self) -> None:
+    async def _reload_interfaces(
+        self, snapshot: dict[str, dict[str, Any]] | None = None
+    ) -> None:
         """Reload interfaces from introspection as necessary."""
         # Check if drive is an nvme controller
         if (
@@ -174,6 +202,8 @@ class UDisks2Drive(DBusInterfaceProxy):
             and DBUS_IFACE_NVME_CONTROLLER in self.connected_dbus.proxies
         ):
             self._nvme_controller = UDisks2NVMeController(self.object_path)
+            if snapshot:
+                self._nvme_controller.use_snapshot(snapshot)
             await self._nvme_controller.initialize(self.connected_dbus)
 
         elif (
@@ -993,7 +993,9 @@ class DockerApp(DockerInterface):
         concurrency=JobConcurrency.GROUP_REJECT,
         internal=True,
     )
-    async def stop(self, remove_container: bool = True) -> None:
+    async def stop(
+        self, remove_container: bool = True, *, timeout: int | None = None
+    ) -> None:
         """Stop/remove Docker container."""
         # DNS
         if self.ip_address != NO_ADDDRESS:
@@ -1008,7 +1010,7 @@ class DockerApp(DockerInterface):
             self.sys_bus.remove_listener(self._hw_listener)
             self._hw_listener = None
 
-        await super().stop(remove_container)
+        await super().stop(remove_container, timeout=timeout)
 
         # If there is a device access issue and the container is removed, clear it
         if remove_container and (
@@ -0,0 +1,231 @@
+"""Read container stats directly from cgroup v2."""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from ..coresys import CoreSys, CoreSysAttributes
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+CGROUP_PATH = Path("/sys/fs/cgroup")
+PROC_PATH = Path("/proc")
+
+# cgroup of a container with systemd and cgroupfs cgroup driver of Docker
+CGROUP_CONTAINER_PATHS = ("system.slice/docker-{id}.scope", "docker/{id}")
+
+# Docker samples CPU usage over about one second for a single stats call, used
+# for the first sample of a container as well
+CPU_SAMPLE_WINDOW = 1.0
+
+
+@dataclass(slots=True)
+class CgroupContainer:
+    """cgroup of a running container and its previous CPU sample."""
+
+    id: str
+    path: Path
+    net_dev: Path | None
+    cpu_usage: int = 0
+    system_usage: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class CgroupSample:
+    """Raw values read from cgroup and network namespace of a container."""
+
+    cpu_usage: int
+    system_usage: int
+    memory_usage: int
+    memory_limit: int | None
+    memory_stat: dict[str, int]
+    io_read: int
+    io_write: int
+    networks: dict[str, dict[str, int]]
+
+
+def _read_key_values(path: Path) -> dict[str, int]:
+    """Read a flat keyed cgroup file like cpu.stat or memory.stat."""
+    values: dict[str, int] = {}
+    for line in path.read_text(encoding="ascii").splitlines():
+        key, _, value = line.partition(" ")
+        values[key] = int(value)
+    return values
+
+
+def _read_io_stat(path: Path) -> tuple[int, int]:
+    """Return bytes read and written by all devices from io.stat."""
+    read = write = 0
+    for line in path.read_text(encoding="ascii").splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition("=")
+            if key == "rbytes":
+                read += int(value)
+            elif key == "wbytes":
+                write += int(value)
+    return read, write
+
+
+def _read_net_dev(path: Path) -> dict[str, dict[str, int]]:
+    """Return rx and tx bytes of all interfaces except loopback."""
+    networks: dict[str, dict[str, int]] = {}
+    for line in path.read_text(encoding="ascii").splitlines()[2:]:
+        interface, _, counters = line.partition(":")
+        if (interface := interface.strip()) == "lo":
+            continue
+        fields = counters.split()
+        networks[interface] = {"rx_bytes": int(fields[0]), "tx_bytes": int(fields[8])}
+    return networks
+
+
+def _read_sample(container: CgroupContainer) -> CgroupSample:
+    """Read a sample of a container from its cgroup."""
+    cpu_stat = _read_key_values(container.path / "cpu.stat")
+    memory_max = (container.path / "memory.max").read_text(encoding="ascii").strip()
+    io_read, io_write = _read_io_stat(container.path / "io.stat")
+
+    return CgroupSample(
+        cpu_usage=cpu_stat["usage_usec"],
+        system_usage=time.monotonic_ns() // 1000 * (os.cpu_count() or 1),
+        memory_usage=int(
+            (container.path / "memory.current").read_text(encoding="ascii")
+        ),
+        memory_limit=None if memory_max == "max" else int(memory_max),
+        memory_stat=_read_key_values(container.path / "memory.stat"),
+        io_read=io_read,
+        io_write=io_write,
+        networks=_read_net_dev(container.net_dev) if container.net_dev else {},
+    )
+
+
+def _in_cgroup(proc: Path, container_id: str) -> bool:
+    """Return true if a process is in the cgroup of a container."""
+    try:
+        return container_id in (proc / "cgroup").read_text(encoding="ascii")
+    except OSError:
+        return False
+
+
+def _host_memory() -> int:
+    """Return total memory of host in bytes."""
+    with (PROC_PATH / "meminfo").open(encoding="ascii") as meminfo:
+        for line in meminfo:
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class CgroupStats(CoreSysAttributes):
+    """Collect stats of running containers from cgroup v2 files.
+
+    Avoids the Docker stats API, which samples for about a second on each
+    call. Results use the layout of the Docker stats API, so DockerStats can
+    parse them, but CPU usage values are in microseconds.
+    """
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize cgroup stats collector."""
+        self.coresys: CoreSys = coresys
+        self._containers: dict[str, CgroupContainer] = {}
+        self._host_memory: int | None = None
+
+    def _find_container(self, metadata: dict[str, Any]) -> CgroupContainer | None:
+        """Find cgroup and network namespace of a running container."""
+        if not (container_id := metadata.get("Id")):
+            return None
+
+        for path in CGROUP_CONTAINER_PATHS:
+            cgroup = CGROUP_PATH / path.format(id=container_id)
+            if (cgroup / "cpu.stat").is_file() and (cgroup / "memory.stat").is_file():
+                break
+        else:
+            return None
+
+        # Docker reports no networks for containers in host network
+        net_dev: Path | None = None
+        if metadata.get("HostConfig", {}).get("NetworkMode") != "host":
+            if not (pid := metadata.get("State", {}).get("Pid")):
+                return None
+            # Pid is in the PID namespace of the host, only use it if it is
+            # the same process here
+            if not _in_cgroup(PROC_PATH / str(pid), container_id):
+                return None
+            net_dev = PROC_PATH / str(pid) / "net" / "dev"
+            if not net_dev.is_file():
+                return None
+
+        if self._host_memory is None:
+            self._host_memory = _host_memory()
+
+        return CgroupContainer(container_id, cgroup, net_dev)
+
+    def _stats(self, container: CgroupContainer, sample: CgroupSample) -> dict:
+        """Return stats in Docker layout and store sample for next CPU delta."""
+        stats = {
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": sample.cpu_usage},
+                "system_cpu_usage": sample.system_usage,
+                "online_cpus": os.cpu_count() or 1,
+            },
+            "precpu_stats": {
+                "cpu_usage": {"total_usage": container.cpu_usage},
+                "system_cpu_usage": container.system_usage,
+            },
+            "memory_stats": {
+                "usage": sample.memory_usage,
+                "limit": sample.memory_limit or self._host_memory or 0,
+                "stats": sample.memory_stat,
+            },
+            "blkio_stats": {
+                "io_service_bytes_recursive": [
+                    {"op": "read", "value": sample.io_read},
+                    {"op": "write", "value": sample.io_write},
+                ]
+            },
+            "networks": sample.networks,
+        }
+        container.cpu_usage = sample.cpu_usage
+        container.system_usage = sample.system_usage
+        return stats
+
+    async def read(
+        self, name: str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Return stats of a container, None if they can't be read from cgroup.
+
+        Without metadata only containers read before are looked up. Metadata
+        of a running container from Docker inspect is used to find its cgroup.
+        """
+        container = self._containers.get(name)
+        if metadata and (not container or container.id != metadata.get("Id")):
+            container = await self.sys_run_in_executor(self._find_container, metadata)
+            if not container:
+                self._containers.pop(name, None)
+                return None
+
+            self._containers[name] = container
+            try:
+                first = await self.sys_run_in_executor(_read_sample, container)
+            except (OSError, ValueError, KeyError, IndexError) as err:
+                _LOGGER.debug("Can't read cgroup stats of %s: %s", name, err)
+                del self._containers[name]
+                return None
+            self._stats(container, first)
+            await asyncio.sleep(CPU_SAMPLE_WINDOW)
+
+        if not container:
+            return None
+
+        try:
+            sample = await self.sys_run_in_executor(_read_sample, container)
+        except (OSError, ValueError, KeyError, IndexError) as err:
+            # cgroup is removed when the container stops
+            _LOGGER.debug("Can't read cgroup stats of %s: %s", name, err)
+            self._containers.pop(name, None)
+            return None
+
+        return self._stats(container, sample)
@@ -304,11 +304,8 @@ class DockerInterface(JobGroup, ABC):
         except (aiohttp.ClientError, TimeoutError) as err:
             _LOGGER.warning("Could not fetch manifest for progress: %s", err)
 
-        async def process_pull_event(event: PullLogEntry) -> None:
-            """Process pull event and update job progress."""
-            if event.job_id != current_job.uuid:
-                return
-
+        def process_pull_event(event: PullLogEntry) -> None:
+            """Process pull event of this job and update job progress."""
             try:
                 # Process event through progress tracker
                 pull_progress.process_event(event)
@@ -330,7 +327,7 @@ class DockerInterface(JobGroup, ABC):
                     event.progress,
                     err,
                 )
-                await async_capture_exception(err)
+                self.sys_create_task(async_capture_exception(err))
             except Exception as err:  # pylint: disable=broad-except
                 # Catch any other unexpected errors in progress tracking to prevent
                 # pull from failing. Progress updates are informational - the pull
@@ -341,15 +338,15 @@ class DockerInterface(JobGroup, ABC):
                     event.status,
                     err,
                 )
-                await async_capture_exception(err)
+                self.sys_create_task(async_capture_exception(err))
 
         # Get credentials for private registries to pass to aiodocker.
         # Done before registering the listener so a failure here does not
         # leak a stale event listener.
         credentials, pull_image_name = self._get_credentials(image)
 
-        listener = self.sys_bus.register_event(
-            BusEvent.DOCKER_IMAGE_PULL_UPDATE, process_pull_event
+        listener = self.sys_bus.register_callback(
+            BusEvent.DOCKER_IMAGE_PULL_UPDATE, process_pull_event, key=current_job.uuid
         )
 
         _LOGGER.info("Downloading docker image %s with tag %s.", image, version)
@@ -544,11 +541,18 @@ class DockerInterface(JobGroup, ABC):
         on_condition=DockerJobError,
         concurrency=JobConcurrency.GROUP_REJECT,
     )
-    async def stop(self, remove_container: bool = True) -> None:
-        """Stop/remove Docker container."""
+    async def stop(
+        self, remove_container: bool = True, *, timeout: int | None = None
+    ) -> None:
+        """Stop/remove Docker container.
+
+        Timeout overrides the default stop timeout of the container if set.
+        """
         with suppress(DockerNotFound):
             await self.sys_docker.stop_container(
-                self.name, self.timeout, remove_container
+                self.name,
+                self.timeout if timeout is None else timeout,
+                remove_container,
             )
 
     @Job(
@@ -27,6 +27,7 @@ from ..const import (
     ATTR_ENABLE_IPV6,
     ATTR_MTU,
     ATTR_REGISTRIES,
+    ATTR_STATS_INTERVAL,
     DEFAULT_CHUNK_SIZE,
     DNS_SUFFIX,
     DOCKER_NETWORK,
@@ -47,6 +48,7 @@ from ..exceptions import (
 )
 from ..utils.common import FileConfiguration
 from ..validate import SCHEMA_DOCKER_CONFIG
+from .cgroup import CgroupStats
 from .const import (
     DOCKER_HUB,
     DOCKER_HUB_LEGACY,
@@ -60,6 +62,7 @@ from .const import (
 from .manifest import RegistryManifestFetcher
 from .monitor import DockerMonitor
 from .network import DockerNetwork
+from .sampler import DockerStatsSampler
 from .utils import get_registry_from_image
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -230,6 +233,16 @@ class DockerConfig(FileConfiguration):
         """Set MTU configuration for docker network."""
         self._data[ATTR_MTU] = value
 
+    @property
+    def stats_interval(self) -> int:
+        """Return interval of container stats sampling in seconds, 0 if off."""
+        return self._data.get(ATTR_STATS_INTERVAL, 0)
+
+    @stats_interval.setter
+    def stats_interval(self, value: int) -> None:
+        """Set interval of container stats sampling in seconds."""
+        self._data[ATTR_STATS_INTERVAL] = value
+
     @property
     def registries(self) -> dict[str, Any]:
         """Return credentials for docker registries."""
@@ -284,6 +297,8 @@ class DockerAPI(CoreSysAttributes):
         self._manifest_fetcher: RegistryManifestFetcher = RegistryManifestFetcher(
             coresys
         )
+        self._cgroup_stats: CgroupStats = CgroupStats(coresys)
+        self._stats_sampler: DockerStatsSampler = DockerStatsSampler(coresys)
 
     async def post_init(self) -> Self:
         """Post init actions that must be done in event loop."""
@@ -328,17 +343,24 @@ class DockerAPI(CoreSysAttributes):
         """Return docker events monitor."""
         return self._monitor
 
+    @property
+    def stats_sampler(self) -> DockerStatsSampler:
+        """Return container stats sampler."""
+        return self._stats_sampler
+
     @property
     def manifest_fetcher(self) -> RegistryManifestFetcher:
         """Return manifest fetcher for registry access."""
         return self._manifest_fetcher
 
     async def load(self) -> None:
-        """Start docker events monitor."""
+        """Start docker events monitor and stats sampler."""
         await self.monitor.load()
+        await self.stats_sampler.load()
 
     async def unload(self) -> None:
-        """Stop docker events monitor."""
+        """Stop docker events monitor and stats sampler."""
+        await self.stats_sampler.unload()
         await self.monitor.unload()
 
     def _create_container_config(
@@ -755,8 +777,8 @@ class DockerAPI(CoreSysAttributes):
             entry = PullLogEntry.from_pull_log_dict(job_id, e)
             if entry.error:
                 raise entry.exception
-            await asyncio.gather(
-                *self.sys_bus.fire_event(BusEvent.DOCKER_IMAGE_PULL_UPDATE, entry)
+            self.sys_bus.fire_event(
+                BusEvent.DOCKER_IMAGE_PULL_UPDATE, entry, bounded=True
             )
 
         sep = "@" if tag.startswith("sha256:") else ":"
@@ -1004,7 +1026,14 @@ class DockerAPI(CoreSysAttributes):
             ) from err
 
     async def container_stats(self, name: str) -> dict[str, Any]:
-        """Read and return stats from container."""
+        """Read and return stats from container.
+
+        Stats are read from cgroup v2 if possible, Docker is only asked for
+        them as fallback.
+        """
+        if stats := await self._cgroup_stats.read(name):
+            return stats
+
         try:
             docker_container = await self.containers.get(name)
             container_metadata = await docker_container.show()
@@ -1025,6 +1054,9 @@ class DockerAPI(CoreSysAttributes):
         if container_metadata["State"]["Status"] != "running":
             raise DockerError(f"Container {name} is not running", _LOGGER.error)
 
+        if stats := await self._cgroup_stats.read(name, container_metadata):
+            return stats
+
         try:
             stats = await docker_container.stats(stream=False)
         except aiodocker.DockerError as err:
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 
 import aiohttp
 
+from ..utils.json import json_loads
 from .const import DOCKER_HUB, DOCKER_HUB_API, DOCKER_HUB_LEGACY
 from .utils import split_docker_domain
 
@@ -116,7 +117,15 @@ class RegistryManifestFetcher:
 
         Uses the WWW-Authenticate header from a 401 response to discover
         the token endpoint, then requests a token with appropriate scope.
+        Tokens are reused until they expire.
         """
+        credentials = self._get_credentials(registry)
+        token_key = f"{registry}/{repository}"
+        if credentials and credentials[0]:
+            token_key = f"{credentials[0]}@{token_key}"
+        if token := self.coresys.http_cache.get_token(token_key):
+            return token
+
         api_endpoint = self._get_api_endpoint(registry)
 
         # First, make an unauthenticated request to get WWW-Authenticate header
@@ -162,7 +171,6 @@ class RegistryManifestFetcher:
 
         # Check for credentials
         headers = None
-        credentials = self._get_credentials(registry)
         if credentials:
             username, password = credentials
             if username and password:
@@ -187,11 +195,14 @@ class RegistryManifestFetcher:
                     return None
 
                 data = await resp.json()
-                return data.get("token") or data.get("access_token")
         except aiohttp.ClientError as err:
             _LOGGER.warning("Failed to get auth token: %s", err)
             return None
 
+        if token := data.get("token") or data.get("access_token"):
+            self.coresys.http_cache.set_token(token_key, token, data.get("expires_in"))
+        return token
+
     async def _fetch_manifest(
         self,
         registry: str,
@@ -203,7 +214,8 @@ class RegistryManifestFetcher:
         """Fetch manifest from registry.
 
         If the manifest is a manifest list (multi-arch), fetches the
-        platform-specific manifest.
+        platform-specific manifest. Manifests by digest never change, they are
+        served from the HTTP cache once fetched.
         """
         api_endpoint = self._get_api_endpoint(registry)
         manifest_url = f"https://{api_endpoint}/v2/{repository}/manifests/{reference}"
@@ -213,22 +225,31 @@ class RegistryManifestFetcher:
             headers["Authorization"] = f"Bearer {token}"
 
         try:
-            async with self._session.get(manifest_url, headers=headers) as resp:
-                if resp.status != 200:
-                    _LOGGER.warning(
-                        "Failed to fetch manifest for %s/%s:%s - %d",
-                        registry,
-                        repository,
-                        reference,
-                        resp.status,
-                    )
-                    return None
-
-                manifest = await resp.json()
+            response = await self.coresys.http_cache.get(
+                manifest_url,
+                headers=headers,
+                immutable=reference.startswith("sha256:"),
+            )
         except aiohttp.ClientError as err:
             _LOGGER.warning("Failed to fetch manifest: %s", err)
             return None
 
+        if response.status != 200:
+            _LOGGER.warning(
+                "Failed to fetch manifest for %s/%s:%s - %d",
+                registry,
+                repository,
+                reference,
+                response.status,
+            )
+            return None
+
+        try:
+            manifest = json_loads(response.content)
+        except ValueError as err:
+            _LOGGER.warning("Failed to parse manifest: %s", err)
+            return None
+
         media_type = manifest.get("mediaType", "")
 
         # Check if this is a manifest list (multi-arch image)
@@ -0,0 +1,186 @@
+"""Sample stats of all managed containers into a bounded history."""
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
+import logging
+from typing import Any
+
+import aiodocker
+
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import DockerError
+from ..utils.dt import utcnow
+from .const import LABEL_MANAGED
+from .stats import DockerStats
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Samples kept per container, one hour at an interval of 30 seconds
+HISTORY_SIZE = 120
+
+# Fields of a sample which are averaged when downsampling, the others are
+# monotonic counters or limits and the last value of a bucket is used
+GAUGE_FIELDS = ("cpu_percent", "memory_usage", "memory_percent")
+
+
+@dataclass(slots=True, frozen=True)
+class StatsSample:
+    """Stats of a container at a point in time."""
+
+    timestamp: float
+    cpu_percent: float
+    memory_usage: int
+    memory_limit: int
+    memory_percent: float
+    network_rx: int
+    network_tx: int
+    blk_read: int
+    blk_write: int
+
+    @classmethod
+    def from_stats(cls, timestamp: float, stats: DockerStats) -> StatsSample:
+        """Create sample from Docker stats."""
+        return cls(
+            timestamp,
+            stats.cpu_percent,
+            stats.memory_usage,
+            stats.memory_limit,
+            stats.memory_percent,
+            stats.network_rx,
+            stats.network_tx,
+            stats.blk_read,
+            stats.blk_write,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary representation."""
+        return asdict(self)
+
+
+def downsample(samples: list[StatsSample], points: int) -> list[StatsSample]:
+    """Reduce samples to at most points by merging consecutive samples."""
+    if len(samples) <= points:
+        return samples
+
+    result: list[StatsSample] = []
+    for index in range(points):
+        bucket = samples[
+            index * len(samples) // points : (index + 1) * len(samples) // points
+        ]
+        values = asdict(bucket[-1])
+        for field in GAUGE_FIELDS:
+            values[field] = sum(getattr(sample, field) for sample in bucket) / len(
+                bucket
+            )
+        values["cpu_percent"] = round(values["cpu_percent"], 2)
+        values["memory_usage"] = int(values["memory_usage"])
+        values["memory_percent"] = round(values["memory_percent"], 2)
+        result.append(StatsSample(**values))
+    return result
+
+
+class DockerStatsSampler(CoreSysAttributes):
+    """Collect stats of managed containers on an interval.
+
+    Each container has a ring buffer of HISTORY_SIZE samples, buffers of
+    removed containers are dropped, so memory use is bounded by the number
+    of containers.
+    """
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize stats sampler."""
+        self.coresys: CoreSys = coresys
+        self._history: dict[str, deque[StatsSample]] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return true if sampler collects stats in background."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def containers(self) -> list[str]:
+        """Return names of containers with history."""
+        return list(self._history)
+
+    def latest(self) -> dict[str, StatsSample]:
+        """Return latest sample of all containers."""
+        return {name: history[-1] for name, history in self._history.items()}
+
+    def history(self, name: str, points: int | None = None) -> list[StatsSample]:
+        """Return history of a container, downsampled to points if given."""
+        samples = list(self._history.get(name, ()))
+        return downsample(samples, points) if points else samples
+
+    async def _sample_container(self, name: str) -> StatsSample | None:
+        """Return a sample of a container, None if it can't be read."""
+        try:
+            stats = DockerStats(await self.sys_docker.container_stats(name))
+        except DockerError as err:
+            _LOGGER.debug("Can't sample stats of %s: %s", name, err)
+            return None
+        return StatsSample.from_stats(utcnow().timestamp(), stats)
+
+    async def sample(self) -> None:
+        """Sample stats of all running managed containers."""
+        try:
+            containers = await self.sys_docker.containers.list(
+                all=True, filters={"label": [LABEL_MANAGED]}
+            )
+        except (aiodocker.DockerError, TimeoutError) as err:
+            _LOGGER.warning("Can't list containers for stats: %s", err)
+            return
+
+        names: set[str] = set()
+        running: list[str] = []
+        for container in containers:
+            name = container["Names"][0].lstrip("/")
+            names.add(name)
+            if container["State"] == "running":
+                running.append(name)
+
+        # Drop history of removed containers, keep stopped ones for analysis
+        for name in self._history.keys() - names:
+            del self._history[name]
+
+        samples = await asyncio.gather(
+            *[self._sample_container(name) for name in running]
+        )
+        for name, sample in zip(running, samples, strict=True):
+            if sample:
+                self._history.setdefault(name, deque(maxlen=HISTORY_SIZE)).append(
+                    sample
+                )
+
+    async def _run(self, interval: int) -> None:
+        """Sample stats until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            start = self.sys_loop.time()
+            await self.sample()
+            if (duration := self.sys_loop.time() - start) > interval:
+                _LOGGER.warning(
+                    "Sampling container stats took %.1fs, longer than interval",
+                    duration,
+                )
+
+    async def load(self) -> None:
+        """Start sampling stats if enabled."""
+        if not (interval := self.sys_docker.config.stats_interval):
+            return
+        self._task = self.sys_create_task(self._run(interval))
+        _LOGGER.info("Started container stats sampler with %ss interval", interval)
+
+    async def unload(self) -> None:
+        """Stop sampling stats."""
+        if not self._task:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def reload(self) -> None:
+        """Restart sampling with current interval."""
+        await self.unload()
+        await self.load()
@@ -72,10 +72,11 @@ class DockerStats:
 
     def _calc_block_io(self, blkio):
         """Calculate block IO stats."""
+        # cgroupv1 reports capitalized, cgroupv2 lowercase operations
         for stats in blkio["io_service_bytes_recursive"]:
-            if stats["op"] == "Read":
+            if stats["op"].lower() == "read":
                 self._blk_read += stats["value"]
-            elif stats["op"] == "Write":
+            elif stats["op"].lower() == "write":
                 self._blk_write += stats["value"]
 
     @property
@@ -1393,6 +1393,10 @@ class BackupFatalIOError(BackupError):
     """Raise on write-side I/O errors that leave the backup tar corrupt."""
 
 
+class BackupChainError(BackupError):
+    """Raise if an operation would break a chain of incremental backups."""
+
+
 class AppBackupMetadataInvalidError(BackupError, APIError):
     """Raise if invalid metadata file provided for app in backup."""
 
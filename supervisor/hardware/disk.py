@@ -1,9 +1,14 @@
 """Read disk hardware info from system."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import errno
 import logging
+import os
 from pathlib import Path
 import shutil
+import stat
+import time
 from typing import Any
 
 from ..coresys import CoreSys, CoreSysAttributes
@@ -23,6 +28,47 @@ _BLOCK_DEVICE_CLASS = "/sys/class/block/{}"
 _BLOCK_DEVICE_EMMC_LIFE_TIME = "/sys/block/{}/device/life_time"
 _DEVICE_PATH = "/dev/{}"
 
+# Threads walking the top-level subtrees of a directory in parallel
+DIR_WALK_WORKERS = 4
+
+# Seconds after which cached directory sizes are rebuilt by a full walk. In
+# between only directories are checked, which misses files changed in place.
+DIR_SIZES_MAX_AGE = 600
+
+
+@dataclass(slots=True)
+class _DirSizes:
+    """Cached sizes of a directory tree.
+
+    A directory's mtime changes whenever an entry in it is added, removed or
+    renamed, so while it is unchanged the size of its files and its list of
+    subdirectories can be reused. mtime_ns is None if the walk of the
+    directory hit an error, so it is listed again on the next walk.
+    """
+
+    mtime_ns: int | None
+    files_size: int
+    subdirs: dict[str, _DirSizes]
+    used_bytes: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Sum up size of the tree."""
+        self.used_bytes = self.files_size + sum(
+            subdir.used_bytes for subdir in self.subdirs.values()
+        )
+
+    def as_dict(self, max_depth: int) -> dict[str, Any]:
+        """Return a recursive dict of subdirectories with size > 0."""
+        if max_depth > 1 and (
+            children := [
+                {"id": name, "label": name, **subdir.as_dict(max_depth - 1)}
+                for name, subdir in self.subdirs.items()
+                if subdir.used_bytes > 0
+            ]
+        ):
+            return {"used_bytes": self.used_bytes, "children": children}
+        return {"used_bytes": self.used_bytes}
+
 
 class HwDisk(CoreSysAttributes):
     """Representation of an interface to disk utils."""
@@ -30,6 +76,7 @@ class HwDisk(CoreSysAttributes):
     def __init__(self, coresys: CoreSys):
         """Init hardware object."""
         self.coresys = coresys
+        self._dir_sizes: dict[Path, tuple[float, _DirSizes]] = {}
 
     def is_used_by_system(self, device: Device) -> bool:
         """Return true if this is a system partition."""
@@ -113,58 +160,144 @@ class HwDisk(CoreSysAttributes):
         documents its checks as local-path-only. Disable it when walking a
         network mount: an I/O error from an unreachable server is that mount's
         problem and must not mark the whole system unhealthy.
-        """
 
-        size = 0
+        Sizes are cached per path, later calls only walk directories changed
+        since and do a full walk once the cache is DIR_SIZES_MAX_AGE old.
+
+        Must be run in executor.
+        """
         if not path.exists():
-            return {"used_bytes": size}
+            return {"used_bytes": 0}
+
+        now = time.monotonic()
+        cached: _DirSizes | None = None
+        walked_at = now
+        if (entry := self._dir_sizes.get(path)) and now - entry[0] < DIR_SIZES_MAX_AGE:
+            walked_at, cached = entry
+
+        root = path.stat()
+        with ThreadPoolExecutor(
+            max_workers=DIR_WALK_WORKERS, thread_name_prefix="DirWalker"
+        ) as executor:
+            sizes = self._walk_dir(
+                path,
+                root.st_dev,
+                root.st_mtime_ns,
+                cached,
+                check_oserror=check_oserror,
+                executor=executor,
+            )
 
-        children: list[dict[str, Any]] = []
-        root_device = path.stat().st_dev
+        self._dir_sizes[path] = (walked_at, sizes)
+        return sizes.as_dict(max_depth)
+
+    def _walk_dir(
+        self,
+        path: Path,
+        device: int,
+        mtime_ns: int,
+        cached: _DirSizes | None,
+        *,
+        check_oserror: bool,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> _DirSizes:
+        """Return sizes of a directory tree, reusing unchanged cached directories.
+
+        Subtrees are walked on executor if given.
+        """
+        if cached and cached.mtime_ns == mtime_ns:
+            files_size = cached.files_size
+            subdirs, complete = self._stat_subdirs(
+                path, device, cached.subdirs, check_oserror
+            )
+        else:
+            files_size, subdirs, complete = self._scan_dir(path, device, check_oserror)
+
+        def walk_subdir(name: str) -> _DirSizes:
+            return self._walk_dir(
+                path / name,
+                device,
+                subdirs[name],
+                cached.subdirs.get(name) if cached else None,
+                check_oserror=check_oserror,
+            )
 
-        for child in path.iterdir():
-            # Skip symlinks to avoid infinite loops
-            if child.is_symlink():
-                continue
+        if executor and len(subdirs) > 1:
+            results = list(executor.map(walk_subdir, subdirs))
+        else:
+            results = [walk_subdir(name) for name in subdirs]
 
+        return _DirSizes(
+            mtime_ns if complete else None,
+            files_size,
+            dict(zip(subdirs, results, strict=True)),
+        )
+
+    def _scan_dir(
+        self, path: Path, device: int, check_oserror: bool
+    ) -> tuple[int, dict[str, int], bool]:
+        """List a directory, return size of files, mtime of subdirs and if complete.
+
+        Uses one lstat per entry, file type comes with the directory listing.
+        """
+        files_size = 0
+        subdirs: dict[str, int] = {}
+        complete = True
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Skip symlinks to avoid infinite loops
+                if entry.is_symlink():
+                    continue
+
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    # File might disappear between listing and stat, ignore
+                    _LOGGER.warning("File not found: %s", entry.path)
+                    continue
+                except OSError as err:
+                    complete = False
+                    if self._walk_oserror(err, check_oserror):
+                        continue
+                    break
+
+                if entry_stat.st_dev != device:
+                    continue
+
+                if stat.S_ISDIR(entry_stat.st_mode):
+                    subdirs[entry.name] = entry_stat.st_mtime_ns
+                else:
+                    files_size += entry_stat.st_size
+
+        return files_size, subdirs, complete
+
+    def _stat_subdirs(
+        self, path: Path, device: int, names: dict[str, _DirSizes], check_oserror: bool
+    ) -> tuple[dict[str, int], bool]:
+        """Return mtime of the known subdirs of an unchanged directory and if complete."""
+        subdirs: dict[str, int] = {}
+        complete = True
+        for name in names:
             try:
-                stat = child.stat(follow_symlinks=False)
+                subdir_stat = (path / name).stat(follow_symlinks=False)
             except FileNotFoundError:
-                # File might disappear between listing and stat, ignore
-                _LOGGER.warning("File not found: %s", child.as_posix())
                 continue
             except OSError as err:
-                if check_oserror:
-                    self.sys_resolution.check_oserror(err)
-                if err.errno == errno.EBADMSG:
-                    break
-                continue
+                complete = False
+                if self._walk_oserror(err, check_oserror):
+                    continue
+                break
 
-            if stat.st_dev != root_device:
-                continue
+            if subdir_stat.st_dev == device and stat.S_ISDIR(subdir_stat.st_mode):
+                subdirs[name] = subdir_stat.st_mtime_ns
 
-            if not child.is_dir():
-                size += stat.st_size
-                continue
+        return subdirs, complete
 
-            child_result = self.get_dir_structure_sizes(
-                child, max_depth - 1, check_oserror=check_oserror
-            )
-            if child_result["used_bytes"] > 0:
-                size += child_result["used_bytes"]
-                if max_depth > 1:
-                    children.append(
-                        {
-                            "id": child.name,
-                            "label": child.name,
-                            **child_result,
-                        }
-                    )
-
-        if children:
-            return {"used_bytes": size, "children": children}
-
-        return {"used_bytes": size}
+    def _walk_oserror(self, err: OSError, check_oserror: bool) -> bool:
+        """Handle an error reading an entry, return false if listing must stop."""
+        if check_oserror:
+            self.sys_resolution.check_oserror(err)
+        return err.errno != errno.EBADMSG
 
     def get_dir_sizes(
         self, request: dict[str, Path], max_depth: int = 1
@@ -91,7 +91,9 @@ class HomeAssistantCore(JobGroup):
     async def load(self) -> None:
         """Prepare Home Assistant object."""
         self._watchdog_listener = self.sys_bus.register_event(
-            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.watchdog_container
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            self.watchdog_container,
+            key=self.instance.name,
         )
         self.sys_bus.register_event(
             BusEvent.SUPERVISOR_STATE_CHANGE, self._supervisor_state_changed
@@ -4,8 +4,12 @@ from enum import StrEnum
 
 PARAM_BOOT_ID = "_BOOT_ID"
 PARAM_FOLLOW = "follow"
+PARAM_PRIORITY = "PRIORITY"
 PARAM_SYSLOG_IDENTIFIER = "SYSLOG_IDENTIFIER"
 
+# Names of syslog priorities, the index is the value of the journal field
+LOG_PRIORITIES = ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug")
+
 
 class InterfaceMethod(StrEnum):
     """Configuration of an interface."""
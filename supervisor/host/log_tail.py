@@ -0,0 +1,164 @@
+"""Shared tail of the journal entries of syslog identifiers."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+import logging
+
+from aiohttp import ClientError
+
+from ..coresys import CoreSys, CoreSysAttributes
+from ..exceptions import HassioError
+from ..utils.systemd_journal import (
+    JOURNAL_READ_SIZE,
+    JournalExportParser,
+    journal_verbose_formatter,
+)
+from .const import PARAM_FOLLOW, PARAM_SYSLOG_IDENTIFIER, LogFormat
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Entries kept in memory per tail
+TAIL_SIZE = 1000
+
+# Seconds a tail keeps following the journal after its last client left
+TAIL_IDLE_TIMEOUT = 60
+
+# Fields kept of each entry, enough for all formatters and latest logs
+TAIL_FIELDS = frozenset(
+    [*journal_verbose_formatter.required_fields, "CONTAINER_LOG_EPOCH"]
+)
+
+
+class JournalTail(CoreSysAttributes):
+    """Last entries of syslog identifiers, updated by a single follow stream.
+
+    Entries are numbered in order of arrival, so clients following the tail
+    keep the number of the next entry they need. Numbers of entries dropped
+    from the tail stay valid, a client too far behind continues with the
+    oldest entry kept.
+    """
+
+    def __init__(self, coresys: CoreSys, identifiers: tuple[str, ...]):
+        """Initialize journal tail."""
+        self.coresys: CoreSys = coresys
+        self.identifiers: tuple[str, ...] = identifiers
+        self.complete: bool = False
+        self._entries: deque[dict[str, str]] = deque(maxlen=TAIL_SIZE)
+        self._dropped: int = 0
+        self._ready = asyncio.Event()
+        self._changed = asyncio.Condition()
+        self._task: asyncio.Task | None = None
+        self._clients: int = 0
+        self._idle_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return true if tail follows the journal."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stopped(self) -> bool:
+        """Return true if tail stopped following the journal."""
+        return self._ready.is_set() and not self.running
+
+    @property
+    def start(self) -> int:
+        """Return number of the oldest entry kept."""
+        return self._dropped
+
+    @property
+    def end(self) -> int:
+        """Return number of the next entry."""
+        return self._dropped + len(self._entries)
+
+    def find(self, cursor: str) -> int | None:
+        """Return number of the entry with a cursor, None if not kept."""
+        for index, entry in enumerate(reversed(self._entries)):
+            if entry.get("__CURSOR") == cursor:
+                return self.end - index - 1
+        return None
+
+    def entries(self, start: int, end: int | None = None) -> list[dict[str, str]]:
+        """Return entries from number start up to end."""
+        start = max(start, self._dropped) - self._dropped
+        end = None if end is None else max(start, end - self._dropped)
+        return list(islice(self._entries, start, end))
+
+    def _append(self, entries: list[dict[str, str]]) -> None:
+        """Add entries, dropping the oldest ones."""
+        self._dropped += max(0, len(self._entries) + len(entries) - TAIL_SIZE)
+        self._entries.extend(entries)
+        if self._dropped:
+            # Oldest entries of the journal are no longer kept
+            self.complete = False
+
+    async def wait(self, end: int) -> bool:
+        """Wait for entries after number end, return false if tail stopped."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.end > end or not self.running)
+        return self.end > end
+
+    async def _read(self, params: dict, range_header: str) -> str | None:
+        """Add entries from the journal, return the last cursor read."""
+        parser = JournalExportParser(TAIL_FIELDS)
+        cursor: str | None = None
+        async with self.sys_host.logs.journald_logs(
+            params=params, range_header=range_header, accept=LogFormat.JOURNAL
+        ) as resp:
+            while data := await resp.content.read(JOURNAL_READ_SIZE):
+                if not (entries := parser.feed(data)):
+                    continue
+                self._append(entries)
+                cursor = entries[-1].get("__CURSOR", cursor)
+                async with self._changed:
+                    self._changed.notify_all()
+        return cursor
+
+    async def _follow(self) -> None:
+        """Read the last entries and follow the journal until cancelled."""
+        params: dict = {PARAM_SYSLOG_IDENTIFIER: list(self.identifiers)}
+        try:
+            cursor = await self._read(params, f"entries=:-{TAIL_SIZE - 1}:{TAIL_SIZE}")
+            self.complete = not self._dropped and len(self._entries) < TAIL_SIZE
+            self._ready.set()
+
+            # Continue after the last entry, or from the start if there was none
+            await self._read(
+                params | {PARAM_FOLLOW: ""},
+                f"entries={cursor}:1:" if cursor else "entries=:0:",
+            )
+        except (ClientError, TimeoutError, HassioError) as err:
+            _LOGGER.warning(
+                "Stopped following logs of %s: %s", ", ".join(self.identifiers), err
+            )
+        finally:
+            self._ready.set()
+            self._task = None
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def acquire(self) -> bool:
+        """Add a client, return true once the tail holds the last entries."""
+        self._clients += 1
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if not self._task and not self._ready.is_set():
+            self._task = self.sys_create_task(self._follow())
+        await self._ready.wait()
+        return self.running
+
+    def release(self) -> None:
+        """Remove a client, stop following the journal once idle."""
+        self._clients -= 1
+        if self._clients == 0 and self.running:
+            self._idle_handle = self.sys_loop.call_later(TAIL_IDLE_TIMEOUT, self.stop)
+
+    def stop(self) -> None:
+        """Stop following the journal."""
+        if self._idle_handle:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self._task:
+            self._task.cancel()
@@ -27,6 +27,7 @@ from ..exceptions import (
 from ..utils.json import read_json_file
 from ..utils.systemd_journal import journal_boots_reader
 from .const import PARAM_BOOT_ID, PARAM_SYSLOG_IDENTIFIER, LogFormat
+from .log_tail import JournalTail
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -61,6 +62,7 @@ class LogsControl(CoreSysAttributes):
         self._boot_ids: list[str] = []
         self._default_identifiers: list[str] = []
         self._available: bool = False
+        self._tails: dict[tuple[str, ...], JournalTail] = {}
 
     async def post_init(self) -> Self:
         """Post init actions that must occur in event loop."""
@@ -201,6 +203,30 @@ class LogsControl(CoreSysAttributes):
                 _LOGGER.error,
             ) from err
 
+    @asynccontextmanager
+    async def tail(
+        self, identifiers: str | list[str]
+    ) -> AsyncGenerator[JournalTail | None]:
+        """Use the shared tail of syslog identifiers.
+
+        Yields None if the tail can't follow the journal.
+        """
+        key = (
+            (identifiers,)
+            if isinstance(identifiers, str)
+            else tuple(sorted(identifiers))
+        )
+        self._tails = {
+            tail_key: tail for tail_key, tail in self._tails.items() if not tail.stopped
+        }
+        if not (tail := self._tails.get(key)):
+            tail = self._tails[key] = JournalTail(self.coresys, key)
+
+        try:
+            yield tail if await tail.acquire() else None
+        finally:
+            tail.release()
+
     @asynccontextmanager
     async def journald_logs(
         self,
@@ -0,0 +1,174 @@
+"""Cache for outbound HTTP requests of Supervisor."""
+
+from dataclasses import asdict, dataclass
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from .const import (
+    ATTR_CONTENT,
+    ATTR_ENTRIES,
+    ATTR_ETAG,
+    ATTR_IMMUTABLE,
+    ATTR_LAST_MODIFIED,
+    FILE_HASSIO_HTTP_CACHE,
+)
+from .coresys import CoreSys, CoreSysAttributes
+from .utils.common import FileConfiguration
+from .validate import SCHEMA_HTTP_CACHE_CONFIG
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Responses kept in the store, the least recently used one is dropped first
+MAX_ENTRIES = 64
+
+# Larger responses are not stored
+MAX_CONTENT_SIZE = 256 * 1024
+
+# Seconds a bearer token is reused without an expiry from the token server
+DEFAULT_TOKEN_EXPIRY = 60
+
+# Seconds before its expiry a bearer token is no longer reused
+TOKEN_EXPIRY_MARGIN = 10
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResponse:
+    """Response of a request through the cache."""
+
+    status: int
+    content: bytes
+    cached: bool
+
+
+@dataclass(slots=True)
+class HttpCacheStats:
+    """Counters of requests and token lookups through the cache."""
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+    token_hits: int = 0
+    token_misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return dictionary representation."""
+        return asdict(self)
+
+
+class HttpCache(FileConfiguration, CoreSysAttributes):
+    """Cache outbound HTTP responses and bearer tokens.
+
+    Responses with an ETag or Last-Modified header are stored and revalidated
+    with a conditional request. Immutable responses, like manifests by digest,
+    are served from the store without a request. Bearer tokens are only kept
+    in memory.
+    """
+
+    save_delay = 10
+    save_max_delay = 60
+
+    def __init__(self, coresys: CoreSys):
+        """Initialize HTTP cache."""
+        super().__init__(FILE_HASSIO_HTTP_CACHE, SCHEMA_HTTP_CACHE_CONFIG)
+        self.coresys: CoreSys = coresys
+        self.stats: HttpCacheStats = HttpCacheStats()
+        self._tokens: dict[str, tuple[str, float]] = {}
+
+    @property
+    def _entries(self) -> dict[str, dict[str, Any]]:
+        """Return stored responses by URL."""
+        return self._data[ATTR_ENTRIES]
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        immutable: bool = False,
+    ) -> CachedResponse:
+        """Get URL, from the store if still valid.
+
+        Immutable responses are never revalidated. Raises the errors of the
+        websession.
+        """
+        if entry := self._entries.pop(url, None):
+            # Keep most recently used entries last
+            self._entries[url] = entry
+            if entry[ATTR_IMMUTABLE]:
+                self.stats.hits += 1
+                return CachedResponse(200, entry[ATTR_CONTENT].encode(), cached=True)
+
+        request_headers = dict(headers or {})
+        if entry and ATTR_ETAG in entry:
+            request_headers[hdrs.IF_NONE_MATCH] = entry[ATTR_ETAG]
+        if entry and ATTR_LAST_MODIFIED in entry:
+            request_headers[hdrs.IF_MODIFIED_SINCE] = entry[ATTR_LAST_MODIFIED]
+
+        async with self.sys_websession.get(
+            url, headers=request_headers, timeout=timeout
+        ) as resp:
+            if entry and resp.status == 304:
+                self.stats.revalidations += 1
+                return CachedResponse(200, entry[ATTR_CONTENT].encode(), cached=True)
+
+            response = CachedResponse(resp.status, await resp.read(), cached=False)
+            validators = {
+                attr: value
+                for attr, header in (
+                    (ATTR_ETAG, hdrs.ETAG),
+                    (ATTR_LAST_MODIFIED, hdrs.LAST_MODIFIED),
+                )
+                if (value := resp.headers.get(header))
+            }
+
+        self.stats.misses += 1
+        if response.status == 200 and (immutable or validators):
+            await self._store(url, response.content, validators, immutable=immutable)
+        return response
+
+    async def _store(
+        self,
+        url: str,
+        content: bytes,
+        validators: dict[str, str],
+        *,
+        immutable: bool,
+    ) -> None:
+        """Store response, dropping the least recently used ones over the limit."""
+        if len(content) > MAX_CONTENT_SIZE:
+            return
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            _LOGGER.debug("Not caching response of %s, content is not text", url)
+            return
+
+        self._entries.pop(url, None)
+        self._entries[url] = {
+            ATTR_CONTENT: text,
+            ATTR_IMMUTABLE: immutable,
+            **validators,
+        }
+        while len(self._entries) > MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        await self.save_data()
+
+    def get_token(self, key: str) -> str | None:
+        """Return bearer token for key unless it expired."""
+        if (cached := self._tokens.get(key)) and cached[1] > self.sys_loop.time():
+            self.stats.token_hits += 1
+            return cached[0]
+
+        self._tokens.pop(key, None)
+        self.stats.token_misses += 1
+        return None
+
+    def set_token(self, key: str, token: str, expires_in: float | None) -> None:
+        """Keep bearer token for key until shortly before it expires."""
+        expires_in = (expires_in or DEFAULT_TOKEN_EXPIRY) - TOKEN_EXPIRY_MARGIN
+        if expires_in > 0:
+            self._tokens[key] = (token, self.sys_loop.time() + expires_in)
@@ -1,9 +1,17 @@
 """Fetch last versions from webserver."""
 
-from datetime import timedelta
+import asyncio
+from dataclasses import dataclass
+import heapq
 import logging
+import math
 import random
 import secrets
+import time
+from types import MappingProxyType
+from typing import Any
+
+import aiohttp
 
 from .apps.app import App
 from .const import (
@@ -13,6 +21,7 @@ from .const import (
     FILE_HASSIO_INGRESS,
     INGRESS_DYNAMIC_PORT_MAX,
     INGRESS_DYNAMIC_PORT_MIN,
+    SERVER_SOFTWARE,
     IngressSessionData,
     IngressSessionDataDict,
 )
@@ -20,11 +29,157 @@ from .coresys import CoreSys, CoreSysAttributes
 from .exceptions import HomeAssistantAPIError
 from .utils import check_port
 from .utils.common import FileConfiguration
-from .utils.dt import utc_from_timestamp, utcnow
 from .validate import SCHEMA_INGRESS_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Limits of the keep-alive connection pool to the ingress port of each app
+INGRESS_POOL_SIZE = 64
+INGRESS_KEEPALIVE_TIMEOUT = 30
+
+# Sessions are valid for this many seconds after their last use
+SESSION_TIMEOUT = 15 * 60
+# A session is renewed at most once within this many seconds
+SESSION_RENEW_DEBOUNCE = 60
+# Changed sessions are written to disk after this many seconds
+SESSION_SAVE_DELAY = 60
+
+
+@dataclass(slots=True)
+class IngressProxyStats:
+    """Proxy statistics of an ingress app."""
+
+    requests: int = 0
+    errors: int = 0
+    websockets: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_last: float | None = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    def record_latency(self, latency: float) -> None:
+        """Record time until the app responded to a request."""
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_last = latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary representation."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "websockets": self.websockets,
+            "latency_avg": round(self.latency_total / self.requests, 4)
+            if self.requests
+            else None,
+            "latency_max": round(self.latency_max, 4),
+            "latency_last": round(self.latency_last, 4)
+            if self.latency_last is not None
+            else None,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class IngressSessionStore:
+    """Ingress sessions with expiry deadlines on a monotonic clock.
+
+    Deadlines are kept in a heap. A renewal pushes a new entry and leaves the
+    old one in place, outdated entries are skipped once they are popped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize session store."""
+        self._expires: dict[str, float] = {}
+        self._data: dict[str, IngressSessionDataDict] = {}
+        self._heap: list[tuple[float, str]] = []
+        self.changed: bool = False
+
+    def __contains__(self, session: str) -> bool:
+        """Return True if session is known."""
+        return session in self._expires
+
+    def __len__(self) -> int:
+        """Return number of sessions."""
+        return len(self._expires)
+
+    @property
+    def data(self) -> dict[str, IngressSessionDataDict]:
+        """Return complementary data of sessions."""
+        return self._data
+
+    def add(
+        self, session: str, expires: float, data: IngressSessionDataDict | None = None
+    ) -> None:
+        """Add a session valid until the monotonic time expires."""
+        self._expires[session] = expires
+        heapq.heappush(self._heap, (expires, session))
+        if data is not None:
+            self._data[session] = data
+        self.changed = True
+
+    def validate(self, session: str, now: float) -> bool:
+        """Return True if session is valid and renew it."""
+        if (expires := self._expires.get(session)) is None:
+            _LOGGER.debug("Session %s is not known", session)
+            return False
+
+        if expires <= now:
+            _LOGGER.debug("Session is no longer valid (%.0fs ago)", now - expires)
+            return False
+
+        if expires - now < SESSION_TIMEOUT - SESSION_RENEW_DEBOUNCE:
+            self.add(session, now + SESSION_TIMEOUT)
+        return True
+
+    def expire(self, now: float) -> int:
+        """Remove sessions expired at the monotonic time now."""
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            expires, session = heapq.heappop(self._heap)
+            if self._expires.get(session) != expires:
+                continue
+
+            del self._expires[session]
+            self._data.pop(session, None)
+            removed += 1
+
+        if removed:
+            self.changed = True
+        return removed
+
+    def load(
+        self,
+        sessions: dict[str, float],
+        sessions_data: dict[str, IngressSessionDataDict],
+        now: float,
+        timestamp: float,
+    ) -> None:
+        """Load sessions from timestamps valid at the monotonic time now."""
+        self._expires.clear()
+        self._data.clear()
+        for session, valid in sessions.items():
+            if not math.isfinite(valid):
+                _LOGGER.warning("Session timestamp %f is invalid!", valid)
+                continue
+
+            self._expires[session] = now + valid - timestamp
+            if session_data := sessions_data.get(session):
+                self._data[session] = session_data
+
+        self._heap = [(expires, session) for session, expires in self._expires.items()]
+        heapq.heapify(self._heap)
+        self.changed = False
+
+    def dump(self, now: float, timestamp: float) -> dict[str, float]:
+        """Return timestamps of sessions at the monotonic time now."""
+        return {
+            session: timestamp + expires - now
+            for session, expires in self._expires.items()
+        }
+
 
 class Ingress(FileConfiguration, CoreSysAttributes):
     """Fetch last versions from version.json."""
@@ -34,6 +189,10 @@ class Ingress(FileConfiguration, CoreSysAttributes):
         super().__init__(FILE_HASSIO_INGRESS, SCHEMA_INGRESS_CONFIG)
         self.coresys: CoreSys = coresys
         self.tokens: dict[str, str] = {}
+        self.proxy_stats: dict[str, IngressProxyStats] = {}
+        self._sessions: IngressSessionStore = IngressSessionStore()
+        self._save_timer: asyncio.TimerHandle | None = None
+        self._websessions: dict[str, aiohttp.ClientSession] = {}
 
     def get(self, token: str) -> App | None:
         """Return app they have this ingress token."""
@@ -43,19 +202,19 @@ class Ingress(FileConfiguration, CoreSysAttributes):
 
     def get_session_data(self, session_id: str) -> IngressSessionData | None:
         """Return complementary data of current session or None."""
-        if data := self.sessions_data.get(session_id):
+        if data := self._sessions.data.get(session_id):
             return IngressSessionData.from_dict(data)
         return None
 
     @property
     def sessions(self) -> dict[str, float]:
-        """Return sessions."""
-        return self._data[ATTR_SESSION]
+        """Return sessions with the timestamp they are valid until."""
+        return self._sessions.dump(self.sys_loop.time(), time.time())
 
     @property
     def sessions_data(self) -> dict[str, IngressSessionDataDict]:
         """Return sessions_data."""
-        return self._data[ATTR_SESSION_DATA]
+        return self._sessions.data
 
     @property
     def ports(self) -> dict[str, int]:
@@ -75,46 +234,55 @@ class Ingress(FileConfiguration, CoreSysAttributes):
     async def load(self) -> None:
         """Update internal data."""
         self._update_token_list()
-        self._cleanup_sessions()
+        self._sessions.expire(self.sys_loop.time())
 
-        _LOGGER.info("Loaded %d ingress sessions", len(self.sessions))
+        _LOGGER.info("Loaded %d ingress sessions", len(self._sessions))
 
     async def reload(self) -> None:
         """Reload/Validate sessions."""
-        self._cleanup_sessions()
+        if self._sessions.expire(self.sys_loop.time()):
+            self._schedule_save()
         self._update_token_list()
 
+        # Drop connection pools of apps without ingress
+        slugs = {app.slug for app in self.apps}
+        for slug in self._websessions.keys() - slugs:
+            await self._websessions.pop(slug).close()
+            self.proxy_stats.pop(slug, None)
+
     async def unload(self) -> None:
         """Shutdown sessions."""
         await self.save_data()
-
-    def _cleanup_sessions(self) -> None:
-        """Remove not used sessions."""
-        now = utcnow()
-
-        sessions = {}
-        sessions_data: dict[str, IngressSessionDataDict] = {}
-        for session, valid in self.sessions.items():
-            # check if timestamp valid, to avoid crash on malformed timestamp
-            try:
-                valid_dt = utc_from_timestamp(valid)
-            except OverflowError:
-                _LOGGER.warning("Session timestamp %f is invalid!", valid)
-                continue
-
-            if valid_dt < now:
-                continue
-
-            # Is valid
-            sessions[session] = valid
-            if session_data := self.sessions_data.get(session):
-                sessions_data[session] = session_data
-
-        # Write back
-        self.sessions.clear()
-        self.sessions.update(sessions)
-        self.sessions_data.clear()
-        self.sessions_data.update(sessions_data)
+        await self.close_websessions()
+
+    def get_websession(self, app: App) -> aiohttp.ClientSession:
+        """Return client session with a keep-alive connection pool to app."""
+        websession = self._websessions.get(app.slug)
+        if websession and not websession.closed:
+            return websession
+
+        websession = aiohttp.ClientSession(
+            headers=MappingProxyType({aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE}),
+            connector=aiohttp.TCPConnector(
+                limit=INGRESS_POOL_SIZE,
+                keepalive_timeout=INGRESS_KEEPALIVE_TIMEOUT,
+            ),
+        )
+        self._websessions[app.slug] = websession
+        return websession
+
+    def get_proxy_stats(self, app: App) -> IngressProxyStats:
+        """Return proxy statistics of app."""
+        if app.slug not in self.proxy_stats:
+            self.proxy_stats[app.slug] = IngressProxyStats()
+        return self.proxy_stats[app.slug]
+
+    async def close_websessions(self) -> None:
+        """Close connection pools to all apps."""
+        websessions = list(self._websessions.values())
+        self._websessions.clear()
+        for websession in websessions:
+            await websession.close()
 
     def _update_token_list(self) -> None:
         """Regenerate token <-> App map."""
@@ -128,37 +296,58 @@ class Ingress(FileConfiguration, CoreSysAttributes):
     def create_session(self, data: IngressSessionData | None = None) -> str:
         """Create new session."""
         session = secrets.token_hex(64)
-        valid = utcnow() + timedelta(minutes=15)
-
-        self.sessions[session] = valid.timestamp()
-        if data is not None:
-            self.sessions_data[session] = data.to_dict()
+        self._sessions.add(
+            session,
+            self.sys_loop.time() + SESSION_TIMEOUT,
+            data.to_dict() if data is not None else None,
+        )
+        self._schedule_save()
 
         return session
 
     def validate_session(self, session: str) -> bool:
         """Return True if session valid and make it longer valid."""
-        if session not in self.sessions:
-            _LOGGER.debug("Session %s is not known", session)
-            return False
+        now = self.sys_loop.time()
+        self._sessions.expire(now)
+        valid = self._sessions.validate(session, now)
 
-        # check if timestamp valid, to avoid crash on malformed timestamp
-        try:
-            valid_until = utc_from_timestamp(self.sessions[session])
-        except OverflowError:
-            self.sessions[session] = (utcnow() + timedelta(minutes=15)).timestamp()
-            return True
-
-        # Is still valid?
-        if valid_until < utcnow():
-            _LOGGER.debug("Session is no longer valid (%f/%f)", valid_until, utcnow())
-            return False
+        if self._sessions.changed:
+            self._schedule_save()
+        return valid
 
-        # Update time
-        valid_until = valid_until + timedelta(minutes=15)
-        self.sessions[session] = valid_until.timestamp()
+    def _schedule_save(self) -> None:
+        """Save sessions after a delay, batching all changes until then."""
+        if self._save_timer:
+            return
 
-        return True
+        def _save() -> None:
+            self._save_timer = None
+            self.sys_create_task(self.save_data())
+
+        self._save_timer = self.sys_call_later(SESSION_SAVE_DELAY, _save)
+
+    async def read_data(self) -> None:
+        """Read configuration file and load sessions."""
+        await super().read_data()
+        self._sessions.load(
+            self._data[ATTR_SESSION],
+            self._data[ATTR_SESSION_DATA],
+            asyncio.get_running_loop().time(),
+            time.time(),
+        )
+
+    async def save_data(self) -> None:
+        """Store sessions and ports to file."""
+        if self._save_timer:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+        self._data[ATTR_SESSION] = self._sessions.dump(
+            self.sys_loop.time(), time.time()
+        )
+        self._data[ATTR_SESSION_DATA] = dict(self._sessions.data)
+        self._sessions.changed = False
+        await super().save_data()
 
     async def get_dynamic_port(self, app_slug: str) -> int:
         """Get/Create a dynamic port from range."""
@@ -24,7 +24,13 @@ from ..homeassistant.const import WSEvent
 from ..utils.common import FileConfiguration
 from ..utils.dt import utcnow
 from ..utils.sentinel import DEFAULT
-from .const import ATTR_IGNORE_CONDITIONS, FILE_CONFIG_JOBS, JobCondition
+from .const import (
+    ATTR_HISTORY_SIZE,
+    ATTR_IGNORE_CONDITIONS,
+    DEFAULT_HISTORY_SIZE,
+    FILE_CONFIG_JOBS,
+    JobCondition,
+)
 from .validate import SCHEMA_JOBS_CONFIG
 
 # Context vars only act as a global within the same asyncio task
@@ -42,6 +48,11 @@ LEGACY_BACKUP_RESTORE_STAGE_MAP: dict[str, str] = {
     "remove_delta_apps": "remove_delta_addons",
 }
 
+# Changes of these attributes are sent to Home Assistant immediately, all
+# other changes are coalesced per job and sent once per JOB_EVENT_INTERVAL
+JOB_EVENT_IMMEDIATE_ATTRIBUTES = {"done", "errors", "stage"}
+JOB_EVENT_INTERVAL = 0.25
+
 BACKUP_RESTORE_JOB_NAMES: set[str] = {
     "backup_manager_full_restore",
     "backup_manager_partial_restore",
@@ -282,6 +293,14 @@ class JobManager(FileConfiguration, CoreSysAttributes):
         super().__init__(FILE_CONFIG_JOBS, SCHEMA_JOBS_CONFIG)
         self.coresys: CoreSys = coresys
         self._jobs: dict[str, SupervisorJob] = {}
+        # Jobs by parent ID in creation order, None holds the root jobs
+        self._children: dict[str | None, dict[str, SupervisorJob]] = {}
+        # Finished root jobs which are kept, oldest first
+        self._history: dict[str, SupervisorJob] = {}
+        self._pending_events: dict[str, SupervisorJob] = {}
+        self._flush_events_handle: asyncio.TimerHandle | None = None
+        self._events_sent: int = 0
+        self._events_suppressed: int = 0
 
         # Ensure tasks created via CoreSys.create_task do not have a parent
         self.coresys.add_set_task_context_callback(_remove_current_job)
@@ -291,6 +310,22 @@ class JobManager(FileConfiguration, CoreSysAttributes):
         """Return a list of current jobs."""
         return list(self._jobs.values())
 
+    @property
+    def event_stats(self) -> dict[str, int]:
+        """Return counts of job events sent and suppressed by coalescing."""
+        return {"sent": self._events_sent, "suppressed": self._events_suppressed}
+
+    @property
+    def history_size(self) -> int:
+        """Return number of finished root jobs kept."""
+        return self._data.get(ATTR_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)
+
+    @history_size.setter
+    def history_size(self, value: int) -> None:
+        """Set number of finished root jobs kept."""
+        self._data[ATTR_HISTORY_SIZE] = value
+        self._trim_history()
+
     @property
     def ignore_conditions(self) -> list[JobCondition]:
         """Return a list of ignore conditions."""
@@ -317,24 +352,50 @@ class JobManager(FileConfiguration, CoreSysAttributes):
         """Return true if there is an active job for the current asyncio task."""
         return _CURRENT_JOB.get() is not None
 
-    def _on_job_change(
-        self, job: SupervisorJob, attribute: Attribute, value: Any
-    ) -> None:
-        """Take on change actions such as notify home assistant and sync progress."""
-        # Job object will be before the change. Combine the change with current data
-        if attribute.name == "errors":
-            value = [err.as_dict() for err in value]
-        job_data = job.as_dict() | {attribute.name: value}
+    def _send_job_event(self, job_data: dict[str, Any]) -> None:
+        """Send a job event to Home Assistant."""
         if not self.sys_config.feature_flags.get(
             FeatureFlag.SUPERVISOR_WEBSOCKET_V2_API, False
         ):
             job_data = process_job_dict_for_legacy_compatibility(job_data)
 
-        # Notify Home Assistant of change if its not internal
-        if not job.internal:
-            self.sys_homeassistant.websocket.supervisor_event(WSEvent.JOB, job_data)
+        self._events_sent += 1
+        self.sys_homeassistant.websocket.supervisor_event(WSEvent.JOB, job_data)
+
+    def _flush_job_events(self) -> None:
+        """Send latest state of all jobs with coalesced changes."""
+        self._flush_events_handle = None
+        pending = self._pending_events
+        self._pending_events = {}
+        for job in pending.values():
+            self._send_job_event(job.as_dict())
+
+    def _notify_job_change(
+        self, job: SupervisorJob, attribute: Attribute, value: Any
+    ) -> None:
+        """Notify Home Assistant of a job change, coalescing progress updates."""
+        if JOB_EVENT_INTERVAL and attribute.name not in JOB_EVENT_IMMEDIATE_ATTRIBUTES:
+            # Job object is serialized on flush, when it holds the latest change
+            if job.uuid in self._pending_events:
+                self._events_suppressed += 1
+            self._pending_events[job.uuid] = job
+            if not self._flush_events_handle:
+                self._flush_events_handle = self.sys_call_later(
+                    JOB_EVENT_INTERVAL, self._flush_job_events
+                )
+            return
+
+        # Event has the latest state, drop an older one waiting for flush
+        if self._pending_events.pop(job.uuid, None):
+            self._events_suppressed += 1
 
-        # If we have any parent job syncs, sync progress to them
+        # Job object will be before the change. Combine the change with current data
+        if attribute.name == "errors":
+            value = [err.as_dict() for err in value]
+        self._send_job_event(job.as_dict() | {attribute.name: value})
+
+    def _sync_parent_progress(self, job: SupervisorJob, progress: float) -> None:
+        """Sync progress of a job to parent jobs it has a sync with."""
         for sync in job.parent_job_syncs:
             try:
                 parent_job = self.get_job(sync.uuid)
@@ -343,15 +404,29 @@ class JobManager(FileConfiguration, CoreSysAttributes):
                 # reporting shouldn't raise and break the active job
                 continue
 
-            progress = min(
+            parent_progress = min(
                 100,
-                sync.starting_progress
-                + (sync.progress_allocation * job_data["progress"]),
+                sync.starting_progress + (sync.progress_allocation * progress),
             )
             # Using max would always trigger on change even if progress was unchanged
             # pylint: disable-next=R1731
-            if parent_job.progress < progress:  # noqa: PLR1730
-                parent_job.progress = progress
+            if parent_job.progress < parent_progress:  # noqa: PLR1730
+                parent_job.progress = parent_progress
+
+    def _on_job_change(
+        self, job: SupervisorJob, attribute: Attribute, value: Any
+    ) -> None:
+        """Take on change actions such as notify home assistant and sync progress."""
+        # Notify Home Assistant of change if its not internal
+        if not job.internal:
+            self._notify_job_change(job, attribute, value)
+
+        # Stage and error changes don't move progress of parent jobs
+        if job.parent_job_syncs and attribute.name not in ("errors", "stage"):
+            self._sync_parent_progress(
+                job,
+                value if attribute.name == "progress" else round(job.progress, 1),
+            )
 
         if attribute.name == "done":
             if value is False:
@@ -359,6 +434,11 @@ class JobManager(FileConfiguration, CoreSysAttributes):
             if value is True:
                 self.sys_bus.fire_event(BusEvent.SUPERVISOR_JOB_END, job)
 
+    def _trim_history(self) -> None:
+        """Remove oldest finished root jobs beyond the history size."""
+        while len(self._history) > self.history_size:
+            self.remove_job(next(iter(self._history.values())))
+
     def new_job(
         self,
         name: str | None = None,
@@ -425,6 +505,7 @@ class JobManager(FileConfiguration, CoreSysAttributes):
                     break
 
         self._jobs[job.uuid] = job
+        self._children.setdefault(job.parent_id, {})[job.uuid] = job
         return job
 
     def get_job(self, uuid: str) -> SupervisorJob:
@@ -433,6 +514,20 @@ class JobManager(FileConfiguration, CoreSysAttributes):
             raise JobNotFound(f"No job found with id {uuid}")
         return self._jobs[uuid]
 
+    def children(self, parent_id: str | None) -> list[SupervisorJob]:
+        """Return jobs of a parent in creation order, root jobs for None."""
+        return list(self._children.get(parent_id, {}).values())
+
+    def retain_job(self, job: SupervisorJob) -> None:
+        """Keep a finished job for the API instead of removing it.
+
+        Root jobs are added to the history, the oldest are removed once it is
+        full. Sub jobs are removed along with their root job.
+        """
+        if job.parent_id is None and job.uuid in self._jobs:
+            self._history[job.uuid] = job
+            self._trim_history()
+
     def remove_job(self, job: SupervisorJob) -> None:
         """Remove a job by UUID."""
         if job.uuid not in self._jobs:
@@ -442,10 +537,15 @@ class JobManager(FileConfiguration, CoreSysAttributes):
             _LOGGER.warning("Removing incomplete job %s from job manager", job.name)
 
         del self._jobs[job.uuid]
-
-        # Clean up any completed sub jobs of this one
-        for sub_job in self.jobs:
-            if sub_job.parent_id == job.uuid and job.done:
+        self._history.pop(job.uuid, None)
+        siblings = self._children[job.parent_id]
+        del siblings[job.uuid]
+        if not siblings:
+            del self._children[job.parent_id]
+
+        # Clean up any sub jobs of this one once it completed
+        if job.done:
+            for sub_job in self.children(job.uuid):
                 self.remove_job(sub_job)
 
     def schedule_job(
@@ -7,8 +7,12 @@ from ..const import SUPERVISOR_DATA
 
 FILE_CONFIG_JOBS = Path(SUPERVISOR_DATA, "jobs.json")
 
+ATTR_HISTORY_SIZE = "history_size"
 ATTR_IGNORE_CONDITIONS = "ignore_conditions"
 
+# Finished jobs kept for the API by default
+DEFAULT_HISTORY_SIZE = 50
+
 JOB_GROUP_APP = "app_{slug}"
 JOB_GROUP_BACKUP = "backup_{slug}"
 JOB_GROUP_BACKUP_MANAGER = "backup_manager"
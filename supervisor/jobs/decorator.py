@@ -55,7 +55,7 @@ class Job(CoreSysAttributes):
         Args:
             name (str): Unique name for the job. Must not be duplicated.
             conditions (list[JobCondition] | None): List of conditions that must be met before the job runs.
-            cleanup (bool): Whether to clean up the job after execution. Defaults to True. If set to False, the job will remain accessible through the Supervisor API until the next restart.
+            cleanup (bool): Whether to clean up the job after execution. Defaults to True. If set to False, the job will remain accessible through the Supervisor API until it is removed, dropped from the job history or the next restart.
             on_condition (type[JobException] | None): Exception type to raise if a job condition fails. If None, logs the failure.
             concurrency (JobConcurrency | None): Concurrency control policy (e.g., reject, queue, group-based).
             throttle (JobThrottle | None): Throttling policy (e.g., throttle, rate_limit, group-based).
@@ -320,6 +320,8 @@ class Job(CoreSysAttributes):
                     and self.cleanup
                 ):
                     self.sys_jobs.remove_job(job)
+                else:
+                    self.sys_jobs.retain_job(job)
 
         return wrapper
 
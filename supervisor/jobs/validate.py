@@ -2,10 +2,18 @@
 
 import voluptuous as vol
 
-from .const import ATTR_IGNORE_CONDITIONS, JobCondition
+from .const import (
+    ATTR_HISTORY_SIZE,
+    ATTR_IGNORE_CONDITIONS,
+    DEFAULT_HISTORY_SIZE,
+    JobCondition,
+)
+
+job_history_size = vol.All(vol.Coerce(int), vol.Range(min=0, max=1000))
 
 SCHEMA_JOBS_CONFIG = vol.Schema(
     {
+        vol.Optional(ATTR_HISTORY_SIZE, default=DEFAULT_HISTORY_SIZE): job_history_size,
         vol.Optional(ATTR_IGNORE_CONDITIONS, default=list): [vol.Coerce(JobCondition)],
     },
     extra=vol.REMOVE_EXTRA,
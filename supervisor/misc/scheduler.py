@@ -4,14 +4,28 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
+import heapq
+from itertools import count
 import logging
+import random
+from typing import Any
 from uuid import UUID, uuid4
 
 from ..const import CoreState
 from ..coresys import CoreSys, CoreSysAttributes
+from ..utils.dt import utcnow
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Interval tasks are delayed by a random part of their interval, so tasks
+# registered with the same interval spread out over time
+JITTER_FACTOR = 0.01
+JITTER_MAX = 300
+
+# Tasks due within this window are run together on one timer wakeup, if their
+# requested delay passed already and only the jitter is left
+COALESCE_WINDOW = 1.0
+
 
 @dataclass(slots=True)
 class _Task:
@@ -21,8 +35,18 @@ class _Task:
     coro_callback: Callable[..., Awaitable[None]] = field(compare=False)
     interval: float | time = field(compare=False)
     repeat: bool = field(compare=False)
-    job: asyncio.tasks.Task | None = field(compare=False)
-    next: asyncio.TimerHandle | None = field(compare=False)
+    job: asyncio.tasks.Task | None = field(default=None, compare=False)
+    when: float | None = field(default=None, compare=False)
+    not_before: float | None = field(default=None, compare=False)
+    last_run: datetime | None = field(default=None, compare=False)
+    last_duration: float | None = field(default=None, compare=False)
+    runs: int = field(default=0, compare=False)
+    overruns: int = field(default=0, compare=False)
+
+    @property
+    def name(self) -> str:
+        """Return name of the scheduled callback."""
+        return getattr(self.coro_callback, "__qualname__", repr(self.coro_callback))
 
 
 class Scheduler(CoreSysAttributes):
@@ -32,6 +56,33 @@ class Scheduler(CoreSysAttributes):
         """Initialize task schedule."""
         self.coresys: CoreSys = coresys
         self._tasks: list[_Task] = []
+        self._queue: list[tuple[float, int, _Task]] = []
+        self._counter = count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def task_stats(self) -> list[dict[str, Any]]:
+        """Return run statistics of all scheduled tasks."""
+        now = self.sys_loop.time()
+        return [
+            {
+                "id": task.id.hex,
+                "name": task.name,
+                "interval": task.interval
+                if isinstance(task.interval, int | float)
+                else task.interval.isoformat(),
+                "repeat": task.repeat,
+                "running": bool(task.job and not task.job.done()),
+                "runs": task.runs,
+                "overruns": task.overruns,
+                "last_run": task.last_run.isoformat() if task.last_run else None,
+                "last_duration": task.last_duration,
+                "next_run": (utcnow() + timedelta(seconds=task.when - now)).isoformat()
+                if task.when is not None
+                else None,
+            }
+            for task in self._tasks
+        ]
 
     def register_task(
         self,
@@ -43,7 +94,7 @@ class Scheduler(CoreSysAttributes):
 
         The coroutine need to be a callback without arguments.
         """
-        task = _Task(uuid4(), coro_callback, interval, repeat, None, None)
+        task = _Task(uuid4(), coro_callback, interval, repeat)
 
         # Schedule task
         self._tasks.append(task)
@@ -51,30 +102,77 @@ class Scheduler(CoreSysAttributes):
 
         return task.id
 
+    def _run_due(self) -> None:
+        """Run all tasks which are due, coalescing the ones due close together."""
+        self._timer = None
+        now = self.sys_loop.time()
+
+        due: list[_Task] = []
+        later: list[tuple[float, int, _Task]] = []
+        while self._queue and self._queue[0][0] <= now + COALESCE_WINDOW:
+            entry = heapq.heappop(self._queue)
+            when, _, task = entry
+            if task.when != when:
+                continue
+            # Never run a task before its requested delay
+            if when <= now or (task.not_before is not None and task.not_before <= now):
+                due.append(task)
+            else:
+                later.append(entry)
+
+        for entry in later:
+            heapq.heappush(self._queue, entry)
+
+        for task in due:
+            self._run_task(task)
+
+        self._arm_timer()
+
     def _run_task(self, task: _Task) -> None:
         """Run a scheduled task."""
+        task.when = task.not_before = None
+        repeat = task.repeat and self.sys_core.state not in (
+            CoreState.STOPPING,
+            CoreState.CLOSE,
+        )
+
+        # Skip this run if the previous one did not finish yet
+        if task.job and not task.job.done():
+            task.overruns += 1
+            _LOGGER.debug("Skipping run of %s, previous run still active", task.name)
+            if repeat:
+                self._schedule_task(task)
+            return
 
         async def _wrap_task():
-            """Run schedule task and reschedule."""
+            """Run schedule task and record statistics."""
+            start = self.sys_loop.time()
+            ran = False
             try:
                 if self.sys_core.state == CoreState.RUNNING:
+                    ran = True
+                    task.last_run = utcnow()
+                    task.runs += 1
                     await task.coro_callback()
             finally:
-                if task.repeat and self.sys_core.state not in (
-                    CoreState.STOPPING,
-                    CoreState.CLOSE,
-                ):
-                    self._schedule_task(task)
-                else:
+                if ran:
+                    task.last_duration = round(self.sys_loop.time() - start, 3)
+                if not repeat and task in self._tasks:
                     self._tasks.remove(task)
 
+        if repeat:
+            self._schedule_task(task)
         task.job = self.sys_create_task(_wrap_task())
 
     def _schedule_task(self, task: _Task) -> None:
         """Schedule a task on loop."""
+        now = self.sys_loop.time()
         match task.interval:
             case int() | float():
-                task.next = self.sys_call_later(task.interval, self._run_task, task)
+                task.not_before = now + task.interval
+                delay = task.interval + random.uniform(
+                    0, min(task.interval * JITTER_FACTOR, JITTER_MAX)
+                )
             case time():
                 today = datetime.combine(date.today(), task.interval)
                 tomorrow = datetime.combine(
@@ -87,7 +185,26 @@ class Scheduler(CoreSysAttributes):
                 else:
                     calc = tomorrow
 
-                task.next = self.sys_call_at(calc, self._run_task, task)
+                delay = (calc - datetime.today()).total_seconds()
+
+        task.when = now + delay
+        heapq.heappush(self._queue, (task.when, next(self._counter), task))
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        """Set timer to wake up for the next due task."""
+        if not self._queue:
+            return
+
+        when = self._queue[0][0]
+        if self._timer:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+
+        self._timer = self.sys_call_later(
+            max(0, when - self.sys_loop.time()), self._run_due
+        )
 
     async def shutdown(self, timeout=10) -> None:
         """Shutdown all task inside the scheduler."""
@@ -95,9 +212,13 @@ class Scheduler(CoreSysAttributes):
 
         # Cancel next task / get running list
         _LOGGER.info("Shutting down scheduled tasks")
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._queue.clear()
+
         for task in self._tasks:
-            if task.next:
-                task.next.cancel()
+            task.when = task.not_before = None
             if not task.job or task.job.done():
                 continue
             running.append(task.job)
@@ -11,6 +11,7 @@ from ..const import ATTR_APP, ATTR_BACKUP, ATTR_TYPE, AppState
 from ..coresys import CoreSysAttributes
 from ..exceptions import (
     AppsError,
+    BackupChainError,
     BackupFileNotFoundError,
     HomeAssistantError,
     HomeAssistantWSError,
@@ -428,5 +429,5 @@ class Tasks(CoreSysAttributes):
                 await self.sys_backups.remove(
                     backup, [cast(LOCATION_TYPE, LOCATION_CLOUD_BACKUP)]
                 )
-            except BackupFileNotFoundError as err:
+            except (BackupChainError, BackupFileNotFoundError) as err:
                 _LOGGER.debug("Can't remove backup %s: %s", backup.slug, err)
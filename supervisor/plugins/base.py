@@ -93,7 +93,9 @@ class PluginBase(ABC, FileConfiguration, CoreSysAttributes):
     def start_watchdog(self) -> None:
         """Register docker container listener for plugin."""
         self.sys_bus.register_event(
-            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self.watchdog_container
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            self.watchdog_container,
+            key=self.instance.name,
         )
 
     async def watchdog_container(self, event: DockerContainerStateEvent) -> None:
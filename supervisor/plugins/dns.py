@@ -250,7 +250,9 @@ class PluginDns(PluginBase):
         # Register Docker event listener for connectivity checks
         if not self._connectivity_check_listener:
             self._connectivity_check_listener = self.sys_bus.register_event(
-                BusEvent.DOCKER_CONTAINER_STATE_CHANGE, self._on_dns_container_running
+                BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+                self._on_dns_container_running,
+                key=self.instance.name,
             )
 
         await super().load()
@@ -4,7 +4,7 @@ import logging
 
 from ...backups.const import BackupType
 from ...coresys import CoreSys
-from ...exceptions import BackupFileNotFoundError
+from ...exceptions import BackupChainError, BackupFileNotFoundError
 from ..const import MINIMUM_FULL_BACKUPS, ContextType, IssueType, SuggestionType
 from ..data import Suggestion
 from .base import FixupBase
@@ -35,7 +35,7 @@ class FixupSystemClearFullBackup(FixupBase):
         ]:
             try:
                 await self.sys_backups.remove(backup)
-            except BackupFileNotFoundError as err:
+            except (BackupChainError, BackupFileNotFoundError) as err:
                 _LOGGER.debug("Can't remove backup %s: %s", backup.slug, err)
 
     @property
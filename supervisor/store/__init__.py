@@ -38,6 +38,8 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         self.coresys: CoreSys = coresys
         self.data = StoreData(coresys)
         self._repositories: dict[str, Repository] = {}
+        self._data_lock: asyncio.Lock = asyncio.Lock()
+        self._verify_task: asyncio.Task | None = None
 
     @property
     def all(self) -> list[Repository]:
@@ -73,7 +75,32 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         all_repositories: set[str] = (
             set(self._data.get(ATTR_REPOSITORIES, [])) | DEFAULT_REPOSITORIES
         )
-        await self.update_repositories(all_repositories, issue_on_error=True)
+
+        # Validating all app configs is slow on big stores, use the catalogue
+        # of the last run and check it against the repositories in background
+        if not await self.data.load_cache():
+            await self.update_repositories(all_repositories, issue_on_error=True)
+            return
+
+        await self.update_repositories(
+            all_repositories, issue_on_error=True, update_data=False
+        )
+        self._verify_task = self.sys_create_task(self._verify_cache())
+
+    async def unload(self) -> None:
+        """Stop verifying the catalogue loaded from cache."""
+        if not self._verify_task:
+            return
+        self._verify_task.cancel()
+        await asyncio.gather(self._verify_task, return_exceptions=True)
+        self._verify_task = None
+
+    async def _verify_cache(self) -> None:
+        """Replace catalogue loaded from cache with current repository data."""
+        async with self._data_lock:
+            await self.data.update()
+            await self._read_apps()
+        self._verify_task = None
 
     @Job(
         name="store_manager_reload",
@@ -86,44 +113,45 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
     )
     async def reload(self, repository: Repository | None = None) -> None:
         """Update apps from repository and reload list."""
-        # Make a copy to prevent race with other tasks
-        repositories = [repository] if repository else self.all.copy()
-        results: list[bool | BaseException] = await asyncio.gather(
-            *[repo.update() for repo in repositories], return_exceptions=True
-        )
+        async with self._data_lock:
+            # Make a copy to prevent race with other tasks
+            repositories = [repository] if repository else self.all.copy()
+            results: list[bool | BaseException] = await asyncio.gather(
+                *[repo.update() for repo in repositories], return_exceptions=True
+            )
 
-        # Determine which repositories were updated
-        updated_repos: set[str] = set()
-        for i, result in enumerate(results):
-            if result is True:
-                updated_repos.add(repositories[i].slug)
-            elif result:
-                _LOGGER.error(
-                    "Could not reload repository %s due to %r",
-                    repositories[i].slug,
-                    result,
-                )
+            # Determine which repositories were updated
+            updated_repos: set[str] = set()
+            for i, result in enumerate(results):
+                if result is True:
+                    updated_repos.add(repositories[i].slug)
+                elif result:
+                    _LOGGER.error(
+                        "Could not reload repository %s due to %r",
+                        repositories[i].slug,
+                        result,
+                    )
 
-        # Update path cache for all apps in updated repos
-        if updated_repos:
-            await asyncio.gather(
-                *[
-                    app.refresh_path_cache()
-                    for app in self.sys_apps.store.values()
-                    if app.repository in updated_repos
-                ]
-            )
+            # Update path cache for all apps in updated repos
+            if updated_repos:
+                await asyncio.gather(
+                    *[
+                        app.refresh_path_cache()
+                        for app in self.sys_apps.store.values()
+                        if app.repository in updated_repos
+                    ]
+                )
 
-            # read data from repositories
-            await self.data.update()
-            await self._read_apps()
+                # read data from repositories, only updated ones change
+                await self.data.update(updated_repos)
+                await self._read_apps()
 
-            # Notify Home Assistant so add-on update entities pick up the newly
-            # loaded store data instead of waiting for the next scheduled poll.
-            self.sys_homeassistant.websocket.supervisor_event(
-                WSEvent.STORE_RELOADED,
-                {ATTR_REPOSITORIES: sorted(updated_repos)},
-            )
+                # Notify Home Assistant so add-on update entities pick up the newly
+                # loaded store data instead of waiting for the next scheduled poll.
+                self.sys_homeassistant.websocket.supervisor_event(
+                    WSEvent.STORE_RELOADED,
+                    {ATTR_REPOSITORIES: sorted(updated_repos)},
+                )
 
     @Job(
         name="store_manager_add_repository",
@@ -234,8 +262,9 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
 
         # Persist changes
         if persist:
-            await self.data.update()
-            await self._read_apps()
+            async with self._data_lock:
+                await self.data.update()
+                await self._read_apps()
 
     async def remove_repository(self, repository: Repository, *, persist: bool = True):
         """Remove a repository."""
@@ -254,8 +283,9 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         await self.save_data()
 
         if persist:
-            await self.data.update()
-            await self._read_apps()
+            async with self._data_lock:
+                await self.data.update()
+                await self._read_apps()
 
     @Job(name="store_manager_update_repositories")
     async def update_repositories(
@@ -264,48 +294,55 @@ class StoreManager(CoreSysAttributes, FileConfiguration):
         *,
         issue_on_error: bool = False,
         replace: bool = True,
+        update_data: bool = True,
     ):
-        """Update repositories by adding new ones and removing stale ones."""
-        current_repositories = {repository.source for repository in self.all}
-
-        # Determine repositories to add
-        repositories_to_add = list_repositories - current_repositories
-
-        # Add new repositories
-        add_errors = await asyncio.gather(
-            *[
-                # Use _add_repository to avoid JobCondition.SUPERVISOR_UPDATED
-                # to prevent proper loading of repositories on startup.
-                self._add_repository(url, persist=False, issue_on_error=True)
-                if issue_on_error
-                else self.add_repository(url, persist=False)
-                for url in repositories_to_add
-            ],
-            return_exceptions=True,
-        )
+        """Update repositories by adding new ones and removing stale ones.
 
-        remove_errors: list[BaseException | None] = []
-        if replace:
-            # Determine repositories to remove
-            repositories_to_remove: list[Repository] = [
-                repository
-                for repository in self.all
-                if repository.source not in list_repositories
-                and not repository.is_builtin
-            ]
-
-            # Remove repositories
-            remove_errors = await asyncio.gather(
+        Without update_data the apps are loaded from the current store data,
+        without reading the repositories again.
+        """
+        async with self._data_lock:
+            current_repositories = {repository.source for repository in self.all}
+
+            # Determine repositories to add
+            repositories_to_add = list_repositories - current_repositories
+
+            # Add new repositories
+            add_errors = await asyncio.gather(
                 *[
-                    self.remove_repository(repository, persist=False)
-                    for repository in repositories_to_remove
+                    # Use _add_repository to avoid JobCondition.SUPERVISOR_UPDATED
+                    # to prevent proper loading of repositories on startup.
+                    self._add_repository(url, persist=False, issue_on_error=True)
+                    if issue_on_error
+                    else self.add_repository(url, persist=False)
+                    for url in repositories_to_add
                 ],
                 return_exceptions=True,
             )
 
-        # Always update data, even if there are errors, some changes may have succeeded
-        await self.data.update()
-        await self._read_apps()
+            remove_errors: list[BaseException | None] = []
+            if replace:
+                # Determine repositories to remove
+                repositories_to_remove: list[Repository] = [
+                    repository
+                    for repository in self.all
+                    if repository.source not in list_repositories
+                    and not repository.is_builtin
+                ]
+
+                # Remove repositories
+                remove_errors = await asyncio.gather(
+                    *[
+                        self.remove_repository(repository, persist=False)
+                        for repository in repositories_to_remove
+                    ],
+                    return_exceptions=True,
+                )
+
+            # Always update data, even if there are errors, some changes may have succeeded
+            if update_data:
+                await self.data.update()
+            await self._read_apps()
 
         # Raise the first error we found (if any)
         for error in add_errors + remove_errors:
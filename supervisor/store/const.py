@@ -6,6 +6,7 @@ from pathlib import Path
 from ..const import REPOSITORY_CORE, REPOSITORY_LOCAL, SUPERVISOR_DATA, URL_HASSIO_APPS
 
 FILE_HASSIO_STORE = Path(SUPERVISOR_DATA, "store.json")
+FILE_HASSIO_STORE_CACHE = Path(SUPERVISOR_DATA, "store_cache.json")
 """Repository type definitions for the store."""
 
 
@@ -1,40 +1,139 @@
 """Init file for Supervisor app data."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 import errno
+import hashlib
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
+from atomicwrites import atomic_write
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
+from ..apps.const import ATTR_BACKUP, ATTR_BREAKING_VERSIONS, AppBackupMode, MappingType
 from ..apps.validate import (
     SCHEMA_APP_CONFIG,
     SCHEMA_APP_CONFIG_QUIET,
     SCHEMA_APP_TRANSLATIONS,
 )
 from ..const import (
+    ATTR_BOOT,
+    ATTR_HOMEASSISTANT,
     ATTR_LOCATION,
+    ATTR_MAP,
+    ATTR_PRIVILEGED,
     ATTR_REPOSITORY,
     ATTR_SLUG,
+    ATTR_STAGE,
+    ATTR_STARTUP,
     ATTR_TRANSLATIONS,
+    ATTR_TYPE,
+    ATTR_VERSION,
     ATTR_VERSION_TIMESTAMP,
     FILE_SUFFIX_CONFIGURATION,
     REPOSITORY_CORE,
     REPOSITORY_LOCAL,
+    SUPERVISOR_VERSION,
+    AppBootConfig,
+    AppStage,
+    AppStartup,
     UpdateChannel,
 )
 from ..coresys import CoreSys, CoreSysAttributes
+from ..docker.const import Capabilities
 from ..exceptions import ConfigurationFileError
 from ..resolution.const import ContextType, IssueType, SuggestionType
 from ..utils.common import find_one_filetype, read_json_or_yaml_file
-from ..utils.json import read_json_file
+from ..utils.json import json_bytes, json_loads, read_json_file
+from ..validate import version_tag
+from .const import FILE_HASSIO_STORE_CACHE
 from .utils import extract_hash_from_path
 from .validate import SCHEMA_REPOSITORY_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Values of app configs the schema validated into types, the cache holds them
+# as plain strings
+APP_CACHE_TYPES: dict[str, Callable[[Any], Any]] = {
+    ATTR_BACKUP: AppBackupMode,
+    ATTR_BOOT: AppBootConfig,
+    ATTR_HOMEASSISTANT: version_tag,
+    ATTR_STAGE: AppStage,
+    ATTR_STARTUP: AppStartup,
+    ATTR_VERSION: version_tag,
+}
+
+
+def _restore_app_types(app: dict[str, Any]) -> None:
+    """Restore typed values of an app config read from cache."""
+    for key, value_type in APP_CACHE_TYPES.items():
+        if key in app:
+            app[key] = value_type(app[key])
+    if ATTR_BREAKING_VERSIONS in app:
+        app[ATTR_BREAKING_VERSIONS] = [
+            version_tag(version) for version in app[ATTR_BREAKING_VERSIONS]
+        ]
+    if ATTR_PRIVILEGED in app:
+        app[ATTR_PRIVILEGED] = [Capabilities(cap) for cap in app[ATTR_PRIVILEGED]]
+    for mapping in app.get(ATTR_MAP, []):
+        mapping[ATTR_TYPE] = MappingType(mapping[ATTR_TYPE])
+
+
+def _read_cache() -> tuple[dict[str, Any], dict[str, dict[str, Any]]] | None:
+    """Read catalogue from cache file, None if missing or not valid.
+
+    The first line holds Supervisor version and sha256 fingerprint of the
+    payload on the second line, catalogues of other versions were validated
+    against a different schema.
+    Must be run in executor.
+    """
+    try:
+        content = FILE_HASSIO_STORE_CACHE.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as err:
+        _LOGGER.warning("Can't read store cache: %s", err)
+        return None
+
+    header, _, payload = content.partition(b"\n")
+    try:
+        header_data = json_loads(header)
+        if (
+            header_data.get("version") != SUPERVISOR_VERSION
+            or header_data.get("fingerprint") != hashlib.sha256(payload).hexdigest()
+        ):
+            _LOGGER.info("Store cache is outdated or corrupt, ignoring it")
+            return None
+        data = json_loads(payload)
+        for app in data["apps"].values():
+            _restore_app_types(app)
+        return data["repositories"], data["apps"]
+    except (ValueError, TypeError, KeyError, AttributeError) as err:
+        _LOGGER.warning("Can't parse store cache: %s", err)
+        return None
+
+
+def _write_cache(repositories: dict[str, Any], apps: dict[str, dict[str, Any]]) -> None:
+    """Write catalogue to cache file.
+
+    Must be run in executor.
+    """
+    payload = json_bytes({"repositories": repositories, "apps": apps})
+    header = json_bytes(
+        {
+            "version": SUPERVISOR_VERSION,
+            "fingerprint": hashlib.sha256(payload).hexdigest(),
+        }
+    )
+    try:
+        with atomic_write(FILE_HASSIO_STORE_CACHE, mode="wb", overwrite=True) as fp:
+            fp.write(header + b"\n" + payload)
+    except OSError as err:
+        _LOGGER.warning("Can't write store cache: %s", err)
+
 
 @dataclass(slots=True)
 class ProcessedRepository:
@@ -45,9 +144,29 @@ class ProcessedRepository:
     config: dict[str, Any]
 
 
-def _read_app_translations(app_path: Path) -> dict:
+@dataclass(slots=True, frozen=True)
+class CachedFile:
+    """Validated content of an app config or translation file."""
+
+    mtime: int
+    size: int
+    data: dict[str, Any]
+    verbose: bool = False
+
+    def matches(self, file_stat: os.stat_result) -> bool:
+        """Return true if file did not change since it was read."""
+        return (self.mtime, self.size) == (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _read_app_translations(
+    app_path: Path,
+    cache: dict[Path, CachedFile] | None = None,
+    new_cache: dict[Path, CachedFile] | None = None,
+) -> dict:
     """Read translations from apps folder.
 
+    Translations unchanged since they were stored in cache are not read again,
+    all translations read are added to new_cache.
     Should be run in the executor.
     """
     translations_dir = app_path / "translations"
@@ -64,14 +183,27 @@ def _read_app_translations(app_path: Path) -> dict:
 
     for translation in translation_files:
         try:
-            translations[translation.stem] = SCHEMA_APP_TRANSLATIONS(
-                read_json_or_yaml_file(translation)
-            )
+            file_stat = translation.stat()
+            if (
+                cache
+                and (cached := cache.get(translation))
+                and cached.matches(file_stat)
+            ):
+                translations[translation.stem] = cached.data
+            else:
+                translations[translation.stem] = SCHEMA_APP_TRANSLATIONS(
+                    read_json_or_yaml_file(translation)
+                )
 
-        except (ConfigurationFileError, vol.Invalid) as err:
+        except (ConfigurationFileError, OSError, vol.Invalid) as err:
             _LOGGER.warning("Can't read translations from %s - %s", translation, err)
             continue
 
+        if new_cache is not None:
+            new_cache[translation] = CachedFile(
+                file_stat.st_mtime_ns, file_stat.st_size, translations[translation.stem]
+            )
+
     return translations
 
 
@@ -114,19 +246,41 @@ class StoreData(CoreSysAttributes):
         self.repositories: dict[str, Any] = {}
         self.apps: dict[str, dict[str, Any]] = {}
 
-    async def update(self) -> None:
-        """Read data from app repository."""
-        # read core repository
-        apps = await self._read_apps_folder(
-            self.sys_config.path_apps_core, REPOSITORY_CORE
-        )
+        # Results of the last update by repository slug, for incremental updates
+        self._git_repositories: dict[str, ProcessedRepository] = {}
+        self._repository_apps: dict[str, dict[str, dict[str, Any]]] = {}
+        self._file_cache: dict[str, dict[Path, CachedFile]] = {}
+
+    async def update(self, changed: set[str] | None = None) -> None:
+        """Read data from app repository.
 
-        # read local repository
-        apps.update(
-            await self._read_apps_folder(
-                self.sys_config.path_apps_local, REPOSITORY_LOCAL
+        Without changed, all repositories are read again. Otherwise only the
+        repositories with a slug in changed are processed and only their app
+        config and translation files modified since the last update are
+        validated again.
+        """
+        if changed is None:
+            self._git_repositories.clear()
+            self._repository_apps.clear()
+            self._file_cache.clear()
+
+        def _is_changed(slug: str) -> bool:
+            return (
+                changed is None or slug in changed or slug not in self._repository_apps
+            )
+
+        repository_apps: dict[str, dict[str, dict[str, Any]]] = {}
+
+        # read core and local repository
+        for path, slug in (
+            (self.sys_config.path_apps_core, REPOSITORY_CORE),
+            (self.sys_config.path_apps_local, REPOSITORY_LOCAL),
+        ):
+            repository_apps[slug] = (
+                await self._read_apps_folder(path, slug)
+                if _is_changed(slug)
+                else self._repository_apps[slug]
             )
-        )
 
         # add built-in repositories information
         repositories = await self.sys_run_in_executor(self._get_builtin_repositories)
@@ -137,15 +291,50 @@ class StoreData(CoreSysAttributes):
                 repo
                 for repository_element in self.sys_config.path_apps_git.iterdir()
                 if repository_element.is_dir()
-                and (repo := _read_git_repository(repository_element))
+                and (
+                    repo := _read_git_repository(repository_element)
+                    if _is_changed(repository_element.name)
+                    or repository_element.name not in self._git_repositories
+                    else self._git_repositories[repository_element.name]
+                )
             ]
 
-        for repo in await self.sys_run_in_executor(_read_git_repositories):
+        git_repositories = await self.sys_run_in_executor(_read_git_repositories)
+        for repo in git_repositories:
             repositories[repo.slug] = repo.config
-            apps.update(await self._read_apps_folder(repo.path, repo.slug))
+            repository_apps[repo.slug] = (
+                await self._read_apps_folder(repo.path, repo.slug)
+                if _is_changed(repo.slug)
+                else self._repository_apps[repo.slug]
+            )
+
+        # Forget removed repositories
+        self._git_repositories = {repo.slug: repo for repo in git_repositories}
+        self._repository_apps = repository_apps
+        self._file_cache = {
+            slug: cache
+            for slug, cache in self._file_cache.items()
+            if slug in repository_apps
+        }
 
         self.repositories = repositories
-        self.apps = apps
+        self.apps = {
+            slug: app for apps in repository_apps.values() for slug, app in apps.items()
+        }
+        await self.sys_run_in_executor(_write_cache, self.repositories, self.apps)
+
+    async def load_cache(self) -> bool:
+        """Load catalogue of the last update from cache, return true on success.
+
+        The cache is not checked against the repositories, a full update is
+        needed afterwards to pick up changes made since it was written.
+        """
+        if not (cache := await self.sys_run_in_executor(_read_cache)):
+            return False
+
+        self.repositories, self.apps = cache
+        _LOGGER.debug("Loaded %d apps from store cache", len(self.apps))
+        return True
 
     async def _find_app_configs(self, path: Path, repository: str) -> list[Path] | None:
         """Find apps in the path."""
@@ -207,48 +396,79 @@ class StoreData(CoreSysAttributes):
         )
         installed_slugs = {app.slug for app in self.sys_apps.installed}
 
+        # Validated files of the last update, unchanged files are not read again
+        cache = self._file_cache.get(repository, {})
+        new_cache: dict[Path, CachedFile] = {}
+
+        def _is_verbose(slug: str | None) -> bool:
+            # Pick the advisory log level based on who can act on it (see above)
+            return always_verbose or (
+                not repository_is_builtin and f"{repository}_{slug}" in installed_slugs
+            )
+
         def _process_apps_config() -> dict[str, dict[str, Any]]:
             apps: dict[str, dict[str, Any]] = {}
             for app_config in app_config_list:
                 try:
-                    app = read_json_or_yaml_file(app_config)
-                except ConfigurationFileError:
+                    file_stat = app_config.stat()
+                except OSError:
                     _LOGGER.warning(
                         "Can't read %s from repository %s", app_config, repository
                     )
                     continue
 
-                # Pick the advisory log level based on who can act on it (see
-                # above). The slug is available in the raw config before
-                # validation.
-                verbose = always_verbose or (
-                    not repository_is_builtin
-                    and f"{repository}_{app.get(ATTR_SLUG)}" in installed_slugs
-                )
-                schema = SCHEMA_APP_CONFIG if verbose else SCHEMA_APP_CONFIG_QUIET
-
-                # validate
-                try:
-                    app = schema(app)
-                except vol.Invalid as ex:
-                    _LOGGER.warning(
-                        "Can't read %s: %s", app_config, humanize_error(app, ex)
+                if (
+                    (cached := cache.get(app_config))
+                    and cached.matches(file_stat)
+                    and cached.verbose == _is_verbose(cached.data[ATTR_SLUG])
+                ):
+                    app = cached.data
+                else:
+                    try:
+                        app = read_json_or_yaml_file(app_config)
+                    except ConfigurationFileError:
+                        _LOGGER.warning(
+                            "Can't read %s from repository %s", app_config, repository
+                        )
+                        continue
+
+                    # The slug is available in the raw config before validation
+                    verbose = _is_verbose(app.get(ATTR_SLUG))
+                    schema = SCHEMA_APP_CONFIG if verbose else SCHEMA_APP_CONFIG_QUIET
+
+                    # validate
+                    try:
+                        app = schema(app)
+                    except vol.Invalid as ex:
+                        _LOGGER.warning(
+                            "Can't read %s: %s", app_config, humanize_error(app, ex)
+                        )
+                        continue
+
+                    cached = CachedFile(
+                        file_stat.st_mtime_ns, file_stat.st_size, app, verbose
                     )
-                    continue
+
+                new_cache[app_config] = cached
 
                 # Generate slug
                 app_slug = f"{repository}_{app[ATTR_SLUG]}"
 
-                # store
-                app[ATTR_REPOSITORY] = repository
-                app[ATTR_LOCATION] = str(app_config.parent)
-                app[ATTR_TRANSLATIONS] = _read_app_translations(app_config.parent)
-                app[ATTR_VERSION_TIMESTAMP] = app_config.stat().st_mtime
-                apps[app_slug] = app
+                # store, the validated config is kept unchanged in cache
+                apps[app_slug] = app | {
+                    ATTR_REPOSITORY: repository,
+                    ATTR_LOCATION: str(app_config.parent),
+                    ATTR_TRANSLATIONS: _read_app_translations(
+                        app_config.parent, cache, new_cache
+                    ),
+                    ATTR_VERSION_TIMESTAMP: file_stat.st_mtime,
+                }
 
             return apps
 
-        return await self.sys_run_in_executor(_process_apps_config)
+        apps = await self.sys_run_in_executor(_process_apps_config)
+        self._file_cache[repository] = new_cache
+        return apps
 
     def _get_builtin_repositories(self) -> dict[str, dict[str, str]]:
         """Get local built-in repositories into dataset.
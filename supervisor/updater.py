@@ -263,13 +263,12 @@ class Updater(FileConfiguration, CoreSysAttributes):
         try:
             _LOGGER.info("Fetching update data from %s", url)
             timeout = aiohttp.ClientTimeout(total=10)
-            async with self.sys_websession.get(url, timeout=timeout) as request:
-                if request.status != 200:
-                    raise UpdaterError(
-                        f"Fetching version from {url} response with {request.status}",
-                        _LOGGER.warning,
-                    )
-                data = await request.read()
+            response = await self.sys_http_cache.get(url, timeout=timeout)
+            if response.status != 200:
+                raise UpdaterError(
+                    f"Fetching version from {url} response with {response.status}",
+                    _LOGGER.warning,
+                )
 
         except (aiohttp.ClientError, TimeoutError) as err:
             # Nudge a fresh connectivity check; the probe is authoritative,
@@ -287,7 +286,7 @@ class Updater(FileConfiguration, CoreSysAttributes):
 
         # Parse data
         try:
-            data = json.loads(data)
+            data = json.loads(response.content)
         except json.JSONDecodeError as err:
             raise UpdaterError(
                 f"Can't parse versions from {url}: {err}", _LOGGER.warning
@@ -3,22 +3,44 @@
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import asdict, dataclass
 import logging
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Self, cast
 
+from atomicwrites import atomic_write
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
+from yaml import YAMLError
 
 from ..exceptions import ConfigurationFileError
-from .json import read_json_file, write_json_file
-from .yaml import read_yaml_file, write_yaml_file
+from .json import json_file_dumps, read_json_file, write_json_file
+from .yaml import read_yaml_file, write_yaml_file, yaml_dumps
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 _DEFAULT: dict[str, Any] = {}
 
 
+@dataclass(slots=True)
+class WriteStats:
+    """Writes of a configuration file."""
+
+    writes: int = 0
+    skipped: int = 0
+    bytes_written: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return dictionary representation."""
+        return asdict(self)
+
+
+_WRITE_STATS: dict[Path, WriteStats] = {}
+
+# Configurations with changes waiting to be written, see FileConfiguration.save_delay
+_PENDING_WRITES: set[FileConfiguration] = set()
+
+
 def find_one_filetype(path: Path, filename: str, filetypes: list[str]) -> Path:
     """Find first file matching filetypes.
 
@@ -58,9 +80,53 @@ def write_json_or_yaml_file(path: Path, data: dict) -> None:
     raise ConfigurationFileError(f"{path} is not JSON or YAML")
 
 
+def write_json_or_yaml_file_if_changed(
+    path: Path, data: dict, previous: str | None
+) -> str | None:
+    """Write JSON or YAML file unless its content would be previous.
+
+    Returns the content written, None if skipped. Must be run in executor.
+    """
+    try:
+        if path.suffix == ".json":
+            content = json_file_dumps(data)
+        elif path.suffix in [".yaml", ".yml"]:
+            content = yaml_dumps(data)
+        else:
+            raise ConfigurationFileError(f"{path} is not JSON or YAML")
+
+        if content == previous:
+            return None
+
+        with atomic_write(path, overwrite=True) as fp:
+            fp.write(content)
+        path.chmod(0o600)
+    except (YAMLError, OSError, ValueError, TypeError) as err:
+        raise ConfigurationFileError(
+            f"Can't write {path!s}: {err!s}", _LOGGER.error
+        ) from err
+    return content
+
+
+def config_write_stats() -> dict[Path, WriteStats]:
+    """Return writes of configuration files by path."""
+    return _WRITE_STATS
+
+
+async def flush_config_files() -> None:
+    """Write all configuration changes waiting for their delay now."""
+    for config in list(_PENDING_WRITES):
+        await config.flush_data()
+
+
 class FileConfiguration:
     """Baseclass for classes that uses configuration files, the files can be JSON/YAML."""
 
+    # Seconds to wait for more changes before writing, None writes on each save
+    save_delay: float | None = None
+    # Seconds a change waits at most before it is written
+    save_max_delay: float = 10
+
     def __init__(
         self, file_path: Path | None, schema: vol.Schema | Callable[[dict], dict]
     ):
@@ -68,6 +134,11 @@ class FileConfiguration:
         self._file: Path | None = file_path
         self._schema: vol.Schema | Callable[[dict], dict] = schema
         self._data: dict[str, Any] = _DEFAULT
+        self._written: str | None = None
+        self._write_lock = asyncio.Lock()
+        self._pending_since: float | None = None
+        self._write_timer: asyncio.TimerHandle | None = None
+        self._write_task: asyncio.Task | None = None
 
     async def load_config(self) -> Self:
         """Read in config in executor."""
@@ -99,6 +170,7 @@ class FileConfiguration:
         self._data = await asyncio.get_running_loop().run_in_executor(
             None, _read_data, self._file
         )
+        self._written = None
 
         # Validate
         try:
@@ -113,7 +185,11 @@ class FileConfiguration:
             self._data = self._schema(_DEFAULT)
 
     async def save_data(self) -> None:
-        """Store data to configuration file."""
+        """Store data to configuration file.
+
+        With a save delay data is validated right away but written once no
+        more changes came in for the delay, or at most after the max delay.
+        """
         if not self._file:
             raise RuntimeError("Path to config file must be set!")
 
@@ -128,8 +204,61 @@ class FileConfiguration:
             self._data = _DEFAULT
             await self.read_data()
         else:
-            # write
+            if self.save_delay is None:
+                await self._write_data()
+            else:
+                self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        """Write data once the save delay passed without changes."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._pending_since is None:
+            self._pending_since = now
+            _PENDING_WRITES.add(self)
+        if self._write_timer:
+            self._write_timer.cancel()
+
+        delay = min(
+            cast(float, self.save_delay),
+            self._pending_since + self.save_max_delay - now,
+        )
+        self._write_timer = loop.call_later(max(delay, 0), self._write_later)
+
+    def _write_later(self) -> None:
+        """Start writing data after the delay."""
+        self._write_timer = None
+        self._write_task = asyncio.create_task(self.flush_data())
+
+    async def flush_data(self) -> None:
+        """Write changes waiting for the save delay now."""
+        if self._write_timer:
+            self._write_timer.cancel()
+            self._write_timer = None
+        if self._pending_since is None:
+            return
+
+        self._pending_since = None
+        _PENDING_WRITES.discard(self)
+        await self._write_data()
+
+    async def _write_data(self) -> None:
+        """Write data to configuration file unless it did not change."""
+        file = cast(Path, self._file)
+        stats = _WRITE_STATS.setdefault(file, WriteStats())
+        async with self._write_lock:
             with suppress(ConfigurationFileError):
-                await asyncio.get_running_loop().run_in_executor(
-                    None, write_json_or_yaml_file, self._file, self._data
+                content = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    write_json_or_yaml_file_if_changed,
+                    file,
+                    self._data,
+                    self._written,
                 )
+                if content is None:
+                    stats.skipped += 1
+                    return
+
+                self._written = content
+                stats.writes += 1
+                stats.bytes_written += len(content.encode("utf-8"))
@@ -39,6 +39,13 @@ _LOGGER.addFilter(StreamRateLimitFilter(period_sec=30, allow_next_n=2))
 DBUS_INTERFACE_OBJECT_MANAGER: str = "org.freedesktop.DBus.ObjectManager"
 DBUS_INTERFACE_PROPERTIES: str = "org.freedesktop.DBus.Properties"
 DBUS_METHOD_GETALL: str = "org.freedesktop.DBus.Properties.GetAll"
+DBUS_INTERFACE_PREFIX_STANDARD: str = "org.freedesktop.DBus."
+
+# Introspection shared by objects of a bus name which use the same interfaces
+_shared_introspection: dict[tuple[str, frozenset[str]], Node] = {}
+_shared_introspection_pending: dict[
+    tuple[str, frozenset[str]], asyncio.Future[Node | None]
+] = {}
 
 
 class GetWithUnpack(Protocol):
@@ -68,12 +75,22 @@ class DBus:
         self._signal_monitors: dict[str, dict[str, list[Callable]]] = {}
 
     @staticmethod
-    async def connect(bus: MessageBus, bus_name: str, object_path: str) -> DBus:
-        """Read object data."""
+    async def connect(
+        bus: MessageBus,
+        bus_name: str,
+        object_path: str,
+        *,
+        interfaces: frozenset[str] | None = None,
+    ) -> DBus:
+        """Read object data.
+
+        If interfaces is given, the object is set up with only these interfaces
+        from an introspection shared with other objects using them.
+        """
         self = DBus(bus, bus_name, object_path)
 
         # pylint: disable=protected-access
-        await self.init_proxy()
+        await self.init_proxy(interfaces=interfaces)
 
         _LOGGER.debug("Connect to D-Bus: %s - %s", bus_name, object_path)
         return self
@@ -179,10 +196,70 @@ class DBus:
             "Could not get introspection data after 3 attempts", _LOGGER.error
         )
 
-    async def init_proxy(self, *, introspection: Node | None = None) -> None:
-        """Read interface data."""
-        if not introspection:
+    @staticmethod
+    def clear_shared_introspection() -> None:
+        """Clear introspection shared between objects."""
+        _shared_introspection.clear()
+
+    async def introspect_shared(self, interfaces: frozenset[str]) -> Node:
+        """Return introspection of the interfaces, shared with other objects.
+
+        Only the first object of the bus name using these interfaces is
+        introspected, concurrent callers wait for it. If that object doesn't
+        implement all of them, it is not shared and each object is introspected.
+        """
+        key = (self.bus_name, interfaces)
+        if introspection := _shared_introspection.get(key):
+            return introspection
+
+        if pending := _shared_introspection_pending.get(key):
+            if introspection := await pending:
+                return introspection
+            return await self.introspect()
+
+        _shared_introspection_pending[key] = future = (
+            asyncio.get_running_loop().create_future()
+        )
+        shared: Node | None = None
+        try:
             introspection = await self.introspect()
+            if interfaces <= {intr.name for intr in introspection.interfaces}:
+                shared = _shared_introspection[key] = Node(
+                    introspection.name,
+                    [
+                        intr
+                        for intr in introspection.interfaces
+                        if intr.name in interfaces
+                        or intr.name.startswith(DBUS_INTERFACE_PREFIX_STANDARD)
+                    ],
+                )
+            else:
+                _LOGGER.debug(
+                    "D-Bus object %s - %s is missing interfaces of %s",
+                    self.bus_name,
+                    self.object_path,
+                    ", ".join(interfaces),
+                )
+        finally:
+            del _shared_introspection_pending[key]
+            future.set_result(shared)
+
+        return shared or introspection
+
+    async def init_proxy(
+        self,
+        *,
+        introspection: Node | None = None,
+        interfaces: frozenset[str] | None = None,
+    ) -> None:
+        """Read interface data.
+
+        Uses introspection shared with other objects if interfaces are given.
+        """
+        if not introspection:
+            introspection = await (
+                self.introspect_shared(interfaces) if interfaces else self.introspect()
+            )
 
         # If we have a proxy obj store signal monitors and disconnect first
         signal_monitors = self._signal_monitors
@@ -212,6 +289,15 @@ class DBus:
         """Return all proxies."""
         return self._proxies
 
+    @property
+    def object_interfaces(self) -> set[str]:
+        """Return interfaces of the object without the standard D-Bus ones."""
+        return {
+            name
+            for name in self._proxies
+            if not name.startswith(DBUS_INTERFACE_PREFIX_STANDARD)
+        }
+
     @property
     def bus(self) -> MessageBus:
         """Get message bus."""
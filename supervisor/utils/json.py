@@ -47,6 +47,16 @@ else:
 json_loads = orjson.loads  # pylint: disable=no-member
 
 
+def json_file_dumps(data: Any) -> str:
+    """Dump json string as written to files."""
+    return orjson.dumps(  # pylint: disable=no-member
+        data,
+        option=orjson.OPT_INDENT_2  # pylint: disable=no-member
+        | orjson.OPT_NON_STR_KEYS,  # pylint: disable=no-member
+        default=json_encoder_default,
+    ).decode("utf-8")
+
+
 def write_json_file(jsonfile: Path, data: Any) -> None:
     """Write a JSON file.
 
@@ -54,14 +64,7 @@ def write_json_file(jsonfile: Path, data: Any) -> None:
     """
     try:
         with atomic_write(jsonfile, overwrite=True) as fp:
-            fp.write(
-                orjson.dumps(  # pylint: disable=no-member
-                    data,
-                    option=orjson.OPT_INDENT_2  # pylint: disable=no-member
-                    | orjson.OPT_NON_STR_KEYS,  # pylint: disable=no-member
-                    default=json_encoder_default,
-                ).decode("utf-8")
-            )
+            fp.write(json_file_dumps(data))
         jsonfile.chmod(0o600)
     except (OSError, ValueError, TypeError) as err:
         raise JsonFileError(
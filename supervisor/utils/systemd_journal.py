@@ -1,7 +1,7 @@
 """Utilities for working with systemd journal export format."""
 
 from asyncio import IncompleteReadError
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterable
 from datetime import UTC, datetime
 from functools import wraps
 import json
@@ -14,6 +14,9 @@ from ..host.const import LogFormatter
 
 _RE_ANSI_CSI_COLORS_PATTERN = re.compile(r"\x1B\[[0-9;]*m")
 
+# Bytes requested from the journal gateway per read of the batch reader
+JOURNAL_READ_SIZE = 64 * 1024
+
 
 def _strip_ansi_colors(message: str) -> str:
     """Remove ANSI color codes from a message string."""
@@ -75,70 +78,113 @@ def journal_verbose_formatter(entries: dict[str, str], no_colors: bool = False)
     return f"{ts} {entries.get('_HOSTNAME', '')} {identifier}: {message}"
 
 
-async def journal_logs_reader(
-    journal_logs: ClientResponse,
-    log_formatter: LogFormatter = LogFormatter.PLAIN,
-    no_colors: bool = False,
-) -> AsyncGenerator[tuple[str | None, str]]:
-    """Read logs from systemd journal line by line, formatted using the given formatter.
-
-    Optionally strip ANSI color codes from the entries' messages.
-
-    Returns a generator of (cursor, formatted_entry) tuples.
-    """
+def get_journal_formatter(log_formatter: LogFormatter) -> Callable[..., str]:
+    """Return journal entry formatter function for a log format."""
     match log_formatter:
         case LogFormatter.PLAIN:
-            formatter_ = journal_plain_formatter
+            return journal_plain_formatter
         case LogFormatter.VERBOSE:
-            formatter_ = journal_verbose_formatter
+            return journal_verbose_formatter
         case _:
             raise ValueError(f"Unknown log format: {log_formatter}")
 
-    async with journal_logs as resp:
-        entries: dict[str, str] = {}
-        while not resp.content.at_eof():
-            line = await resp.content.readuntil(b"\n")
-            # newline means end of message, also empty line is sometimes returned
-            # at EOF (likely race between at_eof and EOF check in readuntil)
-            if line == b"\n" or not line:
-                if entries:
-                    yield (
-                        entries.get("__CURSOR"),
-                        formatter_(entries, no_colors=no_colors),
-                    )
-                entries = {}
-                continue
 
-            # Journal fields consisting only of valid non-control UTF-8 codepoints
-            # are serialized as they are (i.e. the field name, followed by '=',
-            # followed by field data), followed by a newline as separator to the next
-            # field. Note that fields containing newlines cannot be formatted like
-            # this. Non-control UTF-8 codepoints are the codepoints with value at or
-            # above 32 (' '), or equal to 9 (TAB).
-            name, sep, data = line.partition(b"=")
-            if not sep:
-                # Other journal fields are serialized in a special binary safe way:
-                # field name, followed by newline
-                name = name[:-1]  # strip \n
-                # followed by a binary 64-bit little endian size value,
-                length_raw = await resp.content.readexactly(8)
-                length = int.from_bytes(length_raw, byteorder="little")
-                # followed by the binary field data,
-                data = await resp.content.readexactly(length + 1)
-                # followed by a newline as separator to the next field.
-                if not data.endswith(b"\n"):
+class JournalExportParser:
+    """Incremental parser for the journal export format.
+
+    Data is parsed in blocks as it is fed, field boundaries are found with
+    bytes.find on the buffer instead of reading line by line. Only fields
+    in the given set are decoded, the others are skipped.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        """Initialize parser for entries with the given fields."""
+        self._fields: frozenset[bytes] = frozenset(
+            field.encode("utf-8") for field in fields
+        )
+        self._buffer = bytearray()
+        self._entry: dict[str, str] = {}
+
+    def feed(self, data: bytes) -> list[dict[str, str]]:
+        """Parse data and return the entries completed by it.
+
+        Incomplete fields at the end of data are kept until the next call.
+        """
+        buffer = self._buffer
+        buffer += data
+        fields = self._fields
+        entries: list[dict[str, str]] = []
+        entry = self._entry
+        pos = 0
+        end = len(buffer)
+
+        with memoryview(buffer) as view:
+            while (newline := buffer.find(b"\n", pos)) != -1:
+                # empty line means end of entry
+                if newline == pos:
+                    if entry:
+                        entries.append(entry)
+                        entry = {}
+                    pos += 1
+                    continue
+
+                # Text fields are serialized as name=data followed by a newline
+                if (equals := buffer.find(b"=", pos, newline)) != -1:
+                    if (name := bytes(view[pos:equals])) in fields:
+                        entry[name.decode("utf-8")] = str(
+                            view[equals + 1 : newline], "utf-8", "replace"
+                        )
+                    pos = newline + 1
+                    continue
+
+                # Binary safe fields are serialized as name, newline, 64-bit little
+                # endian size, data and a newline as separator to the next field
+                data_start = newline + 9
+                if data_start > end:
+                    break
+                data_end = data_start + int.from_bytes(
+                    view[newline + 1 : data_start], byteorder="little"
+                )
+                if data_end >= end:
+                    break
+                if buffer[data_end] != 0x0A:
                     raise MalformedBinaryEntryError(
-                        f"Failed parsing binary entry {data.decode('utf-8', errors='replace')}"
+                        "Failed parsing binary entry "
+                        f"{str(view[data_start : data_end + 1], 'utf-8', 'replace')}"
+                    )
+                if (name := bytes(view[pos:newline])) in fields:
+                    entry[name.decode("utf-8")] = str(
+                        view[data_start:data_end], "utf-8", "replace"
                     )
+                pos = data_end + 1
+
+        del buffer[:pos]
+        self._entry = entry
+        return entries
 
-            field_name = name.decode("utf-8")
-            if field_name not in formatter_.required_fields:
-                # we must read to the end of the entry in the stream, so we can
-                # only continue the loop here
-                continue
 
-            # strip \n for simple fields before decoding
-            entries[field_name] = data[:-1].decode("utf-8", errors="replace")
+async def journal_logs_batch_reader(
+    journal_logs: ClientResponse,
+    log_formatter: LogFormatter = LogFormatter.PLAIN,
+    no_colors: bool = False,
+) -> AsyncGenerator[list[tuple[str | None, str]]]:
+    """Read logs from systemd journal in blocks, formatted using the given formatter.
+
+    Optionally strip ANSI color codes from the entries' messages.
+
+    Returns a generator of lists of (cursor, formatted_entry) tuples, one list
+    with all entries completed by each block read from the stream.
+    """
+    formatter_ = get_journal_formatter(log_formatter)
+    parser = JournalExportParser(formatter_.required_fields)
+
+    async with journal_logs as resp:
+        while data := await resp.content.read(JOURNAL_READ_SIZE):
+            if entries := parser.feed(data):
+                yield [
+                    (entry.get("__CURSOR"), formatter_(entry, no_colors=no_colors))
+                    for entry in entries
+                ]
 
 
 def _parse_boot_json(boot_json_bytes: bytes) -> tuple[int, str]:
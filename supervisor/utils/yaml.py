@@ -31,6 +31,11 @@ def read_yaml_file(path: Path) -> dict:
         ) from err
 
 
+def yaml_dumps(data: dict) -> str:
+    """Dump YAML string as written to files."""
+    return dump(data, Dumper=Dumper)
+
+
 def write_yaml_file(path: Path, data: dict) -> None:
     """Write a YAML file.
 
@@ -38,7 +43,7 @@ def write_yaml_file(path: Path, data: dict) -> None:
     """
     try:
         with atomic_write(path, overwrite=True) as fp:
-            dump(data, fp, Dumper=Dumper)
+            fp.write(yaml_dumps(data))
         path.chmod(0o600)
     except (YAMLError, OSError, ValueError, TypeError) as err:
         raise YamlFileError(f"Can't write {path!s}: {err!s}", _LOGGER.error) from err
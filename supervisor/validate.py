@@ -10,11 +10,18 @@ from .const import (
     ATTR_ADDON,
     ATTR_ADDONS_CUSTOM_LIST,
     ATTR_APP,
+    ATTR_APP_BOOT_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_CONCURRENCY,
+    ATTR_APP_SHUTDOWN_TIMEOUT,
     ATTR_APPS_CUSTOM_LIST,
     ATTR_AUDIO,
     ATTR_AUTO_UPDATE,
+    ATTR_BACKUP_COMPRESSION,
+    ATTR_BACKUP_COMPRESSION_LEVEL,
+    ATTR_BACKUP_CONCURRENCY,
     ATTR_CHANNEL,
     ATTR_CLI,
+    ATTR_CONTENT,
     ATTR_COUNTRY,
     ATTR_DEBUG,
     ATTR_DEBUG_BLOCK,
@@ -23,6 +30,8 @@ from .const import (
     ATTR_DISPLAYNAME,
     ATTR_DNS,
     ATTR_ENABLE_IPV6,
+    ATTR_ENTRIES,
+    ATTR_ETAG,
     ATTR_FEATURE_FLAGS,
     ATTR_FORCE_SECURITY,
     ATTR_HASSOS,
@@ -31,7 +40,10 @@ from .const import (
     ATTR_HOMEASSISTANT,
     ATTR_ID,
     ATTR_IMAGE,
+    ATTR_IMMUTABLE,
+    ATTR_INGRESS_BUFFER_SIZE,
     ATTR_LAST_BOOT,
+    ATTR_LAST_MODIFIED,
     ATTR_LOGGING,
     ATTR_MTU,
     ATTR_MULTICAST,
@@ -45,12 +57,15 @@ from .const import (
     ATTR_SESSION,
     ATTR_SESSION_DATA,
     ATTR_SESSION_DATA_USER,
+    ATTR_STATS_INTERVAL,
     ATTR_SUPERVISOR,
     ATTR_TIMEZONE,
     ATTR_USERNAME,
     ATTR_VERSION,
     ATTR_WAIT_BOOT,
+    INGRESS_BUFFER_SIZE,
     SUPERVISOR_VERSION,
+    BackupCompression,
     FeatureFlag,
     LogLevel,
     UpdateChannel,
@@ -66,6 +81,12 @@ RE_REGISTRY = re.compile(r"^([a-z0-9]+(-[a-z0-9]+)*\.)+[a-z]{2,}$")
 # pylint: disable=invalid-name
 network_port = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
 wait_boot = vol.All(vol.Coerce(int), vol.Range(min=1, max=60))
+app_concurrency = vol.All(vol.Coerce(int), vol.Range(min=1, max=16))
+app_shutdown_timeout = vol.Maybe(vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)))
+backup_concurrency = vol.All(vol.Coerce(int), vol.Range(min=1, max=8))
+stats_interval = vol.Any(0, vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)))
+backup_compression_level = vol.Maybe(vol.All(vol.Coerce(int), vol.Range(min=1, max=22)))
+ingress_buffer_size = vol.All(vol.Coerce(int), vol.Range(min=0, max=64 * 1024 * 1024))
 # Path component pattern for Docker image names (supports {arch}/{machine} templates)
 _RE_IMAGE_PATH_COMPONENT = re.compile(r"^[a-z0-9{][a-z0-9.\-_{}]*$")
 
@@ -221,6 +242,19 @@ SCHEMA_SUPERVISOR_CONFIG = vol.All(
             vol.Optional(ATTR_IMAGE): docker_image,
             vol.Optional(ATTR_APPS_CUSTOM_LIST, default=[]): repositories,
             vol.Optional(ATTR_WAIT_BOOT, default=5): wait_boot,
+            vol.Optional(ATTR_APP_BOOT_CONCURRENCY, default=1): app_concurrency,
+            vol.Optional(ATTR_APP_SHUTDOWN_CONCURRENCY, default=1): app_concurrency,
+            vol.Optional(ATTR_APP_SHUTDOWN_TIMEOUT, default=None): app_shutdown_timeout,
+            vol.Optional(ATTR_BACKUP_CONCURRENCY, default=1): backup_concurrency,
+            vol.Optional(
+                ATTR_BACKUP_COMPRESSION, default=BackupCompression.GZIP
+            ): vol.Coerce(BackupCompression),
+            vol.Optional(
+                ATTR_BACKUP_COMPRESSION_LEVEL, default=None
+            ): backup_compression_level,
+            vol.Optional(
+                ATTR_INGRESS_BUFFER_SIZE, default=INGRESS_BUFFER_SIZE
+            ): ingress_buffer_size,
             vol.Optional(ATTR_LOGGING, default=LogLevel.INFO): vol.Coerce(LogLevel),
             vol.Optional(ATTR_DEBUG, default=False): vol.Boolean(),
             vol.Optional(ATTR_DEBUG_BLOCK, default=False): vol.Boolean(),
@@ -250,6 +284,7 @@ SCHEMA_DOCKER_CONFIG = vol.Schema(
         vol.Optional(ATTR_MTU, default=None): vol.Maybe(
             vol.All(int, vol.Range(min=68, max=65535))
         ),
+        vol.Optional(ATTR_STATS_INTERVAL, default=0): stats_interval,
     }
 )
 
@@ -295,6 +330,27 @@ SCHEMA_SECURITY_CONFIG = vol.Schema(
 )
 
 
+SCHEMA_HTTP_CACHE_ENTRY = vol.Schema(
+    {
+        vol.Optional(ATTR_ETAG): str,
+        vol.Optional(ATTR_LAST_MODIFIED): str,
+        vol.Optional(ATTR_IMMUTABLE, default=False): vol.Boolean(),
+        vol.Required(ATTR_CONTENT): str,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+SCHEMA_HTTP_CACHE_CONFIG = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRIES, default=dict): vol.Schema(
+            {str: SCHEMA_HTTP_CACHE_ENTRY}
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
 def migrate_addon_to_app(data: dict) -> dict:
     """Migrate legacy 'addon' key to 'app' for backwards compatibility."""
     # 'addon' field deprecated as of 2026.05
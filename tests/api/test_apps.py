@@ -14,7 +14,7 @@ import pytest
 from supervisor.apps.app import App
 from supervisor.apps.build import AppBuild
 from supervisor.arch import CpuArchManager
-from supervisor.const import AppState, CpuArch
+from supervisor.const import AppBoot, AppStartup, AppState, CpuArch
 from supervisor.coresys import CoreSys
 from supervisor.docker.app import DockerApp
 from supervisor.docker.const import ContainerState
@@ -830,3 +830,26 @@ async def test_apps_info_versioned_advanced_field(
         assert "advanced" in data
     else:
         assert "advanced" not in data
+
+
+@pytest.mark.usefixtures("install_app_ssh")
+async def test_v2_apps_boot_timeline(api_client_v2: TestClient, coresys: CoreSys):
+    """V2 GET /v2/apps/boot_timeline returns timeline of apps started at boot."""
+    resp = await api_client_v2.get("/v2/apps/boot_timeline")
+    assert resp.status == 200
+    assert (await resp.json())["data"]["apps"] == []
+
+    coresys.apps.local[TEST_ADDON_SLUG].boot = AppBoot.AUTO
+    with patch.object(App, "start", return_value=asyncio.Future()) as start:
+        start.return_value.set_result(None)
+        await coresys.apps.boot(AppStartup.APPLICATION)
+
+    resp = await api_client_v2.get("/v2/apps/boot_timeline")
+    assert resp.status == 200
+    timeline = (await resp.json())["data"]["apps"]
+    assert len(timeline) == 1
+    assert timeline[0]["slug"] == TEST_ADDON_SLUG
+    assert timeline[0]["stage"] == "application"
+    assert timeline[0]["dependencies"] == []
+    assert timeline[0]["ready"] is not None
+    assert timeline[0]["error"] is None
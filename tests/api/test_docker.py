@@ -1,5 +1,8 @@
 """Test Docker API."""
 
+from unittest.mock import AsyncMock, MagicMock
+
+from aiodocker.containers import DockerContainer
 from aiohttp.test_utils import TestClient
 import pytest
 
@@ -7,6 +10,7 @@ from supervisor.coresys import CoreSys
 from supervisor.resolution.const import ContextType, IssueType, SuggestionType
 from supervisor.resolution.data import Issue, Suggestion
 
+from tests.common import load_json_fixture
 from tests.dbus_service_mocks.agent_system import System as SystemService
 from tests.dbus_service_mocks.base import DBusServiceMock
 
@@ -170,3 +174,90 @@ async def test_api_migrate_docker_storage_driver_old_os(
         json={"storage_driver": "overlayfs"},
     )
     assert resp.status == 404
+
+
+async def test_api_docker_stats(
+    coresys: CoreSys,
+    api_client_with_prefix: tuple[TestClient, str],
+    container: DockerContainer,
+):
+    """Test stats of all containers and their history."""
+    api_client, prefix = api_client_with_prefix
+    container.show.return_value["State"]["Status"] = "running"
+    container.stats = AsyncMock(
+        return_value=[load_json_fixture("container_stats.json")]
+    )
+    listed = MagicMock()
+    listed.__getitem__.side_effect = {
+        "Names": ["/addon_local_test"],
+        "State": "running",
+    }.__getitem__
+    coresys.docker.containers.list.return_value = [listed]
+
+    # Sampler is off, stats are collected on demand
+    assert not coresys.docker.stats_sampler.running
+    resp = await api_client.get(f"{prefix}/docker/stats")
+    assert resp.status == 200
+    body = await resp.json()
+    assert body["data"]["stats_interval"] == 0
+    assert len(body["data"]["containers"]) == 1
+    stats = body["data"]["containers"][0]
+    assert stats["name"] == "addon_local_test"
+    assert stats["cpu_percent"] == 90.0
+    assert stats["memory_usage"] == 59700000
+
+    await coresys.docker.stats_sampler.sample()
+    container.stats.return_value[0]["memory_stats"]["usage"] = 80300000
+    await coresys.docker.stats_sampler.sample()
+
+    resp = await api_client.get(f"{prefix}/docker/stats/addon_local_test/history")
+    assert resp.status == 200
+    body = await resp.json()
+    assert [sample["memory_usage"] for sample in body["data"]["history"]] == [
+        59700000,
+        59700000,
+        80000000,
+    ]
+
+    resp = await api_client.get(
+        f"{prefix}/docker/stats/addon_local_test/history?points=2"
+    )
+    body = await resp.json()
+    assert [sample["memory_usage"] for sample in body["data"]["history"]] == [
+        59700000,
+        69850000,
+    ]
+
+    resp = await api_client.get(
+        f"{prefix}/docker/stats/addon_local_test/history?points=0"
+    )
+    assert resp.status == 400
+
+    resp = await api_client.get(f"{prefix}/docker/stats/bad/history")
+    assert resp.status == 404
+
+    # History of removed containers is dropped
+    coresys.docker.containers.list.return_value = []
+    await coresys.docker.stats_sampler.sample()
+    assert coresys.docker.stats_sampler.containers == []
+
+
+async def test_api_docker_stats_interval(
+    coresys: CoreSys, api_client_with_prefix: tuple[TestClient, str]
+):
+    """Test setting interval of stats sampler."""
+    api_client, prefix = api_client_with_prefix
+
+    resp = await api_client.post(f"{prefix}/docker/options", json={"stats_interval": 2})
+    assert resp.status == 400
+
+    resp = await api_client.post(
+        f"{prefix}/docker/options", json={"stats_interval": 10}
+    )
+    assert resp.status == 200
+    assert coresys.docker.config.stats_interval == 10
+    assert coresys.docker.stats_sampler.running
+
+    resp = await api_client.post(f"{prefix}/docker/options", json={"stats_interval": 0})
+    assert resp.status == 200
+    assert not coresys.docker.stats_sampler.running
@@ -426,6 +426,110 @@ async def test_advanced_logs_formatters(
     journal_logs_reader.assert_called_once_with(ANY, LogFormatter.PLAIN, False)
 
 
+async def test_advanced_logs_priority(
+    api_client_with_prefix: tuple[TestClient, str],
+    coresys: CoreSys,
+    journald_logs: MagicMock,
+):
+    """Test advanced logs filtered by priority in the journal."""
+    api_client, prefix = api_client_with_prefix
+
+    await api_client.get(f"{prefix}/host/logs?priority=err")
+    journald_logs.assert_called_once_with(
+        params={
+            "SYSLOG_IDENTIFIER": coresys.host.logs.default_identifiers,
+            "PRIORITY": ["0", "1", "2", "3"],
+        },
+        range_header=DEFAULT_RANGE,
+        accept=LogFormat.JOURNAL,
+    )
+
+    journald_logs.reset_mock()
+
+    await api_client.get(f"{prefix}/host/logs?priority=1")
+    assert journald_logs.call_args.kwargs["params"]["PRIORITY"] == ["0", "1"]
+
+    resp = await api_client.get(f"{prefix}/host/logs?priority=loud")
+    assert resp.status == 400
+    assert (
+        await resp.text()
+        == "Invalid priority loud, use 0-7 or one of emerg, alert, crit, err, warning, notice, info, debug"
+    )
+
+
+async def test_advanced_logs_grep(
+    journald_gateway: MagicMock,
+    api_client_with_prefix: tuple[TestClient, str],
+):
+    """Test advanced logs filtered by grep while streaming."""
+    api_client, prefix = api_client_with_prefix
+
+    journald_gateway.content.feed_data(
+        b"__CURSOR=cursor1\nMESSAGE=Hello, world!\n\n"
+        b"__CURSOR=cursor2\nMESSAGE=Error 42 occurred\n\n"
+        b"__CURSOR=cursor3\nMESSAGE=HELLO again\n\n"
+    )
+    journald_gateway.content.feed_eof()
+
+    resp = await api_client.get(f"{prefix}/host/logs/identifiers/test?grep=hello")
+    assert resp.status == 200
+    assert resp.headers["X-First-Cursor"] == "cursor1"
+    assert await resp.text() == "Hello, world!\nHELLO again\n"
+
+
+async def test_advanced_logs_grep_regex(
+    journald_gateway: MagicMock,
+    api_client_with_prefix: tuple[TestClient, str],
+):
+    """Test advanced logs filtered by regular expression."""
+    api_client, prefix = api_client_with_prefix
+
+    resp = await api_client.get(f"{prefix}/host/logs/identifiers/test?grep=(&regex")
+    assert resp.status == 400
+    assert (await resp.text()).startswith("Invalid grep pattern")
+
+    journald_gateway.content.feed_data(
+        b"MESSAGE=Hello, world!\n\nMESSAGE=Error 42 occurred\n\n"
+    )
+    journald_gateway.content.feed_eof()
+
+    resp = await api_client.get(
+        f"{prefix}/host/logs/identifiers/test?grep=error \\d%2B&regex"
+    )
+    assert await resp.text() == "Error 42 occurred\n"
+
+    # Regex mode can be turned off explicitly
+    resp = await api_client.get(f"{prefix}/host/logs/identifiers/test?grep=(&regex=0")
+    assert resp.status == 200
+    resp = await api_client.get(
+        f"{prefix}/host/logs/identifiers/test?grep=(&regex=maybe"
+    )
+    assert resp.status == 400
+    assert (await resp.text()).startswith("Invalid value for regex")
+
+
+async def test_advanced_logs_follow_batching(
+    journald_gateway: MagicMock,
+    api_client_with_prefix: tuple[TestClient, str],
+):
+    """Test followed logs are written in blocks but without long delay."""
+    api_client, prefix = api_client_with_prefix
+
+    journald_gateway.content.feed_data(b"MESSAGE=first\n\n")
+    resp = await api_client.get(f"{prefix}/host/logs/identifiers/test/follow")
+    assert resp.status == 200
+
+    # First lines are written right away, later ones after the flush interval
+    assert await resp.content.readline() == b"first\n"
+    journald_gateway.content.feed_data(b"MESSAGE=second\n\n")
+    await asyncio.sleep(0)
+    journald_gateway.content.feed_data(b"MESSAGE=third\n\n")
+    assert await asyncio.wait_for(resp.content.readexactly(13), 1) == b"second\nthird\n"
+
+    journald_gateway.content.feed_eof()
+    assert await resp.text() == ""
+
+
 async def test_advanced_logs_errors(
     coresys: CoreSys, api_client_with_prefix: tuple[TestClient, str]
 ):
@@ -1,9 +1,8 @@
 """Test ingress API."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import aiohttp
 from aiohttp import hdrs, web
 from aiohttp.test_utils import TestClient, TestServer
 import pytest
@@ -12,17 +11,6 @@ from supervisor.apps.app import App
 from supervisor.coresys import CoreSys
 
 
-@pytest.fixture(name="real_websession")
-async def fixture_real_websession(
-    coresys: CoreSys,
-) -> AsyncGenerator[aiohttp.ClientSession]:
-    """Fixture for real aiohttp ClientSession for ingress proxy tests."""
-    session = aiohttp.ClientSession()
-    coresys._websession = session  # pylint: disable=W0212
-    yield session
-    await session.close()
-
-
 async def test_validate_session(
     api_client_with_prefix: tuple[TestClient, str], coresys: CoreSys
 ):
@@ -55,7 +43,8 @@ async def test_validate_session(
         assert resp.status == 200
         assert await resp.json() == {"result": "ok", "data": {}}
 
-        assert coresys.ingress.sessions[session] > valid_time
+        # Renewal right after creation is debounced
+        assert coresys.ingress.sessions[session] == pytest.approx(valid_time, abs=1)
 
 
 async def test_validate_session_with_user_id(
@@ -102,7 +91,8 @@ async def test_validate_session_with_user_id(
         assert resp.status == 200
         assert await resp.json() == {"result": "ok", "data": {}}
 
-        assert coresys.ingress.sessions[session] > valid_time
+        # Renewal right after creation is debounced
+        assert coresys.ingress.sessions[session] == pytest.approx(valid_time, abs=1)
 
         assert session in coresys.ingress.sessions_data
         assert coresys.ingress.get_session_data(session).user.id == "some-id"
@@ -113,7 +103,6 @@ async def test_validate_session_with_user_id(
 async def test_ingress_proxy_no_content_type_for_empty_body_responses(
     api_client_with_prefix: tuple[TestClient, str],
     coresys: CoreSys,
-    real_websession: aiohttp.ClientSession,
 ):
     """Test that empty body responses don't get Content-Type header."""
     api_client, prefix = api_client_with_prefix
@@ -232,4 +221,134 @@ async def test_ingress_proxy_no_content_type_for_empty_body_responses(
             assert body == b'{"key": "value"}'
 
     finally:
+        await coresys.ingress.close_websessions()
+        await app_server.close()
+
+
+async def test_ingress_proxy_pool_and_stats(
+    api_client_with_prefix: tuple[TestClient, str],
+    coresys: CoreSys,
+):
+    """Test ingress proxy reuses the app connection pool and records stats."""
+    api_client, prefix = api_client_with_prefix
+
+    async def mock_app_handler(request: web.Request) -> web.Response:
+        """Mock app handler echoing the request body."""
+        return web.Response(body=await request.read())
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", mock_app_handler)
+    app_server = TestServer(app)
+    await app_server.start_server()
+
+    try:
+        resp = await api_client.post(f"{prefix}/ingress/session")
+        session = (await resp.json())["data"]["session"]
+
+        mock_app = MagicMock(spec=App)
+        mock_app.slug = "test_addon"
+        mock_app.ip_address = app_server.host
+        mock_app.ingress_port = app_server.port
+        mock_app.ingress_stream = False
+
+        ingress_token = coresys.ingress.create_session()
+        with patch.object(coresys.ingress, "get", return_value=mock_app):
+            for _ in range(3):
+                resp = await api_client.post(
+                    f"{prefix}/ingress/{ingress_token}/echo",
+                    cookies={"ingress_session": session},
+                    data=b"hello",
+                )
+                assert resp.status == 200
+                assert await resp.read() == b"hello"
+
+        websession = coresys.ingress.get_websession(mock_app)
+        assert websession is coresys.ingress.get_websession(mock_app)
+
+        resp = await api_client.get(f"{prefix}/ingress/stats")
+        result = await resp.json()
+        stats = result["data"]["apps"]["test_addon"]
+        assert stats["requests"] == 3
+        assert stats["errors"] == 0
+        assert stats["bytes_in"] == 15
+        assert stats["bytes_out"] == 15
+        assert stats["latency_avg"] is not None
+    finally:
+        await coresys.ingress.close_websessions()
+        await app_server.close()
+
+
+async def test_ingress_proxy_streams_large_body(
+    api_client_with_prefix: tuple[TestClient, str],
+    coresys: CoreSys,
+):
+    """Test bodies larger than the buffer size are streamed to the app."""
+    api_client, prefix = api_client_with_prefix
+    received: list[tuple[str | None, str | None, bytes]] = []
+
+    async def mock_app_handler(request: web.Request) -> web.Response:
+        """Mock app handler recording the request body."""
+        received.append(
+            (
+                request.headers.get(hdrs.CONTENT_LENGTH),
+                request.headers.get(hdrs.TRANSFER_ENCODING),
+                await request.read(),
+            )
+        )
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", mock_app_handler)
+    app_server = TestServer(app)
+    await app_server.start_server()
+
+    async def chunked_body() -> AsyncIterator[bytes]:
+        """Yield body without announcing its size."""
+        yield b"chunked "
+        yield b"upload"
+
+    try:
+        resp = await api_client.post(f"{prefix}/ingress/session")
+        session = (await resp.json())["data"]["session"]
+
+        mock_app = MagicMock(spec=App)
+        mock_app.slug = "test_addon"
+        mock_app.ip_address = app_server.host
+        mock_app.ingress_port = app_server.port
+        mock_app.ingress_stream = False
+
+        coresys.config.ingress_buffer_size = 16
+        ingress_token = coresys.ingress.create_session()
+        with patch.object(coresys.ingress, "get", return_value=mock_app):
+            # Small body is buffered
+            resp = await api_client.put(
+                f"{prefix}/ingress/{ingress_token}/file",
+                cookies={"ingress_session": session},
+                data=b"small",
+            )
+            assert resp.status == 204
+
+            # Large body is streamed keeping its length
+            resp = await api_client.put(
+                f"{prefix}/ingress/{ingress_token}/file",
+                cookies={"ingress_session": session},
+                data=b"x" * 1024,
+            )
+            assert resp.status == 204
+
+            # Body of unknown size is streamed chunked
+            resp = await api_client.patch(
+                f"{prefix}/ingress/{ingress_token}/file",
+                cookies={"ingress_session": session},
+                data=chunked_body(),
+            )
+            assert resp.status == 204
+
+        assert received == [
+            ("5", None, b"small"),
+            ("1024", None, b"x" * 1024),
+            (None, "chunked", b"chunked upload"),
+        ]
+    finally:
+        await coresys.ingress.close_websessions()
         await app_server.close()
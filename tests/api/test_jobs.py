@@ -1,16 +1,19 @@
 """Test Docker API."""
 
 import asyncio
+from pathlib import Path
 from unittest.mock import ANY, AsyncMock
 
 from aiohttp.test_utils import TestClient
 import pytest
+import voluptuous as vol
 
-from supervisor.const import FeatureFlag
+from supervisor.const import BusEvent, FeatureFlag
 from supervisor.coresys import CoreSys
 from supervisor.exceptions import SupervisorError
 from supervisor.jobs.const import ATTR_IGNORE_CONDITIONS, JobCondition
 from supervisor.jobs.decorator import Job
+from supervisor.utils.common import FileConfiguration
 
 
 class _JobsTreeTestHelper:
@@ -114,6 +117,96 @@ async def test_api_jobs_info(api_client_with_prefix: tuple[TestClient, str]):
 
     assert result["data"][ATTR_IGNORE_CONDITIONS] == []
     assert result["data"]["jobs"] == []
+    assert result["data"]["scheduled_tasks"] == []
+
+
+async def test_api_jobs_info_bus_stats(
+    api_client_with_prefix: tuple[TestClient, str], coresys: CoreSys
+):
+    """Test jobs info api includes dispatch statistics of bus events."""
+    api_client, prefix = api_client_with_prefix
+
+    coresys.bus.register_callback(BusEvent.SUPERVISOR_STATE_CHANGE, lambda _: None)
+    coresys.bus.fire_event(BusEvent.SUPERVISOR_STATE_CHANGE, None)
+    resp = await api_client.get(f"{prefix}/jobs/info")
+    result = await resp.json()
+
+    stats = result["data"]["bus_stats"]["supervisor_state_change"]
+    assert stats["fired"] >= 1
+    assert stats["calls"] >= 1
+    assert stats["dropped"] == 0
+    assert stats.keys() == {
+        "fired",
+        "calls",
+        "dropped",
+        "latency_total",
+        "latency_max",
+    }
+
+
+async def test_api_jobs_info_config_write_stats(
+    api_client_with_prefix: tuple[TestClient, str], tmp_path: Path
+):
+    """Test jobs info api includes writes of configuration files."""
+    api_client, prefix = api_client_with_prefix
+
+    config = await FileConfiguration(
+        tmp_path / "test.json", vol.Schema({vol.Optional("value", default=0): int})
+    ).load_config()
+    await config.save_data()
+    await config.save_data()
+    resp = await api_client.get(f"{prefix}/jobs/info")
+    result = await resp.json()
+
+    assert result["data"]["config_write_stats"][str(tmp_path / "test.json")] == {
+        "writes": 1,
+        "skipped": 1,
+        "bytes_written": (tmp_path / "test.json").stat().st_size,
+    }
+
+
+async def test_api_jobs_info_http_cache_stats(
+    api_client_with_prefix: tuple[TestClient, str], coresys: CoreSys
+):
+    """Test jobs info api includes statistics of the HTTP cache."""
+    api_client, prefix = api_client_with_prefix
+
+    coresys.http_cache.get_token("ghcr.io/test")
+    resp = await api_client.get(f"{prefix}/jobs/info")
+    result = await resp.json()
+
+    assert result["data"]["http_cache_stats"] == coresys.http_cache.stats.as_dict()
+    assert result["data"]["http_cache_stats"]["token_misses"] >= 1
+
+
+async def test_api_jobs_info_scheduled_tasks(
+    api_client_with_prefix: tuple[TestClient, str], coresys: CoreSys
+):
+    """Test jobs info api includes scheduled task statistics."""
+    api_client, prefix = api_client_with_prefix
+
+    async def periodic_task():
+        """Test task for schedule."""
+
+    coresys.scheduler.register_task(periodic_task, 3600)
+    resp = await api_client.get(f"{prefix}/jobs/info")
+    result = await resp.json()
+
+    assert result["data"]["scheduled_tasks"] == [
+        {
+            "id": ANY,
+            "name": "test_api_jobs_info_scheduled_tasks.<locals>.periodic_task",
+            "interval": 3600,
+            "repeat": True,
+            "running": False,
+            "runs": 0,
+            "overruns": 0,
+            "last_run": None,
+            "last_duration": None,
+            "next_run": ANY,
+        }
+    ]
+    await coresys.scheduler.shutdown()
 
 
 async def test_api_jobs_options(
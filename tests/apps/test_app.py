@@ -495,19 +495,14 @@ async def test_listeners_removed_on_uninstall(
     assert install_app_ssh.loaded is True
     # pylint: disable=protected-access
     listeners = install_app_ssh._listeners
+    key = (BusEvent.DOCKER_CONTAINER_STATE_CHANGE, install_app_ssh.instance.name)
     for listener in listeners:
-        assert (
-            listener in coresys.bus._listeners[BusEvent.DOCKER_CONTAINER_STATE_CHANGE]
-        )
+        assert listener in coresys.bus._keyed_listeners[key]
 
     with patch.object(App, "persist", new=PropertyMock(return_value=MagicMock())):
         await coresys.apps.uninstall(TEST_ADDON_SLUG)
 
-    for listener in listeners:
-        assert (
-            listener
-            not in coresys.bus._listeners[BusEvent.DOCKER_CONTAINER_STATE_CHANGE]
-        )
+    assert key not in coresys.bus._keyed_listeners
 
 
 @pytest.mark.usefixtures("tmp_supervisor_data", "path_extern")
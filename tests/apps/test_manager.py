@@ -11,6 +11,7 @@ from awesomeversion import AwesomeVersion
 import pytest
 
 from supervisor.apps.app import App
+from supervisor.apps.boot import boot_dependencies
 from supervisor.arch import CpuArchManager
 from supervisor.config import CoreConfig
 from supervisor.const import (
@@ -715,3 +716,142 @@ async def test_shared_image_kept_on_update(
         await coresys.apps.update("local_example_image")
         docker.images.delete.assert_called_once_with("image_old", force=True)
         assert install_app_example_image.version == "1.3.0"
+
+
+def _mock_boot_app(slug: str, services: dict[str, str]) -> Mock:
+    """Return a mock app started at boot."""
+    return Mock(
+        slug=slug,
+        boot=AppBoot.AUTO,
+        startup=AppStartup.APPLICATION,
+        host_network=False,
+        state=AppState.STARTED,
+        services_role=services,
+    )
+
+
+def test_boot_dependencies():
+    """Test apps depend on apps providing services they use."""
+    mqtt = _mock_boot_app("mqtt", {"mqtt": "provide"})
+    mariadb = _mock_boot_app("mariadb", {"mysql": "provide"})
+    zigbee = _mock_boot_app("zigbee", {"mqtt": "need"})
+    recorder = _mock_boot_app("recorder", {"mqtt": "want", "mysql": "need"})
+    other = _mock_boot_app("other", {})
+
+    assert boot_dependencies([mqtt, mariadb, zigbee, recorder, other]) == {
+        "mqtt": set(),
+        "mariadb": set(),
+        "zigbee": {"mqtt"},
+        "recorder": {"mqtt", "mariadb"},
+        "other": set(),
+    }
+
+
+def test_boot_dependencies_cycle(caplog: pytest.LogCaptureFixture):
+    """Test cyclic service dependencies are broken."""
+    first = _mock_boot_app("first", {"mqtt": "provide", "mysql": "need"})
+    second = _mock_boot_app("second", {"mysql": "provide", "mqtt": "need"})
+
+    assert boot_dependencies([first, second]) == {
+        "first": set(),
+        "second": {"first"},
+    }
+    assert "App first has a cyclic service dependency on second" in caplog.text
+
+
+async def test_boot_parallel_with_dependencies(coresys: CoreSys):
+    """Test apps boot in parallel and wait for service providers."""
+    coresys.config.wait_boot = 1
+    coresys.config.app_boot_concurrency = 2
+    events: list[str] = []
+    provider_ready = asyncio.Event()
+
+    def _start(app: Mock, ready: asyncio.Event | None = None):
+        async def start():
+            events.append(f"start {app.slug}")
+
+            async def wait_ready():
+                if ready:
+                    await ready.wait()
+                events.append(f"ready {app.slug}")
+
+            return asyncio.create_task(wait_ready())
+
+        return start
+
+    mqtt = _mock_boot_app("mqtt", {"mqtt": "provide"})
+    mqtt.start = _start(mqtt, provider_ready)
+    zigbee = _mock_boot_app("zigbee", {"mqtt": "need"})
+    zigbee.start = _start(zigbee)
+    other = _mock_boot_app("other", {})
+    other.start = _start(other)
+
+    with patch.dict(coresys.apps.local, mqtt=mqtt, zigbee=zigbee, other=other):
+        boot = asyncio.create_task(coresys.apps.boot(AppStartup.APPLICATION))
+        await asyncio.sleep(0.1)
+        assert events == ["start mqtt", "start other", "ready other"]
+
+        provider_ready.set()
+        await boot
+
+    assert events[3:] == ["ready mqtt", "start zigbee", "ready zigbee"]
+    assert coresys.apps.boot_timeline["zigbee"].dependencies == ["mqtt"]
+    assert (
+        coresys.apps.boot_timeline["zigbee"].started
+        >= coresys.apps.boot_timeline["mqtt"].ready
+    )
+
+
+async def test_shutdown_parallel_with_deadline(coresys: CoreSys):
+    """Test apps stop in parallel with their timeout capped by the stage deadline."""
+    coresys.config.app_shutdown_concurrency = 2
+    coresys.config.app_shutdown_timeout = 30
+    stopping: list[str] = []
+    stop_event = asyncio.Event()
+
+    def _mock_started_app(slug: str, timeout: int) -> Mock:
+        app = Mock(
+            slug=slug,
+            startup=AppStartup.APPLICATION,
+            state=AppState.STARTED,
+            timeout=timeout,
+        )
+
+        async def stop(*, timeout: int | None = None):
+            stopping.append(slug)
+            await stop_event.wait()
+
+        app.stop = AsyncMock(side_effect=stop)
+        return app
+
+    fast = _mock_started_app("fast", 10)
+    slow = _mock_started_app("slow", 120)
+    other = _mock_started_app("other", 10)
+
+    with patch.dict(coresys.apps.local, fast=fast, slow=slow, other=other):
+        shutdown = asyncio.create_task(coresys.apps.shutdown(AppStartup.APPLICATION))
+        await asyncio.sleep(0.1)
+        assert stopping == ["fast", "slow"]
+
+        stop_event.set()
+        await shutdown
+
+    assert stopping == ["fast", "slow", "other"]
+    assert fast.stop.call_args.kwargs["timeout"] == 10
+    assert 0 < slow.stop.call_args.kwargs["timeout"] <= 30
+    assert coresys.apps.shutdown_durations.keys() >= {"fast", "slow", "other"}
+
+
+async def test_shutdown_sequential_by_default(coresys: CoreSys):
+    """Test apps stop one at a time with their own timeout by default."""
+    app = Mock(
+        slug="test",
+        startup=AppStartup.APPLICATION,
+        state=AppState.STARTED,
+        stop=AsyncMock(),
+    )
+
+    with patch.dict(coresys.apps.local, test=app):
+        await coresys.apps.shutdown(AppStartup.APPLICATION)
+
+    app.stop.assert_called_once_with(timeout=None)
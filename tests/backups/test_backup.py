@@ -2,6 +2,7 @@
 
 from contextlib import AbstractContextManager, nullcontext as does_not_raise
 from pathlib import Path
+from random import randbytes
 from shutil import copy
 import tarfile
 from unittest.mock import MagicMock, patch
@@ -12,6 +13,7 @@ from securetar import AddFileError, InvalidPasswordError, SecureTarReadError
 from supervisor.apps.app import App
 from supervisor.backups.backup import Backup, BackupLocation
 from supervisor.backups.const import BackupType
+from supervisor.const import BackupCompression
 from supervisor.coresys import CoreSys
 from supervisor.exceptions import (
     AppsError,
@@ -696,3 +698,119 @@ async def test_restore_supervisor_config_tar_read_error(
             success, tasks = await backup.restore_supervisor_config()
             assert success is False
             assert tasks == []
+
+
+@pytest.mark.parametrize("password", [None, "my_password"])
+async def test_store_folders_parallel(
+    coresys: CoreSys, tmp_supervisor_data: Path, tmp_path: Path, password: str | None
+):
+    """Test folders are compressed in parallel and added to the backup in order."""
+    coresys.config.backup_concurrency = 2
+    (tmp_supervisor_data / "share" / "share.txt").write_text("share")
+    (tmp_supervisor_data / "media" / "media.txt").write_text("media")
+    (tmp_supervisor_data / "ssl" / "cert.pem").write_text("ssl")
+
+    paths_before = {path.name for path in tmp_path.iterdir()}
+    backup_file = tmp_path / "my_backup.tar"
+    backup = Backup(coresys, backup_file, "test", None)
+    backup.new(
+        "test", "2023-07-21T21:05:00.000000+00:00", BackupType.FULL, password=password
+    )
+
+    async with backup.create():
+        await backup.store_folders(["share", "media", "missing", "ssl"])
+
+    assert backup.folders == ["share", "media", "ssl"]
+    with tarfile.open(backup_file, "r:") as tar:
+        assert tar.getnames() == [
+            "./share.tar.gz",
+            "./share.manifest.tar.gz",
+            "./media.tar.gz",
+            "./media.manifest.tar.gz",
+            "./ssl.tar.gz",
+            "./ssl.manifest.tar.gz",
+            "./backup.json",
+        ]
+    # Staging directory was removed
+    assert {path.name for path in tmp_path.iterdir()} == paths_before | {
+        "my_backup.tar"
+    }
+
+    (tmp_supervisor_data / "share" / "share.txt").unlink()
+    (tmp_supervisor_data / "media" / "media.txt").unlink()
+    async with backup.open(None):
+        assert await backup.restore_folders(["share", "media"])
+
+    assert (tmp_supervisor_data / "share" / "share.txt").read_text() == "share"
+    assert (tmp_supervisor_data / "media" / "media.txt").read_text() == "media"
+
+
+@pytest.mark.parametrize("password", [None, "my_password"])
+async def test_store_folders_zstd(
+    coresys: CoreSys, tmp_supervisor_data: Path, tmp_path: Path, password: str | None
+):
+    """Test backup with zstd compression records codec and restores with it."""
+    coresys.config.backup_compression = BackupCompression.ZSTD
+    coresys.config.backup_compression_level = 19
+    (tmp_supervisor_data / "share" / "share.txt").write_text("share")
+
+    paths_before = {path.name for path in tmp_path.iterdir()}
+    backup_file = tmp_path / "my_backup.tar"
+    backup = Backup(coresys, backup_file, "test", None)
+    backup.new(
+        "test", "2023-07-21T21:05:00.000000+00:00", BackupType.FULL, password=password
+    )
+
+    async with backup.create():
+        await backup.store_folders(["share"])
+
+    assert backup.data["compression"] == "zstd"
+    assert backup.data["compression_level"] == 19
+    with tarfile.open(backup_file, "r:") as tar:
+        assert tar.getnames() == [
+            "./share.tar.zst",
+            "./share.manifest.tar.zst",
+            "./backup.json",
+        ]
+    # Staged tar file was removed
+    assert {path.name for path in tmp_path.iterdir()} == paths_before | {
+        "my_backup.tar"
+    }
+
+    await backup.validate_backup(None)
+
+    (tmp_supervisor_data / "share" / "share.txt").unlink()
+    async with backup.open(None):
+        assert await backup.restore_folders(["share"])
+
+    assert (tmp_supervisor_data / "share" / "share.txt").read_text() == "share"
+
+
+@pytest.mark.parametrize(
+    ("compression", "level"),
+    [(BackupCompression.GZIP, None), (BackupCompression.ZSTD, 3)],
+)
+async def test_store_homeassistant_size(
+    coresys: CoreSys,
+    tmp_path: Path,
+    compression: BackupCompression,
+    level: int | None,
+):
+    """Test Home Assistant size is stored in MB, streamed or staged."""
+    coresys.config.backup_compression = compression
+    coresys.config.backup_compression_level = level
+    content = tmp_path / "random.bin"
+    content.write_bytes(randbytes(2_097_152))
+
+    async def mock_backup(tar_file, exclude_database):
+        with tar_file as tar:
+            tar.add(content, arcname="random.bin")
+
+    backup = Backup(coresys, tmp_path / "my_backup.tar", "test", None)
+    backup.new("test", "2023-07-21T21:05:00.000000+00:00", BackupType.FULL)
+
+    with patch.object(type(coresys.homeassistant), "backup", new=mock_backup):
+        async with backup.create():
+            await backup.store_homeassistant()
+
+    assert 1.9 < backup.data["homeassistant"]["size"] < 2.1
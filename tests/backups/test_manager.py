@@ -5,6 +5,7 @@ import errno
 from functools import partial
 from pathlib import Path
 from shutil import copy, rmtree
+import tarfile
 from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, PropertyMock, patch
 
@@ -26,6 +27,7 @@ from supervisor.docker.const import ContainerState
 from supervisor.docker.homeassistant import DockerHomeAssistant
 from supervisor.docker.monitor import DockerContainerStateEvent
 from supervisor.exceptions import (
+    BackupChainError,
     BackupError,
     BackupFileNotFoundError,
     BackupInvalidError,
@@ -2316,3 +2318,91 @@ async def test_backup_app_skips_uninstalled(
         "Skipping backup of app local_example because it has been uninstalled"
         in caplog.text
     )
+
+
+@pytest.mark.usefixtures("tmp_supervisor_data")
+async def test_reload_uses_backup_index(coresys: CoreSys):
+    """Test reload only reads tar files which are new or changed."""
+    backup_file = Path(
+        copy(get_fixture_path("backup_example.tar"), coresys.config.path_backup)
+    )
+    coresys.backups.index.hits = coresys.backups.index.misses = 0
+
+    await coresys.backups.reload()
+    assert coresys.backups.get("7fed74c8")
+    assert coresys.backups.index.misses == 1
+    assert coresys.backups.index.hits == 0
+
+    with patch("supervisor.backups.backup.tarfile.open") as tarfile_open:
+        await coresys.backups.reload()
+        tarfile_open.assert_not_called()
+
+    assert (backup := coresys.backups.get("7fed74c8"))
+    assert backup.size_bytes == 10240
+    assert backup.supervisor_version == AwesomeVersion("2024.11.5.dev2102")
+    assert coresys.backups.index.hits == 1
+
+    # A changed file is read again
+    backup_file.touch()
+    await coresys.backups.reload()
+    assert coresys.backups.get("7fed74c8")
+    assert coresys.backups.index.misses == 2
+
+    # Entries of removed files are dropped
+    await coresys.backups.remove(coresys.backups.get("7fed74c8"))
+    await coresys.backups.reload()
+    assert not coresys.backups.index._data[coresys.config.path_backup.as_posix()]
+
+
+@pytest.mark.usefixtures("supervisor_internet", "tmp_supervisor_data", "path_extern")
+async def test_incremental_backup_chain(coresys: CoreSys):
+    """Test incremental backup stores changed files and restores them with its parent."""
+    share = coresys.config.path_share
+    (share / "keep.txt").write_text("keep")
+    (share / "change.txt").write_text("old")
+    (share / "remove.txt").write_text("remove")
+
+    await coresys.core.set_state(CoreState.RUNNING)
+    coresys.hardware.disk.get_disk_free_space = lambda x: 5000
+    parent: Backup = await coresys.backups.do_backup_partial(
+        "parent", folders=["share"]
+    )
+
+    (share / "change.txt").write_text("new content")
+    (share / "remove.txt").unlink()
+    (share / "dir").mkdir()
+    (share / "dir" / "add.txt").write_text("add")
+    child: Backup = await coresys.backups.do_backup_partial(
+        "child", folders=["share"], parent=parent.slug
+    )
+    assert child.parent == parent.slug
+
+    # Only files changed since the parent are stored in the child
+    with (
+        tarfile.open(child.tarfile, "r:") as backup,
+        tarfile.open(fileobj=backup.extractfile("./share.tar.gz"), mode="r:gz") as tar,
+    ):
+        assert {member.name for member in tar if member.isfile()} == {
+            "change.txt",
+            "dir/add.txt",
+        }
+
+    with pytest.raises(BackupChainError):
+        await coresys.backups.remove(parent)
+
+    rmtree(share)
+    share.mkdir()
+    assert await coresys.backups.do_restore_partial(child, folders=["share"])
+
+    assert {path.relative_to(share).as_posix() for path in share.rglob("*")} == {
+        "keep.txt",
+        "change.txt",
+        "dir",
+        "dir/add.txt",
+    }
+    assert (share / "keep.txt").read_text() == "keep"
+    assert (share / "change.txt").read_text() == "new content"
+
+    # Parent can be removed once no backup depends on it anymore
+    await coresys.backups.remove(child)
+    await coresys.backups.remove(parent)
@@ -197,9 +197,10 @@ def is_in_list(a: list, b: list):
 class MockResponse:
     """Mock response for aiohttp requests."""
 
-    def __init__(self, *, status=200, text=""):
+    def __init__(self, *, status=200, text="", headers=None):
         """Initialize mock response."""
         self.status = status
+        self.headers = headers or {}
         self._text = text
 
     def update_text(self, text: str):
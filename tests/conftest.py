@@ -59,6 +59,7 @@ from supervisor.host.logs import LogsControl
 from supervisor.os.manager import OSManager
 from supervisor.store.app import AppStore
 from supervisor.store.repository import Repository
+from supervisor.utils.dbus import DBus
 from supervisor.utils.dt import utcnow
 
 from .common import (
@@ -283,6 +284,7 @@ async def dbus_session_bus(dbus_session) -> AsyncGenerator[MessageBus, None, Non
     bus = await MessageBus(bus_type=BusType.SESSION, bus_address=dbus_session).connect()
     yield bus
     bus.disconnect()
+    DBus.clear_shared_introspection()
 
 
 @pytest.fixture
@@ -479,6 +481,38 @@ async def fixture_all_dbus_services(
     )
 
 
+@pytest.fixture(autouse=True)
+def _immediate_job_events():
+    """Send job events immediately, tests of coalescing patch the interval."""
+    with patch("supervisor.jobs.JOB_EVENT_INTERVAL", 0):
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _store_cache(tmp_path_factory: pytest.TempPathFactory):
+    """Write store cache to temporary folder and always read repositories on load."""
+    with (
+        patch(
+            "supervisor.store.data.FILE_HASSIO_STORE_CACHE",
+            tmp_path_factory.mktemp("store") / "store_cache.json",
+        ),
+        patch(
+            "supervisor.store.data.StoreData.load_cache",
+            new=AsyncMock(return_value=False),
+        ),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _no_log_tail():
+    """Query journal for each logs request, tests of the log tail enable it."""
+    with patch(
+        "supervisor.api.host.APIHost._tail_logs", new=AsyncMock(return_value=None)
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _mock_firewall():
     """Mock out firewall rules by default to avoid dbus signal timeouts."""
@@ -513,12 +547,14 @@ async def coresys(
     coresys_obj._ingress.save_data = AsyncMock()
     coresys_obj._auth.save_data = AsyncMock()
     coresys_obj._updater.save_data = AsyncMock()
+    coresys_obj._http_cache.save_data = AsyncMock()
     coresys_obj._config.save_data = AsyncMock()
     coresys_obj._jobs.save_data = AsyncMock()
     coresys_obj._resolution.save_data = AsyncMock()
     coresys_obj._apps.data.save_data = AsyncMock()
     coresys_obj._store.save_data = AsyncMock()
     coresys_obj._mounts.save_data = AsyncMock()
+    coresys_obj._backups.index.save_data = AsyncMock()
 
     # Mock test client
     coresys_obj._supervisor.instance._meta = {
@@ -543,6 +579,8 @@ async def coresys(
     coresys_obj._docker = docker
     coresys_obj.docker.coresys = coresys_obj
     docker.monitor.coresys = coresys_obj
+    docker._cgroup_stats.coresys = coresys_obj
+    docker.stats_sampler.coresys = coresys_obj
 
     # Set internet state
     coresys_obj.supervisor._connectivity = True
@@ -650,8 +688,8 @@ async def without_journal_gatewayd_boots() -> AsyncGenerator[MagicMock]:
 
 @pytest.fixture
 async def journal_logs_reader() -> MagicMock:
-    """Mock journal_logs_reader in host API."""
-    with patch("supervisor.api.host.journal_logs_reader") as reader:
+    """Mock journal_logs_batch_reader in host API."""
+    with patch("supervisor.api.host.journal_logs_batch_reader") as reader:
         yield reader
 
 
@@ -101,6 +101,54 @@ async def test_udisks2_manager_info(
     ]
 
 
+async def test_update_from_managed_objects(
+    udisks2_service: UDisks2Service,
+    udisks2_manager_service: UDisks2ManagerService,
+    dbus_session_bus: MessageBus,
+):
+    """Test objects in the object manager snapshot are loaded from it."""
+    sda = "/org/freedesktop/UDisks2/block_devices/sda"
+    udisks2_service.response_get_managed_objects = {
+        sda: {
+            "org.freedesktop.UDisks2.Block": {
+                "Drive": Variant(
+                    "o", "/org/freedesktop/UDisks2/drives/SSK_SSK_Storage_DF56419883D56"
+                ),
+                "IdLabel": Variant("s", "snapshot"),
+            },
+            "org.freedesktop.UDisks2.PartitionTable": {
+                "Partitions": Variant("ao", []),
+                "Type": Variant("s", "dos"),
+            },
+        }
+    }
+    udisks2 = UDisks2Manager()
+    await udisks2.connect(dbus_session_bus)
+
+    block = udisks2.get_block_device(sda)
+    assert block.id_label == "snapshot"
+    assert block.partition_table.type == PartitionTableType.DOS
+    assert block.drive in {drive.object_path for drive in udisks2.drives}
+
+    # Objects missing in the snapshot are read one by one
+    sda1 = udisks2.get_block_device("/org/freedesktop/UDisks2/block_devices/sda1")
+    assert sda1.filesystem is not None
+    assert sda1.drive == block.drive
+
+    # Existing objects are updated from the snapshot, including their type
+    udisks2_service.response_get_managed_objects = {
+        sda: {
+            "org.freedesktop.UDisks2.Block": {
+                "Drive": Variant("o", "/"),
+                "IdLabel": Variant("s", "updated"),
+            }
+        }
+    }
+    await udisks2.update()
+    assert block.id_label == "updated"
+    assert block.partition_table is None
+
+
 async def test_update_checks_devices_and_drives(dbus_session_bus: MessageBus):
     """Test update rechecks block devices and drives correctly."""
     mocked = await mock_dbus_services(
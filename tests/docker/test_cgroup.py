@@ -0,0 +1,123 @@
+"""Test reading container stats from cgroup."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from supervisor.coresys import CoreSys
+from supervisor.docker.cgroup import CgroupStats
+from supervisor.docker.stats import DockerStats
+
+CONTAINER_ID = "abc123"
+
+NET_DEV = """Inter-|   Receive                            |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:     100       1    0    0    0     0          0         0      100       1    0    0    0     0       0          0
+  eth0:    4000      20    0    0    0     0          0         0     2000      10    0    0    0     0       0          0
+"""
+
+
+@pytest.fixture(name="cgroup_path")
+def fixture_cgroup_path(tmp_path: Path) -> Path:
+    """Create cgroup and proc files of a container."""
+    cgroup = tmp_path / "cgroup" / f"system.slice/docker-{CONTAINER_ID}.scope"
+    cgroup.mkdir(parents=True)
+    (cgroup / "cpu.stat").write_text("usage_usec 1000\nuser_usec 600\n")
+    (cgroup / "memory.current").write_text("60000000\n")
+    (cgroup / "memory.max").write_text("max\n")
+    (cgroup / "memory.stat").write_text("anon 50000000\ninactive_file 300000\n")
+    (cgroup / "io.stat").write_text(
+        "8:0 rbytes=1000 wbytes=500 rios=1 wios=1\n8:16 rbytes=24 wbytes=12\n"
+    )
+
+    proc = tmp_path / "proc"
+    (proc / "42" / "net").mkdir(parents=True)
+    (proc / "42" / "net" / "dev").write_text(NET_DEV)
+    (proc / "42" / "cgroup").write_text(
+        f"0::/system.slice/docker-{CONTAINER_ID}.scope\n"
+    )
+    (proc / "meminfo").write_text("MemTotal:        4000000 kB\nMemFree: 1 kB\n")
+
+    with (
+        patch("supervisor.docker.cgroup.CGROUP_PATH", tmp_path / "cgroup"),
+        patch("supervisor.docker.cgroup.PROC_PATH", proc),
+        patch("supervisor.docker.cgroup.CPU_SAMPLE_WINDOW", 0),
+    ):
+        yield cgroup
+
+
+async def test_read_stats(coresys: CoreSys, cgroup_path: Path):
+    """Test reading stats of a container from cgroup."""
+    cgroup_stats = CgroupStats(coresys)
+    metadata = {
+        "Id": CONTAINER_ID,
+        "State": {"Pid": 42},
+        "HostConfig": {"NetworkMode": "bridge"},
+    }
+
+    assert await cgroup_stats.read("test") is None
+
+    stats = DockerStats(await cgroup_stats.read("test", metadata))
+    assert stats.memory_usage == 59700000
+    assert stats.memory_limit == 4096000000
+    assert stats.blk_read == 1024
+    assert stats.blk_write == 512
+    assert stats.network_rx == 4000
+    assert stats.network_tx == 2000
+    assert stats.cpu_percent == 0.0
+
+    # Container is known now, metadata is not needed anymore
+    (cgroup_path / "memory.max").write_text("200000000\n")
+    stats = DockerStats(await cgroup_stats.read("test"))
+    assert stats.memory_limit == 200000000
+
+    # cgroup is gone once container stopped
+    (cgroup_path / "cpu.stat").unlink()
+    assert await cgroup_stats.read("test") is None
+    assert await cgroup_stats.read("test") is None
+
+
+async def test_read_stats_unavailable(
+    coresys: CoreSys, cgroup_path: Path, tmp_path: Path
+):
+    """Test falling back to Docker if cgroup or network namespace is missing."""
+    cgroup_stats = CgroupStats(coresys)
+
+    assert (
+        await cgroup_stats.read(
+            "test", {"Id": "other", "State": {"Pid": 42}, "HostConfig": {}}
+        )
+        is None
+    )
+    assert (
+        await cgroup_stats.read(
+            "test", {"Id": CONTAINER_ID, "State": {"Pid": 7}, "HostConfig": {}}
+        )
+        is None
+    )
+
+    # Pid of another process, e.g. in a different PID namespace
+    (tmp_path / "proc" / "42" / "cgroup").write_text(
+        "0::/system.slice/docker-other.scope\n"
+    )
+    assert (
+        await cgroup_stats.read(
+            "test", {"Id": CONTAINER_ID, "State": {"Pid": 42}, "HostConfig": {}}
+        )
+        is None
+    )
+
+    # Containers in host network have no own network namespace
+    stats = DockerStats(
+        await cgroup_stats.read(
+            "test",
+            {
+                "Id": CONTAINER_ID,
+                "State": {"Pid": 7},
+                "HostConfig": {"NetworkMode": "host"},
+            },
+        )
+    )
+    assert stats.network_rx == 0
+    assert stats.network_tx == 0
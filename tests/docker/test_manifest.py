@@ -195,6 +195,28 @@ async def test_get_auth_token_uses_basic_auth_header(
     assert token_kwargs["headers"] == {"Authorization": "Basic dXNlcjp0b2tlbg=="}
 
 
+async def test_get_auth_token_reused(coresys: CoreSys, websession: MagicMock):
+    """Test tokens are reused until they expire."""
+    fetcher = RegistryManifestFetcher(coresys)
+
+    challenge = _MockTokenResponse(
+        status=401,
+        headers={"WWW-Authenticate": 'Bearer realm="https://ghcr.io/token"'},
+    )
+    token_response = _MockTokenResponse(
+        payload={"token": "secret-token", "expires_in": 300}
+    )
+    websession.get = MagicMock(side_effect=[challenge, token_response])
+
+    for _ in range(2):
+        token = await fetcher._get_auth_token(  # pylint: disable=protected-access
+            "ghcr.io", "org/image"
+        )
+        assert token == "secret-token"
+
+    assert websession.get.call_count == 2
+
+
 def test_get_api_endpoint_docker_hub(coresys: CoreSys, websession: MagicMock):
     """Test Docker Hub registry translates to API endpoint."""
     fetcher = RegistryManifestFetcher(coresys)
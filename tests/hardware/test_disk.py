@@ -2,6 +2,7 @@
 
 # pylint: disable=protected-access
 import errno
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -287,6 +288,44 @@ def test_get_dir_structure_sizes_zero_size_children(coresys, tmp_path):
     assert "children" not in result
 
 
+def test_get_dir_structure_sizes_cached(coresys, tmp_path):
+    """Test directory sizes are cached and only changed directories listed again."""
+    test_dir = tmp_path / "test_dir"
+    for name in ("subdir1", "subdir2"):
+        (test_dir / name / "nested").mkdir(parents=True)
+        (test_dir / name / "nested" / "file.txt").write_text("content")
+
+    result = coresys.hardware.disk.get_dir_structure_sizes(test_dir, max_depth=2)
+    assert result["used_bytes"] == 14
+
+    real_scandir = os.scandir
+    with patch(
+        "supervisor.hardware.disk.os.scandir", side_effect=real_scandir
+    ) as scandir:
+        # Unchanged tree is not listed again
+        assert (
+            coresys.hardware.disk.get_dir_structure_sizes(test_dir, max_depth=2)
+            == result
+        )
+        scandir.assert_not_called()
+
+        # Only the directory with a new file is listed
+        (test_dir / "subdir2" / "nested" / "new.txt").write_text("new")
+        result = coresys.hardware.disk.get_dir_structure_sizes(test_dir, max_depth=2)
+        assert result["used_bytes"] == 17
+        assert {child["id"]: child["used_bytes"] for child in result["children"]} == {
+            "subdir1": 7,
+            "subdir2": 10,
+        }
+        scandir.assert_called_once_with(test_dir / "subdir2" / "nested")
+
+        # Full walk once the cache is too old
+        scandir.reset_mock()
+        with patch("supervisor.hardware.disk.DIR_SIZES_MAX_AGE", 0):
+            coresys.hardware.disk.get_dir_structure_sizes(test_dir, max_depth=2)
+        assert scandir.call_count == 5
+
+
 def test_try_get_emmc_life_time(coresys, tmp_path):
     """Test eMMC life time helper."""
     fake_life_time = tmp_path / "fake-mmcblk0-lifetime"
@@ -300,6 +339,15 @@ def test_try_get_emmc_life_time(coresys, tmp_path):
     assert value == 10.0
 
 
+def failing_entry(name: str) -> MagicMock:
+    """Return a directory entry which fails with EBADMSG on stat."""
+    entry = MagicMock(spec=os.DirEntry)
+    entry.name = name
+    entry.is_symlink.return_value = False
+    entry.stat.side_effect = OSError(errno.EBADMSG, "Bad message")
+    return entry
+
+
 def test_get_dir_structure_sizes_ebadmsg_error(coresys, tmp_path):
     """Test directory structure size calculation with EBADMSG error."""
     # Create a test directory structure
@@ -314,29 +362,20 @@ def test_get_dir_structure_sizes_ebadmsg_error(coresys, tmp_path):
     subdir.mkdir()
     (subdir / "file2.txt").write_text("content2")
 
-    # Capture the real Path methods before they get patched below so the mocks
-    # can delegate to them without recursing into themselves.
-    real_is_dir = Path.is_dir
-    real_is_symlink = Path.is_symlink
-    real_stat = Path.stat
-
-    def mock_is_dir(self):
-        return real_is_dir(self)
-
-    def mock_is_symlink(self):
-        return real_is_symlink(self)
+    # Capture the real scandir before it gets patched below so the mock can
+    # delegate to it without recursing into itself.
+    real_scandir = os.scandir
 
-    def mock_stat_ebadmsg(self, follow_symlinks=True):
+    def mock_scandir_ebadmsg(path):
         # Raise EBADMSG for any child of test_dir to ensure consistent behavior
-        if self.parent == test_dir:
-            raise OSError(errno.EBADMSG, "Bad message")
-        return real_stat(self, follow_symlinks=follow_symlinks)
-
-    with (
-        patch.object(Path, "is_dir", mock_is_dir),
-        patch.object(Path, "is_symlink", mock_is_symlink),
-        patch.object(Path, "stat", mock_stat_ebadmsg),
-    ):
+        entries = list(real_scandir(path))
+        if Path(path) == test_dir:
+            entries = [failing_entry(entry.name) for entry in entries]
+        scandir = MagicMock()
+        scandir.__enter__.return_value = entries
+        return scandir
+
+    with patch("supervisor.hardware.disk.os.scandir", mock_scandir_ebadmsg):
         result = coresys.hardware.disk.get_dir_structure_sizes(test_dir)
 
     # The EBADMSG error should cause the loop to break on the first child
@@ -389,7 +428,9 @@ async def test_try_get_nvme_life_time_dbus_not_connected(coresys: CoreSys):
     assert lifetime is None
 
 
-async def test_dir_walker_oserror_reporting_can_be_gated(coresys: CoreSys):
+async def test_dir_walker_oserror_reporting_can_be_gated(
+    coresys: CoreSys, tmp_path: Path
+):
     """Test the walker only reports read errors to resolution when asked to.
 
     The resolution center's OSError checks are documented local-path-only, so a
@@ -398,23 +439,23 @@ async def test_dir_walker_oserror_reporting_can_be_gated(coresys: CoreSys):
     corrupted-message error means the rest of the walk is untrustworthy.
     """
 
-    def make_path() -> tuple[MagicMock, MagicMock]:
-        path = MagicMock(spec=Path)
-        path.exists.return_value = True
-        path.stat.return_value.st_dev = 1
-        failing = MagicMock(spec=Path)
-        failing.is_symlink.return_value = False
-        failing.stat.side_effect = OSError(errno.EBADMSG, "Bad message")
-        never_reached = MagicMock(spec=Path)
-        never_reached.is_symlink.return_value = False
-        path.iterdir.return_value = [failing, never_reached]
-        return path, never_reached
+    def mock_scandir() -> tuple[MagicMock, MagicMock]:
+        scandir = MagicMock()
+        never_reached = failing_entry("never_reached")
+        scandir.return_value.__enter__.return_value = [
+            failing_entry("failing"),
+            never_reached,
+        ]
+        return scandir, never_reached
 
     # Gated off (a mount walk): resolution never hears about it
-    path, never_reached = make_path()
-    with patch.object(coresys.resolution, "check_oserror") as check:
+    scandir, never_reached = mock_scandir()
+    with (
+        patch("supervisor.hardware.disk.os.scandir", scandir),
+        patch.object(coresys.resolution, "check_oserror") as check,
+    ):
         result = coresys.hardware.disk.get_dir_structure_sizes(
-            path, 2, check_oserror=False
+            tmp_path, 2, check_oserror=False
         )
     check.assert_not_called()
     assert result == {"used_bytes": 0}
@@ -422,7 +463,10 @@ async def test_dir_walker_oserror_reporting_can_be_gated(coresys: CoreSys):
     never_reached.stat.assert_not_called()
 
     # Default (the system disk): reported as before
-    path, _ = make_path()
-    with patch.object(coresys.resolution, "check_oserror") as check:
-        coresys.hardware.disk.get_dir_structure_sizes(path, 2)
+    scandir, _ = mock_scandir()
+    with (
+        patch("supervisor.hardware.disk.os.scandir", scandir),
+        patch.object(coresys.resolution, "check_oserror") as check,
+    ):
+        coresys.hardware.disk.get_dir_structure_sizes(tmp_path, 2)
     check.assert_called_once()
@@ -0,0 +1,153 @@
+"""Test shared tail of journal logs."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from aiohttp.test_utils import TestClient
+import pytest
+
+from supervisor.api.host import APIHost
+from supervisor.coresys import CoreSys
+from supervisor.host.log_tail import TAIL_SIZE
+from supervisor.host.logs import LogsControl
+
+# Tests query the journal for each logs request, keep the real method here
+TAIL_LOGS = APIHost._tail_logs  # pylint: disable=protected-access
+
+FILL = (
+    b"__CURSOR=c1\nMESSAGE=one\nCONTAINER_LOG_EPOCH=e1\n\n"
+    b"__CURSOR=c2\nMESSAGE=two\nCONTAINER_LOG_EPOCH=e2\n\n"
+    b"__CURSOR=c3\nMESSAGE=three\nCONTAINER_LOG_EPOCH=e2\n\n"
+)
+
+
+@pytest.fixture(name="journal_streams")
+async def fixture_journal_streams(
+    coresys: CoreSys,
+) -> AsyncGenerator[list[tuple[dict[str, Any], asyncio.StreamReader]]]:
+    """Return a stream for each journal query, the first one returns FILL."""
+    streams: list[tuple[dict[str, Any], asyncio.StreamReader]] = []
+
+    @asynccontextmanager
+    async def journald_logs(_, **kwargs) -> AsyncGenerator[MagicMock]:
+        stream = asyncio.StreamReader()
+        if not streams:
+            stream.feed_data(FILL)
+        if "follow" not in kwargs["params"]:
+            stream.feed_eof()
+        streams.append((kwargs, stream))
+        resp = MagicMock(content=stream)
+        resp.__aenter__.return_value = resp
+        yield resp
+
+    with (
+        patch.object(LogsControl, "journald_logs", new=journald_logs),
+        patch.object(APIHost, "_tail_logs", new=TAIL_LOGS),
+    ):
+        yield streams
+
+        for tail in coresys.host.logs._tails.values():  # pylint: disable=protected-access
+            tail.stop()
+        await asyncio.sleep(0)
+
+
+async def test_tail_follow(
+    coresys: CoreSys,
+    journal_streams: list[tuple[dict[str, Any], asyncio.StreamReader]],
+):
+    """Test tail reads last entries once and follows the journal."""
+    async with coresys.host.logs.tail("test") as tail:
+        assert tail.complete is True
+        assert [entry["MESSAGE"] for entry in tail.entries(0)] == [
+            "one",
+            "two",
+            "three",
+        ]
+        assert tail.find("c2") == 1
+
+        await asyncio.sleep(0)
+        assert len(journal_streams) == 2
+        assert journal_streams[0][0]["range_header"] == "entries=:-999:1000"
+        assert journal_streams[1][0]["params"] == {
+            "SYSLOG_IDENTIFIER": ["test"],
+            "follow": "",
+        }
+        assert journal_streams[1][0]["range_header"] == "entries=c3:1:"
+
+        # Other clients share the tail
+        async with coresys.host.logs.tail(["test"]) as other:
+            assert other is tail
+
+        journal_streams[1][1].feed_data(b"__CURSOR=c4\nMESSAGE=four\n\n")
+        assert await tail.wait(3) is True
+        assert tail.entries(3) == [{"__CURSOR": "c4", "MESSAGE": "four"}]
+
+    # Tail stops once idle and is replaced on next use
+    tail.stop()
+    await asyncio.sleep(0)
+    assert tail.stopped is True
+    assert await tail.wait(4) is False
+
+    journal_streams.clear()
+    async with coresys.host.logs.tail("test") as new_tail:
+        assert new_tail is not tail
+    new_tail.stop()
+
+
+async def test_api_logs_from_tail(
+    api_client: TestClient,
+    journal_streams: list[tuple[dict[str, Any], asyncio.StreamReader]],
+):
+    """Test app and Core logs are served from the tail."""
+    resp = await api_client.get("/core/logs?lines=2")
+    assert resp.status == 200
+    assert resp.headers["X-First-Cursor"] == "c2"
+    assert await resp.text() == "two\nthree\n"
+
+    # Resume after a cursor without querying the journal again
+    resp = await api_client.get("/core/logs", headers={"Range": "entries=c1:1:5"})
+    assert resp.headers["X-First-Cursor"] == "c2"
+    assert await resp.text() == "two\nthree\n"
+
+    resp = await api_client.get("/core/logs/latest")
+    assert await resp.text() == "two\nthree\n"
+
+    resp = await api_client.get("/core/logs?grep=ONE")
+    assert await resp.text() == "one\n"
+
+    assert len(journal_streams) == 2
+
+    # Unknown cursor is passed on to the journal
+    await api_client.get("/core/logs", headers={"Range": "entries=c0:1:5"})
+    assert len(journal_streams) == 3
+    assert journal_streams[2][0]["range_header"] == "entries=c0:1:5"
+
+
+async def test_api_logs_from_journal_head(
+    api_client: TestClient,
+    coresys: CoreSys,
+    journal_streams: list[tuple[dict[str, Any], asyncio.StreamReader]],
+):
+    """Test skips from the journal head are only served from a complete tail."""
+    resp = await api_client.get("/core/logs", headers={"Range": "entries=:1:2"})
+    assert await resp.text() == "two\nthree\n"
+    assert len(journal_streams) == 2
+
+    # Follow more entries than the tail keeps
+    (tail,) = coresys.host.logs._tails.values()  # pylint: disable=protected-access
+    journal_streams[1][1].feed_data(
+        b"".join(
+            f"__CURSOR=n{index}\nMESSAGE=new {index}\n\n".encode()
+            for index in range(TAIL_SIZE)
+        )
+    )
+    assert await tail.wait(TAIL_SIZE + 2) is True
+    assert tail.start == 3
+    assert tail.complete is False
+
+    await api_client.get("/core/logs", headers={"Range": "entries=:1:2"})
+    assert len(journal_streams) == 3
+    assert journal_streams[2][0]["range_header"] == "entries=:1:2"
@@ -11,7 +11,7 @@ from supervisor.coresys import CoreSys
 from supervisor.exceptions import HostNotSupportedError, HostServiceError
 from supervisor.host.const import LogFormatter
 from supervisor.host.logs import LogsControl
-from supervisor.utils.systemd_journal import journal_logs_reader
+from supervisor.utils.systemd_journal import journal_logs_batch_reader
 
 from tests.common import load_fixture
 
@@ -51,8 +51,8 @@ async def test_logs(journald_gateway: MagicMock, coresys: CoreSys):
     journald_gateway.content.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        cursor, line = await anext(
-            journal_logs_reader(resp, log_formatter=LogFormatter.VERBOSE)
+        (cursor, line), *_ = await anext(
+            journal_logs_batch_reader(resp, log_formatter=LogFormatter.VERBOSE)
         )
         assert (
             cursor
@@ -79,7 +79,7 @@ async def test_logs_coloured(journald_gateway: MagicMock, coresys: CoreSys):
     journald_gateway.content.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        cursor, line = await anext(journal_logs_reader(resp))
+        (cursor, line), *_ = await anext(journal_logs_batch_reader(resp))
         assert (
             cursor
             == "s=83fee99ca0c3466db5fc120d52ca7dd8;i=2049389;b=f5a5c442fa6548cf97474d2d57c920b3;m=4263828e8c;t=612dda478b01b;x=9ae12394c9326930"
@@ -98,7 +98,9 @@ async def test_logs_no_colors(journald_gateway: MagicMock, coresys: CoreSys):
     journald_gateway.content.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        cursor, line = await anext(journal_logs_reader(resp, no_colors=True))
+        (cursor, line), *_ = await anext(
+            journal_logs_batch_reader(resp, no_colors=True)
+        )
         assert (
             cursor
             == "s=83fee99ca0c3466db5fc120d52ca7dd8;i=2049389;b=f5a5c442fa6548cf97474d2d57c920b3;m=4263828e8c;t=612dda478b01b;x=9ae12394c9326930"
@@ -117,8 +119,8 @@ async def test_logs_verbose_no_colors(journald_gateway: MagicMock, coresys: Core
     journald_gateway.content.feed_eof()
 
     async with coresys.host.logs.journald_logs() as resp:
-        cursor, line = await anext(
-            journal_logs_reader(
+        (cursor, line), *_ = await anext(
+            journal_logs_batch_reader(
                 resp, log_formatter=LogFormatter.VERBOSE, no_colors=True
             )
         )
@@ -836,6 +836,46 @@ async def test_job_skip_cleanup(coresys: CoreSys):
     assert test.job.done
 
 
+async def test_job_history_size(coresys: CoreSys):
+    """Test only the newest finished root jobs are kept."""
+
+    class TestClass:
+        """Test class."""
+
+        def __init__(self, coresys: CoreSys):
+            """Initialize the test class."""
+            self.coresys = coresys
+
+        @Job(name="test_job_history_size_child", cleanup=False)
+        async def child(self) -> SupervisorJob:
+            """Execute the child job."""
+            return coresys.jobs.current
+
+        @Job(name="test_job_history_size_execute", cleanup=False)
+        async def execute(self) -> tuple[SupervisorJob, SupervisorJob]:
+            """Execute the class method."""
+            return coresys.jobs.current, await self.child()
+
+    test = TestClass(coresys)
+    coresys.jobs.history_size = 2
+
+    first, first_child = await test.execute()
+    second, second_child = await test.execute()
+    assert coresys.jobs.jobs == [first, first_child, second, second_child]
+
+    third, third_child = await test.execute()
+    assert coresys.jobs.jobs == [second, second_child, third, third_child]
+    assert coresys.jobs.children(None) == [second, third]
+    assert coresys.jobs.children(third.uuid) == [third_child]
+
+    coresys.jobs.history_size = 1
+    assert coresys.jobs.jobs == [third, third_child]
+
+    coresys.jobs.remove_job(third)
+    assert coresys.jobs.jobs == []
+    assert coresys.jobs.children(None) == []
+
+
 async def test_group_throttle(coresys: CoreSys):
     """Test the group throttle."""
 
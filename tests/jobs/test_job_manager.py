@@ -1,7 +1,7 @@
 """Test the condition decorators."""
 
 import asyncio
-from unittest.mock import ANY, AsyncMock
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -241,3 +241,50 @@ async def test_notify_on_change(coresys: CoreSys, ha_ws_client: AsyncMock):
         }
     )
     # pylint: enable=protected-access
+
+
+@patch("supervisor.jobs.JOB_EVENT_INTERVAL", 0.01)
+async def test_coalesce_progress_events(coresys: CoreSys, ha_ws_client: AsyncMock):
+    """Test progress changes are coalesced and state changes sent immediately."""
+
+    def job_events() -> list[dict]:
+        return [
+            call.args[0]["data"]["data"]
+            for call in ha_ws_client.async_send_command.call_args_list
+            if call.args[0]["data"]["event"] == "job"
+            and call.args[0]["data"]["data"]["name"] == TEST_JOB
+        ]
+
+    stats = coresys.jobs.event_stats
+    job = coresys.jobs.new_job(TEST_JOB)
+    with job.start():
+        for progress in range(1, 50):
+            job.progress = progress
+        await asyncio.sleep(0)
+        assert [(event["progress"], event["done"]) for event in job_events()] == [
+            (0, False)
+        ]
+
+        await asyncio.sleep(0.02)
+        assert [(event["progress"], event["done"]) for event in job_events()] == [
+            (0, False),
+            (49, False),
+        ]
+
+        # Pending progress is dropped when a state change is sent
+        job.progress = 60
+        job.stage = "test"
+
+    await asyncio.sleep(0.02)
+    assert [
+        (event["progress"], event["stage"], event["done"]) for event in job_events()
+    ] == [
+        (0, None, False),
+        (49, None, False),
+        (60, "test", False),
+        (100, "test", True),
+    ]
+    assert coresys.jobs.event_stats == {
+        "sent": stats["sent"] + 4,
+        "suppressed": stats["suppressed"] + 49,
+    }
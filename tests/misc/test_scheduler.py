@@ -1,6 +1,7 @@
 """Test Supervisor scheduler backend."""
 
 import asyncio
+from unittest.mock import patch
 
 from supervisor.const import CoreState
 
@@ -75,3 +76,84 @@ async def test_simple_task_repeat_block(coresys):
 
     assert len(trigger) == 1
     await coresys.scheduler.shutdown()
+
+
+async def test_task_overrun_skipped(coresys):
+    """Runs are skipped and counted while the previous run is still active."""
+    await coresys.core.set_state(CoreState.RUNNING)
+    trigger = []
+
+    async def test_task():
+        """Test task for schedule."""
+        trigger.append(True)
+        await asyncio.sleep(0.35)
+
+    coresys.scheduler.register_task(test_task, 0.1, True)
+    await asyncio.sleep(0.3)
+
+    assert len(trigger) == 1
+    (stats,) = coresys.scheduler.task_stats
+    assert stats["running"] is True
+    assert stats["runs"] == 1
+    assert stats["overruns"] >= 1
+    assert stats["next_run"] is not None
+
+    await asyncio.sleep(0.25)
+    (stats,) = coresys.scheduler.task_stats
+    assert stats["last_duration"] >= 0.35
+    await coresys.scheduler.shutdown()
+
+
+async def test_tasks_coalesced(coresys):
+    """Tasks due close together run on the same timer wakeup, never early."""
+    await coresys.core.set_state(CoreState.RUNNING)
+    trigger = []
+
+    async def first_task():
+        """Test task for schedule."""
+        trigger.append("first")
+
+    async def second_task():
+        """Test task for schedule."""
+        trigger.append("second")
+
+    async def third_task():
+        """Test task for schedule."""
+        trigger.append("third")
+
+    # Always add the largest jitter, half of the interval
+    with (
+        patch("supervisor.misc.scheduler.JITTER_FACTOR", 0.5),
+        patch("supervisor.misc.scheduler.random.uniform", new=lambda _, high: high),
+    ):
+        coresys.scheduler.register_task(first_task, 0.1, False)
+        coresys.scheduler.register_task(second_task, 0.12, False)
+        coresys.scheduler.register_task(third_task, 0.6, False)
+
+    # Second task only waits for its jitter and runs with the first one
+    await asyncio.sleep(0.165)
+    assert trigger == ["first", "second"]
+
+    await asyncio.sleep(0.8)
+    assert trigger == ["first", "second", "third"]
+    assert coresys.scheduler.task_stats == []
+
+
+async def test_skipped_run_keeps_duration(coresys):
+    """Runs skipped while core is not running don't change the last duration."""
+    await coresys.core.set_state(CoreState.RUNNING)
+
+    async def test_task():
+        """Test task for schedule."""
+        await asyncio.sleep(0.1)
+
+    coresys.scheduler.register_task(test_task, 0.05, True)
+    await asyncio.sleep(0.2)
+    (stats,) = coresys.scheduler.task_stats
+    assert stats["last_duration"] >= 0.1
+
+    await coresys.core.set_state(CoreState.FREEZE)
+    await asyncio.sleep(0.2)
+    (stats,) = coresys.scheduler.task_stats
+    assert stats["last_duration"] >= 0.1
+    await coresys.scheduler.shutdown()
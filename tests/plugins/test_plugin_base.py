@@ -223,7 +223,9 @@ async def test_plugin_load_running_container(
     ):
         await plugin.load()
         register_event.assert_any_call(
-            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, plugin.watchdog_container
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            plugin.watchdog_container,
+            key=plugin.instance.name,
         )
         attach.assert_called_once_with(
             version=test_version, skip_state_event_if_down=True
@@ -256,7 +258,9 @@ async def test_plugin_load_stopped_container(
     ):
         await plugin.load()
         register_event.assert_any_call(
-            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, plugin.watchdog_container
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            plugin.watchdog_container,
+            key=plugin.instance.name,
         )
         attach.assert_called_once_with(
             version=test_version, skip_state_event_if_down=True
@@ -291,7 +295,9 @@ async def test_plugin_load_missing_container(
     ):
         await plugin.load()
         register_event.assert_any_call(
-            BusEvent.DOCKER_CONTAINER_STATE_CHANGE, plugin.watchdog_container
+            BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+            plugin.watchdog_container,
+            key=plugin.instance.name,
         )
         attach.assert_called_once_with(
             version=test_version, skip_state_event_if_down=True
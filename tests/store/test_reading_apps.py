@@ -4,6 +4,7 @@ import errno
 import json
 import logging
 from pathlib import Path
+import shutil
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, PropertyMock, patch
 
@@ -13,6 +14,7 @@ from supervisor.const import REPOSITORY_LOCAL, UpdateChannel
 from supervisor.coresys import CoreSys
 from supervisor.resolution.const import ContextType, IssueType, SuggestionType
 from supervisor.resolution.data import Issue, Suggestion
+from supervisor.utils.common import read_json_or_yaml_file
 
 from tests.common import load_json_fixture
 
@@ -131,3 +133,47 @@ async def test_deprecation_advisory_log_level(
         any(record.levelno >= logging.WARNING for record in advisories)
         is expect_warning
     )
+
+
+async def test_incremental_update(coresys: CoreSys, tmp_path: Path):
+    """Test update only reads changed repositories and files."""
+    shutil.copytree(
+        Path(__file__).parent.parent / "fixtures/apps/core", tmp_path / "core"
+    )
+    config = tmp_path / "core/samba/config.yaml"
+    (tmp_path / "core/samba/translations").mkdir()
+    translation = tmp_path / "core/samba/translations/en.yaml"
+    translation.write_text("configuration:\n  workgroup:\n    name: Workgroup\n")
+
+    with (
+        patch.object(
+            type(coresys.config),
+            "path_apps_core",
+            PropertyMock(return_value=tmp_path / "core"),
+        ),
+        patch(
+            "supervisor.store.data.read_json_or_yaml_file",
+            wraps=read_json_or_yaml_file,
+        ) as read,
+    ):
+        await coresys.store.data.update()
+        apps = coresys.store.data.apps
+        assert "core_samba" in apps
+        assert read.call_count > 2
+
+        # Unchanged repositories and files are not read again
+        read.reset_mock()
+        await coresys.store.data.update({"core", "local"})
+        assert read.call_count == 0
+        assert coresys.store.data.apps == apps
+
+        # Only changed files are validated again
+        config.write_text(config.read_text().replace("Samba share", "Samba server"))
+        await coresys.store.data.update({"core"})
+        read.assert_called_once_with(config)
+        assert coresys.store.data.apps["core_samba"]["name"] == "Samba server"
+        assert (
+            coresys.store.data.apps["core_samba"]["translations"]
+            == apps["core_samba"]["translations"]
+        )
+        assert coresys.store.data.apps["local_ssh"] is apps["local_ssh"]
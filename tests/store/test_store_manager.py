@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, PropertyMock, patch
@@ -12,17 +13,22 @@ import pytest
 from supervisor.apps.app import App
 from supervisor.arch import CpuArchManager
 from supervisor.backups.manager import BackupManager
+from supervisor.const import ATTR_STARTUP, ATTR_VERSION, AppStartup
 from supervisor.coresys import CoreSys
 from supervisor.exceptions import AppNotSupportedError, StoreJobError
 from supervisor.homeassistant.const import WSEvent
 from supervisor.homeassistant.module import HomeAssistant
 from supervisor.store import StoreManager
 from supervisor.store.app import AppStore
+from supervisor.store.data import APP_CACHE_TYPES, StoreData
 from supervisor.store.git import GitRepo
 from supervisor.store.repository import Repository, RepositoryGit
 
 from tests.common import load_yaml_fixture
 
+# Tests read repositories on load, keep the real method for the cache tests
+LOAD_CACHE = StoreData.load_cache
+
 
 async def test_default_load(coresys: CoreSys):
     """Test default load from config."""
@@ -299,3 +305,55 @@ async def test_app_version_timestamp(coresys: CoreSys, install_app_example: App)
     ):
         await coresys.store.reload()
     assert timestamp < install_app_example.latest_version_timestamp
+
+
+async def test_load_from_cache(coresys: CoreSys, tmp_path: Path):
+    """Test store catalogue is loaded from cache and verified in background."""
+    cache_file = tmp_path / "store_cache.json"
+    with patch("supervisor.store.data.FILE_HASSIO_STORE_CACHE", cache_file):
+        await coresys.store.data.update()
+        assert cache_file.exists()
+
+        store_manager = await StoreManager(coresys).load_config()
+        with (
+            patch.object(StoreData, "load_cache", new=LOAD_CACHE),
+            patch.object(StoreData, "update") as update,
+            patch("supervisor.store.repository.RepositoryGit.load", return_value=None),
+            patch("supervisor.store.repository.RepositoryLocal.load"),
+            patch.object(AppStore, "refresh_path_cache"),
+        ):
+            await store_manager.load()
+            assert set(store_manager.data.apps) == set(coresys.store.data.apps)
+            assert store_manager.data.repositories == coresys.store.data.repositories
+            for slug, app in store_manager.data.apps.items():
+                assert isinstance(app[ATTR_VERSION], AwesomeVersion)
+                assert isinstance(app[ATTR_STARTUP], AppStartup)
+                for key in APP_CACHE_TYPES:
+                    assert app.get(key) == coresys.store.data.apps[slug].get(key)
+            update.assert_not_called()
+
+            await asyncio.sleep(0)
+            update.assert_called_once_with()
+
+            # Verification waits for other store updates and is cancelled on unload
+            update.reset_mock()
+            await store_manager.load()
+            async with store_manager._data_lock:  # pylint: disable=protected-access
+                await asyncio.sleep(0)
+                update.assert_not_called()
+                await store_manager.unload()
+            await asyncio.sleep(0)
+            update.assert_not_called()
+
+        # Cache of another Supervisor version or with changed content is ignored
+        store_data = StoreData(coresys)
+        with (
+            patch.object(StoreData, "load_cache", new=LOAD_CACHE),
+            patch("supervisor.store.data.SUPERVISOR_VERSION", "2000.1.0"),
+        ):
+            assert await store_data.load_cache() is False
+
+        cache_file.write_bytes(cache_file.read_bytes().replace(b"samba", b"sambo"))
+        with patch.object(StoreData, "load_cache", new=LOAD_CACHE):
+            assert await store_data.load_cache() is False
+        assert store_data.apps == {}
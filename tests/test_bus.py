@@ -1,7 +1,15 @@
 """Test bus backend."""
 
+import asyncio
+from unittest.mock import ANY
+
+import pytest
+
+from supervisor.bus import MAX_PENDING_TASKS
 from supervisor.const import BusEvent
 from supervisor.coresys import CoreSys
+from supervisor.docker.const import ContainerState
+from supervisor.docker.monitor import DockerContainerStateEvent
 
 from tests.common import fire_bus_event
 
@@ -58,3 +66,97 @@ async def test_bus_event_removed(coresys: CoreSys) -> None:
     # No listeners remain, so no tasks are returned to gather.
     await fire_bus_event(coresys, BusEvent.HARDWARE_NEW_DEVICE, None)
     assert results[-1] == "test"
+
+
+async def test_bus_event_keyed(coresys: CoreSys) -> None:
+    """Test keyed listeners only get events of their key."""
+    results = []
+
+    async def callback(data) -> None:
+        """Test callback."""
+        results.append(data)
+
+    listener = coresys.bus.register_event(
+        BusEvent.DOCKER_CONTAINER_STATE_CHANGE, callback, key="test"
+    )
+
+    await fire_bus_event(
+        coresys,
+        BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+        event := DockerContainerStateEvent("test", ContainerState.RUNNING, "abc", 1),
+    )
+    await fire_bus_event(
+        coresys,
+        BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
+        DockerContainerStateEvent("other", ContainerState.RUNNING, "def", 1),
+    )
+    assert results == [event]
+
+    coresys.bus.remove_listener(listener)
+    assert not coresys.bus.fire_event(BusEvent.DOCKER_CONTAINER_STATE_CHANGE, event)
+
+    with pytest.raises(ValueError, match="has no key"):
+        coresys.bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, callback, key="test")
+
+
+async def test_bus_callback(coresys: CoreSys, caplog: pytest.LogCaptureFixture) -> None:
+    """Test sync callbacks are called while firing the event."""
+    results = []
+
+    def callback(data) -> None:
+        """Test callback."""
+        if data is None:
+            raise ValueError("no data")
+        results.append(data)
+
+    coresys.bus.register_callback(BusEvent.HARDWARE_NEW_DEVICE, callback)
+
+    assert coresys.bus.fire_event(BusEvent.HARDWARE_NEW_DEVICE, "test") == []
+    assert results == ["test"]
+
+    coresys.bus.fire_event(BusEvent.HARDWARE_NEW_DEVICE, None)
+    assert "Error in listener for event 'hardware_new_device'" in caplog.text
+
+    stats = coresys.bus.stats[BusEvent.HARDWARE_NEW_DEVICE]
+    assert stats.fired == 2
+    assert stats.calls == 2
+
+
+async def test_bus_event_bounded(coresys: CoreSys) -> None:
+    """Test bounded events are dropped for listeners with too many tasks."""
+    done = asyncio.Event()
+    results = []
+
+    async def callback(data) -> None:
+        """Test callback."""
+        await done.wait()
+        results.append(data)
+
+    coresys.bus.register_event(BusEvent.HARDWARE_NEW_DEVICE, callback)
+
+    tasks = []
+    for index in range(MAX_PENDING_TASKS + 5):
+        tasks += coresys.bus.fire_event(
+            BusEvent.HARDWARE_NEW_DEVICE, index, bounded=True
+        )
+    assert len(tasks) == MAX_PENDING_TASKS
+
+    # Unbounded events are never dropped
+    tasks += coresys.bus.fire_event(BusEvent.HARDWARE_NEW_DEVICE, "unbounded")
+
+    done.set()
+    await asyncio.gather(*tasks)
+    assert len(results) == MAX_PENDING_TASKS + 1
+    assert coresys.bus.stats[BusEvent.HARDWARE_NEW_DEVICE].as_dict() == {
+        "fired": MAX_PENDING_TASKS + 6,
+        "calls": MAX_PENDING_TASKS + 1,
+        "dropped": 5,
+        "latency_total": ANY,
+        "latency_max": ANY,
+    }
+
+    # Once tasks finished, bounded events are delivered again
+    await asyncio.gather(
+        *coresys.bus.fire_event(BusEvent.HARDWARE_NEW_DEVICE, "again", bounded=True)
+    )
+    assert results[-1] == "again"
@@ -0,0 +1,79 @@
+"""Test HTTP cache."""
+
+from unittest.mock import MagicMock, patch
+
+from supervisor.coresys import CoreSys
+
+from tests.common import MockResponse
+
+URL_TEST = "https://version.home-assistant.io/stable.json"
+
+
+async def test_revalidate(coresys: CoreSys, websession: MagicMock):
+    """Test stored responses are revalidated with their validators."""
+    websession.get = MagicMock(
+        return_value=MockResponse(
+            text='{"test": 1}',
+            headers={"ETag": '"abc"', "Last-Modified": "Mon, 1 Jan 2024 00:00:00 GMT"},
+        )
+    )
+    response = await coresys.http_cache.get(URL_TEST)
+    assert response.content == b'{"test": 1}'
+    assert response.cached is False
+
+    websession.get = MagicMock(return_value=MockResponse(status=304))
+    response = await coresys.http_cache.get(URL_TEST)
+    assert response.status == 200
+    assert response.content == b'{"test": 1}'
+    assert response.cached is True
+    assert websession.get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 1 Jan 2024 00:00:00 GMT",
+    }
+
+    # Responses without validators are not stored
+    websession.get = MagicMock(return_value=MockResponse(text="other"))
+    await coresys.http_cache.get("https://example.com/other")
+    await coresys.http_cache.get("https://example.com/other")
+    assert websession.get.call_args.kwargs["headers"] == {}
+
+    assert coresys.http_cache.stats.as_dict() == {
+        "hits": 0,
+        "revalidations": 1,
+        "misses": 3,
+        "token_hits": 0,
+        "token_misses": 0,
+    }
+
+
+async def test_immutable(coresys: CoreSys, websession: MagicMock):
+    """Test immutable responses are served without a request."""
+    url = "https://ghcr.io/v2/home-assistant/test/manifests/sha256:abc"
+    websession.get = MagicMock(return_value=MockResponse(text='{"layers": []}'))
+
+    await coresys.http_cache.get(url, immutable=True)
+    response = await coresys.http_cache.get(url, immutable=True)
+    assert response.content == b'{"layers": []}'
+    assert response.cached is True
+    websession.get.assert_called_once()
+    assert coresys.http_cache.stats.hits == 1
+
+
+async def test_token_expiry(coresys: CoreSys):
+    """Test bearer tokens are reused until shortly before they expire."""
+    with patch.object(coresys.loop, "time", return_value=100):
+        assert coresys.http_cache.get_token("ghcr.io/test") is None
+        coresys.http_cache.set_token("ghcr.io/test", "token", 300)
+        assert coresys.http_cache.get_token("ghcr.io/test") == "token"
+
+    with patch.object(coresys.loop, "time", return_value=395):
+        assert coresys.http_cache.get_token("ghcr.io/test") is None
+
+    # Token lookups are counted apart from responses
+    assert coresys.http_cache.stats.as_dict() == {
+        "hits": 0,
+        "revalidations": 0,
+        "misses": 0,
+        "token_hits": 1,
+        "token_misses": 2,
+    }
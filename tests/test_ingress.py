@@ -1,14 +1,18 @@
 """Test ingress."""
 
-from datetime import timedelta
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import ANY, patch
 
 from supervisor.const import HomeAssistantUser, IngressSessionData
 from supervisor.coresys import CoreSys
-from supervisor.ingress import Ingress
-from supervisor.utils.dt import utc_from_timestamp
+from supervisor.ingress import (
+    SESSION_SAVE_DELAY,
+    SESSION_TIMEOUT,
+    Ingress,
+    IngressSessionStore,
+)
 from supervisor.utils.json import read_json_file
 
 
@@ -21,11 +25,17 @@ def test_session_handling(coresys: CoreSys):
     assert validate
 
     assert coresys.ingress.validate_session(session)
-    assert coresys.ingress.sessions[session] != validate
 
-    not_valid = utc_from_timestamp(validate) - timedelta(minutes=20)
-    coresys.ingress.sessions[session] = not_valid.timestamp()
-    assert not coresys.ingress.validate_session(session)
+    # Using the session renews it, so it outlives its initial lifetime
+    now = coresys.loop.time()
+    with patch.object(coresys.loop, "time", return_value=now + 14 * 60):
+        assert coresys.ingress.validate_session(session)
+    with patch.object(coresys.loop, "time", return_value=now + 20 * 60):
+        assert coresys.ingress.validate_session(session)
+    with patch.object(coresys.loop, "time", return_value=now + 40 * 60):
+        assert not coresys.ingress.validate_session(session)
+        assert session not in coresys.ingress.sessions
+
     assert not coresys.ingress.validate_session("invalid session")
 
     session_data = coresys.ingress.get_session_data(session)
@@ -44,6 +54,43 @@ def test_session_handling_with_session_data(coresys: CoreSys):
     assert session_data.user.id == "some-id"
 
 
+def test_session_store_expiry():
+    """Test session store expires sessions and debounces renewals."""
+    store = IngressSessionStore()
+    store.add("a", SESSION_TIMEOUT)
+    store.add("b", 200.0, {"user": {"id": "some-id"}})
+    store.changed = False
+
+    # Renewal is debounced while most of the lifetime is left
+    assert store.validate("a", 10.0)
+    assert not store.changed
+    assert store.validate("a", 90.0)
+    assert store.changed
+    assert store.dump(90.0, 1000.0)["a"] == 1000.0 + SESSION_TIMEOUT
+
+    assert store.expire(150.0) == 0
+    assert store.expire(250.0) == 1
+    assert "a" in store
+    assert "b" not in store
+    assert "b" not in store.data
+    assert not store.validate("a", 90.0 + SESSION_TIMEOUT)
+
+
+async def test_save_batched(coresys: CoreSys):
+    """Test changed sessions are saved once after a delay."""
+    with patch.object(coresys, "call_later") as call_later:
+        coresys.ingress.create_session()
+        coresys.ingress.create_session()
+
+    call_later.assert_called_once()
+    assert call_later.call_args.args[0] == SESSION_SAVE_DELAY
+    assert not coresys.ingress.save_data.called
+
+    call_later.call_args.args[1]()
+    await asyncio.sleep(0)
+    coresys.ingress.save_data.assert_called_once()
+
+
 async def test_save_on_unload(coresys: CoreSys):
     """Test called save on unload."""
     coresys.ingress.create_session()
@@ -103,6 +103,7 @@ async def test_delayed_fetch_for_connectivity(
     coresys.websession.get.return_value.__aenter__.return_value.read.return_value = (
         load_binary_fixture("version_stable.json")
     )
+    coresys.websession.get.return_value.__aenter__.return_value.headers = {}
     coresys.websession.head = AsyncMock()
 
     # Network connectivity change causes a series of async tasks to eventually do a version fetch
@@ -1,11 +1,19 @@
 """Test common."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
+import voluptuous as vol
 
 from supervisor.exceptions import ConfigurationFileError
-from supervisor.utils.common import find_one_filetype
+from supervisor.utils.common import (
+    FileConfiguration,
+    config_write_stats,
+    find_one_filetype,
+    flush_config_files,
+)
+from supervisor.utils.json import read_json_file
 
 
 def test_not_found(tmp_path):
@@ -20,3 +28,51 @@ def test_with_found(tmp_path):
     test_file.write_text("found")
 
     assert find_one_filetype(tmp_path, "test", [".json"]) == test_file
+
+
+class _TestConfig(FileConfiguration):
+    """Configuration for testing writes."""
+
+    def __init__(self, file_path: Path):
+        """Initialize test config."""
+        super().__init__(file_path, vol.Schema({vol.Optional("value", default=0): int}))
+
+
+async def test_save_data_skips_unchanged(tmp_path: Path):
+    """Test configuration is not written again without changes."""
+    config = await _TestConfig(tmp_path / "test.json").load_config()
+
+    await config.save_data()
+    await config.save_data()
+    assert read_json_file(tmp_path / "test.json") == {"value": 0}
+
+    config._data["value"] = 1  # pylint: disable=protected-access
+    await config.save_data()
+    assert read_json_file(tmp_path / "test.json") == {"value": 1}
+
+    stats = config_write_stats()[tmp_path / "test.json"]
+    assert stats.writes == 2
+    assert stats.skipped == 1
+    assert stats.bytes_written == 2 * (tmp_path / "test.json").stat().st_size
+
+
+async def test_save_data_delayed(tmp_path: Path):
+    """Test changes are written once after the save delay or on flush."""
+    config = await _TestConfig(tmp_path / "test.json").load_config()
+    config.save_delay = 0.01
+
+    for value in range(5):
+        config._data["value"] = value  # pylint: disable=protected-access
+        await config.save_data()
+    assert not (tmp_path / "test.json").exists()
+
+    await asyncio.sleep(0.05)
+    assert read_json_file(tmp_path / "test.json") == {"value": 4}
+    assert config_write_stats()[tmp_path / "test.json"].writes == 1
+
+    # Pending changes are written on flush, e.g. on shutdown
+    config.save_delay = 60
+    config._data["value"] = 5  # pylint: disable=protected-access
+    await config.save_data()
+    await flush_config_files()
+    assert read_json_file(tmp_path / "test.json") == {"value": 5}
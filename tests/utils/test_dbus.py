@@ -185,6 +185,50 @@ async def test_init_proxy(test_service: TestInterface, dbus_session_bus: Message
     assert callback_count == 0
 
 
+async def test_shared_introspection(
+    test_service: TestInterface, dbus_session_bus: MessageBus
+):
+    """Test objects using the same interfaces share one introspection."""
+    other = TestInterface()
+    other.object_path = "/service/test/other"
+    other.export(dbus_session_bus)
+    paths = [DBUS_OBJECT_BASE, other.object_path]
+
+    with patch.object(
+        MessageBus, "introspect", wraps=dbus_session_bus.introspect
+    ) as introspect:
+        test_objs = await asyncio.gather(
+            *[
+                DBus.connect(
+                    dbus_session_bus,
+                    "service.test.TestInterface",
+                    path,
+                    interfaces=frozenset(["service.test.TestInterface"]),
+                )
+                for path in paths
+            ]
+        )
+        introspect.assert_called_once()
+
+        for test_obj in test_objs:
+            assert test_obj.supports_properties is True
+            assert await test_obj.call_test(True) is None
+
+        # Objects missing the interfaces are introspected each
+        introspect.reset_mock()
+        test_objs = [
+            await DBus.connect(
+                dbus_session_bus,
+                "service.test.TestInterface",
+                path,
+                interfaces=frozenset(["service.test.Missing"]),
+            )
+            for path in paths
+        ]
+        assert introspect.call_count == 2
+        assert "service.test.TestInterface" in test_objs[1].proxies
+
+
 def test_from_dbus_error():
     """Test converting DBus fast errors to Supervisor specific errors."""
     dbus_fast_error = DBusFastDBusError(
@@ -8,8 +8,9 @@ import pytest
 from supervisor.exceptions import MalformedBinaryEntryError
 from supervisor.host.const import LogFormatter
 from supervisor.utils.systemd_journal import (
+    JournalExportParser,
     journal_boots_reader,
-    journal_logs_reader,
+    journal_logs_batch_reader,
     journal_plain_formatter,
     journal_verbose_formatter,
 )
@@ -18,7 +19,7 @@ from tests.common import load_fixture
 
 
 def _journal_logs_mock():
-    """Generate mocked stream for journal_logs_reader.
+    """Generate mocked stream for journal_logs_batch_reader.
 
     Returns tuple for mocking ClientResponse and its StreamReader
     (.content attribute in async context).
@@ -106,7 +107,7 @@ async def test_parsing_simple():
     """Test plain formatter."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(b"MESSAGE=Hello, world!\n\n")
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert line == "Hello, world!"
 
 
@@ -120,8 +121,8 @@ async def test_parsing_verbose():
         b"_PID=666\n"
         b"MESSAGE=Hello, world!\n\n"
     )
-    _, line = await anext(
-        journal_logs_reader(journal_logs, log_formatter=LogFormatter.VERBOSE)
+    (_, line), *_ = await anext(
+        journal_logs_batch_reader(journal_logs, log_formatter=LogFormatter.VERBOSE)
     )
     assert line == "2013-09-17 07:32:51.000 homeassistant python[666]: Hello, world!"
 
@@ -135,7 +136,7 @@ async def test_parsing_newlines_in_message():
         b"AFTER=after\n\n"
     )
 
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert line == "Hello,\nworld!"
 
 
@@ -152,8 +153,10 @@ async def test_parsing_newlines_in_multiple_fields():
         b"AFTER=after\n\n"
     )
 
-    assert await anext(journal_logs_reader(journal_logs)) == (ANY, "Hello,\nworld!\n")
-    assert await anext(journal_logs_reader(journal_logs)) == (ANY, "Hello,\nworld!")
+    assert await anext(journal_logs_batch_reader(journal_logs)) == [
+        (ANY, "Hello,\nworld!\n"),
+        (ANY, "Hello,\nworld!"),
+    ]
 
 
 async def test_parsing_two_messages():
@@ -164,9 +167,8 @@ async def test_parsing_two_messages():
     )
     stream.feed_eof()
 
-    reader = journal_logs_reader(journal_logs)
-    assert await anext(reader) == (ANY, "Hello, world!")
-    assert await anext(reader) == (ANY, "Hello again, world!")
+    reader = journal_logs_batch_reader(journal_logs)
+    assert await anext(reader) == [(ANY, "Hello, world!"), (ANY, "Hello again, world!")]
     with pytest.raises(StopAsyncIteration):
         await anext(reader)
 
@@ -186,10 +188,12 @@ async def test_cursor_parsing():
     )
     stream.feed_eof()
 
-    reader = journal_logs_reader(journal_logs)
-    assert await anext(reader) == ("cursor1", "Hello, world!")
-    assert await anext(reader) == ("cursor2", "Hello again, world!")
-    assert await anext(reader) == (None, "No cursor")
+    reader = journal_logs_batch_reader(journal_logs)
+    assert await anext(reader) == [
+        ("cursor1", "Hello, world!"),
+        ("cursor2", "Hello again, world!"),
+        (None, "No cursor"),
+    ]
     with pytest.raises(StopAsyncIteration):
         await anext(reader)
 
@@ -202,14 +206,14 @@ async def test_parsing_malformed_binary_message():
     )
 
     with pytest.raises(MalformedBinaryEntryError):
-        await anext(journal_logs_reader(journal_logs))
+        await anext(journal_logs_batch_reader(journal_logs))
 
 
 async def test_parsing_journal_host_logs():
     """Test parsing of real host logs."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(load_fixture("logs_export_host.txt").encode("utf-8"))
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert line == "Started Hostname Service."
 
 
@@ -217,7 +221,7 @@ async def test_parsing_colored_supervisor_logs():
     """Test parsing of real logs with ANSI escape sequences."""
     journal_logs, stream = _journal_logs_mock()
     stream.feed_data(load_fixture("logs_export_supervisor.txt").encode("utf-8"))
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert (
         line
         == "\x1b[32m24-03-04 23:56:56 INFO (MainThread) [__main__] Closing Supervisor\x1b[0m"
@@ -298,7 +302,7 @@ async def test_parsing_non_utf8_message():
     journal_logs, stream = _journal_logs_mock()
     # Include invalid UTF-8 sequence (0xff is not valid UTF-8)
     stream.feed_data(b"MESSAGE=Hello, \xff world!\n\n")
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert line == "Hello, \ufffd world!"
 
 
@@ -311,7 +315,7 @@ async def test_parsing_non_utf8_in_binary_message():
         b"MESSAGE\n\x0f\x00\x00\x00\x00\x00\x00\x00Hello, \xff world!\n"
         b"AFTER=after\n\n"
     )
-    _, line = await anext(journal_logs_reader(journal_logs))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs))
     assert line == "Hello, \ufffd world!"
 
 
@@ -347,8 +351,8 @@ async def test_parsing_colored_logs_verbose_no_colors():
         b"MESSAGE\n\x0e\x00\x00\x00\x00\x00\x00\x00\x1b[31mERROR\x1b[0m\n"
         b"AFTER=after\n\n"
     )
-    _, line = await anext(
-        journal_logs_reader(
+    (_, line), *_ = await anext(
+        journal_logs_batch_reader(
             journal_logs, log_formatter=LogFormatter.VERBOSE, no_colors=True
         )
     )
@@ -362,5 +366,81 @@ async def test_parsing_multiple_color_codes():
         b"MESSAGE\n\x29\x00\x00\x00\x00\x00\x00\x00\x1b[31mRed\x1b[0m \x1b[32mGreen\x1b[0m \x1b[34mBlue\x1b[0m\n"
         b"AFTER=after\n\n"
     )
-    _, line = await anext(journal_logs_reader(journal_logs, no_colors=True))
+    (_, line), *_ = await anext(journal_logs_batch_reader(journal_logs, no_colors=True))
     assert line == "Red Green Blue"
+
+
+def test_export_parser_split_fields():
+    """Test export parser with fields split across fed blocks."""
+    data = (
+        b"__CURSOR=cursor1\n"
+        b"MESSAGE\n\x0e\x00\x00\x00\x00\x00\x00\x00Hello,\nworld!\n\n\n"
+        b"ANOTHER\n\x02\x00\x00\x00\x00\x00\x00\x00\n\n\n\n"
+        b"__CURSOR=cursor2\n"
+        b"MESSAGE=Hello again, world!\n"
+        b"ID=2\n\n"
+    )
+    expected = [
+        {"__CURSOR": "cursor1", "MESSAGE": "Hello,\nworld!\n"},
+        {"__CURSOR": "cursor2", "MESSAGE": "Hello again, world!"},
+    ]
+
+    assert JournalExportParser(["__CURSOR", "MESSAGE"]).feed(data) == expected
+
+    parser = JournalExportParser(["__CURSOR", "MESSAGE"])
+    entries = []
+    for index in range(len(data)):
+        entries.extend(parser.feed(data[index : index + 1]))
+    assert entries == expected
+
+
+def test_export_parser_malformed_binary_message():
+    """Test export parser raises for binary field not followed by a newline."""
+    parser = JournalExportParser(["MESSAGE"])
+    with pytest.raises(MalformedBinaryEntryError):
+        parser.feed(
+            b"ID=1\nMESSAGE\n\x0d\x00\x00\x00\x00\x00\x00\x00Hello, world!AFTER=after\n\n"
+        )
+
+
+async def test_batch_reader_host_logs():
+    """Test batch reader returns all entries of a block at once."""
+    journal_logs, stream = _journal_logs_mock()
+    stream.feed_data(load_fixture("logs_export_host.txt").encode("utf-8"))
+    stream.feed_data(load_fixture("logs_export_supervisor.txt").encode("utf-8"))
+    stream.feed_eof()
+    batches = [
+        batch
+        async for batch in journal_logs_batch_reader(
+            journal_logs, log_formatter=LogFormatter.VERBOSE
+        )
+    ]
+    assert batches == [
+        [
+            (
+                ANY,
+                "2024-03-04 02:52:56.193 homeassistant systemd[1]: Started Hostname Service.",
+            ),
+            (
+                ANY,
+                "2024-03-04 22:56:56.709 ha-hloub hassio_supervisor[466]: "
+                "\x1b[32m24-03-04 23:56:56 INFO (MainThread) [__main__] Closing Supervisor\x1b[0m",
+            ),
+        ]
+    ]
+
+
+async def test_batch_reader_follow():
+    """Test batch reader returns entries as soon as they are complete."""
+    journal_logs, stream = _journal_logs_mock()
+    reader = journal_logs_batch_reader(journal_logs, no_colors=True)
+
+    stream.feed_data(b"__CURSOR=cursor1\nMESSAGE=\x1b[32mHello\x1b[0m\n\nMESSAGE=wor")
+    assert await anext(reader) == [("cursor1", "Hello")]
+
+    stream.feed_data(b"ld!\n\n")
+    assert await anext(reader) == [(None, "world!")]
+
+    stream.feed_eof()
+    with pytest.raises(StopAsyncIteration):
+        await anext(reader)